@@ -1,9 +1,9 @@
 from src.config import load_config
-from src.ai_assistant import AIAssistant
+from src.ai_assistant import get_ai_assistant
 import json
 
 config = load_config()
-ai = AIAssistant(config)
+ai = get_ai_assistant(config)
 
 prompt = (
     "You are a highly advanced autonomous AI agent running on a user's PC. "
@@ -5,7 +5,7 @@ Usage: python cli_wrapper.py [action] [args]
 import sys
 import logging
 from src.config import load_config
-from src.resume_parser import ResumeParser
+from src.resume_parser import load_resume
 from src.job_searcher import JobSearcher
 from src.linkedin_manager import LinkedInManager
 from src.auth import Authenticator
@@ -34,8 +34,7 @@ def main():
         if action == "post":
             content = " ".join(sys.argv[2:]) if len(sys.argv) > 2 else None
             if not content:
-                parser = ResumeParser(config.resume.file_path)
-                resume_data = parser.parse()
+                resume_data = load_resume(config.resume.file_path)
                 content = li_manager.generate_professional_post(resume_data['raw_text'])
             
             if content:
@@ -53,8 +52,7 @@ def main():
             company = " ".join(sys.argv[2:]) if len(sys.argv) > 2 else "Tech"
             recruiters = li_manager.search_recruiters(company)
             if recruiters:
-                parser = ResumeParser(config.resume.file_path)
-                resume_data = parser.parse()
+                resume_data = load_resume(config.resume.file_path)
                 for rec in recruiters[:2]:
                     li_manager.send_connection_request(rec, resume_data['raw_text'])
                 print(f"CONNECT_SUCCESS: {len(recruiters[:2])} requests sent")
@@ -1,14 +1,48 @@
 import logging
 import json
-import urllib.request
-import urllib.parse
-from typing import Optional, Dict
+import re
+import threading
+from typing import Iterator, Optional, Dict, List
 from src.config import Settings
+from src.http_client import get_session
+from src.llm_cache import get_llm_cache
+from src.ai_rate_limiter import get_rate_limiter, RateLimitedError
+from src.llm_dispatch import get_dispatcher, current_priority, APPLY, SCORING
+from src.prompt_builder import get_prompt_builder, count_tokens, truncate_tokens
 
 import os
 
 logger = logging.getLogger(__name__)
 
+# Completion tokens reserved in the rate-limit budget when a call sets no max_tokens
+_COMPLETION_RESERVE = 500
+
+_assistant: Optional["AIAssistant"] = None
+_assistant_lock = threading.Lock()
+
+
+def get_ai_assistant(config: Settings) -> "AIAssistant":
+    """Returns the process-wide AI client (one rate limit and cooldown for every caller)."""
+    global _assistant
+    with _assistant_lock:
+        if _assistant is None:
+            _assistant = AIAssistant(config)
+        return _assistant
+
+
+def estimate_tokens(data: dict) -> int:
+    """Prompt + completion token estimate of a chat payload, for the rate-limit budget."""
+    tokens = 0
+    for message in data.get("messages", []):
+        content = message.get("content")
+        if isinstance(content, list):
+            # Vision parts: text is counted, each image as a flat ~800 tokens
+            tokens += sum(count_tokens(part.get("text", "")) if part.get("type") == "text" else 800 for part in content)
+        else:
+            tokens += count_tokens(content or "")
+        tokens += 4
+    return tokens + (data.get("max_tokens") or _COMPLETION_RESERVE)
+
 class AIAssistant:
     def __init__(self, config: Settings):
         self.config = config
@@ -23,41 +57,107 @@ class AIAssistant:
             self.api_key = config.secrets.openai.get("api_key", "")
         
         # Load model from config or default to gpt-4o
-        self.model = getattr(config, "ai", {}).get("model", "gpt-4o") if hasattr(config, "ai") else "gpt-4o"
+        self.model = config.ai.model if getattr(config, "ai", None) else "gpt-4o"
         logger.info(f"🧠 AI Assistant initialized with model: {self.model}")
         
         self.url = "https://api.openai.com/v1/chat/completions"
-        self.last_429_time = 0
-        self.cooldown_seconds = 300 # Wait 5 minutes after a 429
-
-    def _load_persona(self) -> str:
-        if os.path.exists(self.knowledge_path):
-            try:
-                with open(self.knowledge_path, "r", encoding="utf-8") as f:
-                    return f.read()
-            except: pass
-        return ""
-
-    def ask_gpt(self, system_prompt: str, user_prompt: str, incorporate_persona: bool = False) -> Optional[str]:
-        """Sends a request to OpenAI Chat Completion API with cooldown handling."""
-        if not self.api_key:
-            return None
+        # Shared by every instance, so a 429 seen by one caller pauses all of them
+        self.limiter = get_rate_limiter(config)
+        self.dispatcher = get_dispatcher(config)
+        self.prompts = get_prompt_builder(config)
 
-        # Check for cooldown
-        import time
-        if time.time() - self.last_429_time < self.cooldown_seconds:
-            logger.warning("AI features are on cooldown due to rate limits. Skipping request.")
-            return None
+    def _load_persona(self, query: str = "") -> str:
+        """Persona sections relevant to query, within ai.prompt.persona_tokens (file re-read only when it changes)."""
+        return self.prompts.persona_context(self.knowledge_path, query)
 
-        headers = {
+    def _post(self, url: str, data: dict, timeout, tokens: int = 0, priority: Optional[str] = None) -> dict:
+        """
+        POSTs to the OpenAI API through the priority dispatch queue and the shared rate limiter.
+        priority defaults to the calling thread's llm_priority() class. Raises RateLimitedError
+        when no budget frees up within ai.rate_limit.max_wait_seconds (or during a cooldown) and
+        RequestShedError when a low-priority call is dropped; 429s start the shared cooldown
+        before the HTTPError propagates.
+        """
+        with self.dispatcher.slot(priority or current_priority()):
+            if not self.limiter.acquire(tokens):
+                raise RateLimitedError(f"AI rate limit budget exhausted (cooldown {self.limiter.cooling_down():.0f}s).")
+            # No status retries: each 429 must reach _check_response and start the shared cooldown
+            response = get_session(status_retries=False).post(url, json=data, headers=self._headers(), timeout=timeout)
+        self._check_response(response)
+        result = response.json()
+        usage = result.get("usage") or {}
+        if tokens:
+            self.limiter.reconcile(tokens, usage.get("total_tokens"))
+        return result
+
+    def _headers(self) -> dict:
+        return {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
 
+    def _check_response(self, response):
+        """Feeds rate-limit headers to the shared limiter and raises for HTTP errors (starting the cooldown on 429)."""
+        self.limiter.update_from_headers(response.headers)
+        if response.status_code == 429:
+            quota_exhausted = "insufficient_quota" in response.text
+            delay = self.limiter.on_rate_limited(response.headers, quota_exhausted=quota_exhausted)
+            logger.error(f"OpenAI API Quota/Rate Limit reached (429). Cooling down all AI callers for {delay:.0f}s.")
+        response.raise_for_status()
+
+    def _stream(self, data: dict, timeout, tokens: int, priority: Optional[str] = None) -> Iterator[str]:
+        """
+        Streams a chat completion (server-sent events) and yields content deltas as they arrive.
+        Holds the dispatch slot until the stream ends; errors are raised like _post.
+        """
+        data = dict(data, stream=True, stream_options={"include_usage": True})
+        with self.dispatcher.slot(priority or current_priority()):
+            if not self.limiter.acquire(tokens):
+                raise RateLimitedError(f"AI rate limit budget exhausted (cooldown {self.limiter.cooling_down():.0f}s).")
+            with get_session(status_retries=False).post(self.url, json=data, headers=self._headers(), timeout=timeout, stream=True) as response:
+                self._check_response(response)
+                response.encoding = "utf-8"
+                usage = {}
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == "[DONE]":
+                        break
+                    chunk = json.loads(payload)
+                    usage = chunk.get("usage") or usage
+                    for choice in chunk.get("choices") or []:
+                        delta = (choice.get("delta") or {}).get("content")
+                        if delta:
+                            yield delta
+        self.limiter.reconcile(tokens, usage.get("total_tokens"))
+
+    def complete(self, messages: list, model: Optional[str] = None, timeout=(5, 60), priority: Optional[str] = None, **options) -> str:
+        """
+        Raw chat completion through the shared rate limiter for callers that build their own
+        messages (vision frames, other models). Raises on API errors and RateLimitedError.
+        """
+        data = {"model": model or self.model, "messages": messages, **options}
+        result = self._post(self.url, data, timeout=timeout, tokens=estimate_tokens(data), priority=priority)
+        return result["choices"][0]["message"]["content"]
+
+    def ask_gpt(self, system_prompt: str, user_prompt: str, incorporate_persona: bool = False, cache_site: Optional[str] = None, json_mode: bool = False, priority: Optional[str] = None, max_prompt_tokens: Optional[int] = None) -> Optional[str]:
+        """
+        Sends a request to OpenAI Chat Completion API with cooldown handling.
+        cache_site names the caller (e.g. "form_answer"); responses are served from and stored in
+        the persistent LLM cache when that site has a TTL configured under ai.cache.ttl_seconds.
+        json_mode asks the API for a JSON object response (the prompt must mention JSON).
+        priority is the dispatch class (src.llm_dispatch); defaults to the thread's llm_priority().
+        The user prompt is trimmed to max_prompt_tokens (default ai.prompt.max_prompt_tokens).
+        """
+        if not self.api_key:
+            return None
+
         if incorporate_persona:
-            persona_text = self._load_persona()
+            persona_text = self._load_persona(user_prompt)
             if persona_text:
                 system_prompt += f"\n\n[USER PERSONA & KNOWLEDGE]\nAct as if you are the user described below, or align your decisions with their preferences:\n{persona_text}"
+        user_prompt = self.prompts.fit(system_prompt, user_prompt, max_prompt_tokens)
 
         data = {
             "model": self.model,
@@ -67,62 +167,85 @@ class AIAssistant:
             ],
             "temperature": 0.3 
         }
+        if json_mode:
+            data["response_format"] = {"type": "json_object"}
+
+        cache, cache_key, ttl = None, None, 0
+        if cache_site:
+            cache = get_llm_cache(self.config)
+            ttl = self.config.ai.cache.ttl_seconds.get(cache_site, 0)
+            if cache and ttl > 0:
+                cache_key = cache.make_key(self.model, system_prompt, user_prompt, data["temperature"])
+                cached = cache.get(cache_key, cache_site)
+                if cached is not None:
+                    logger.debug(f"LLM cache hit ({cache_site}).")
+                    return cached
 
         try:
-            req = urllib.request.Request(self.url, data=json.dumps(data).encode("utf-8"), headers=headers)
-            with urllib.request.urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                return result["choices"][0]["message"]["content"].strip()
+            result = self._post(self.url, data, timeout=(5, 30), tokens=estimate_tokens(data), priority=priority)
+            content = result["choices"][0]["message"]["content"].strip()
+            if cache_key and content:
+                cache.put(cache_key, cache_site, content, ttl)
+            return content
+        except RateLimitedError as e:
+            logger.warning(f"AI features are on cooldown due to rate limits. Skipping request. ({e})")
+            return None
         except Exception as e:
-            if "429" in str(e):
-                logger.error(f"OpenAI API Quota/Rate Limit reached (429). Cooling down for {self.cooldown_seconds/60} minutes.")
-                self.last_429_time = time.time()
-            elif "timed out" in str(e).lower():
+            if "timed out" in str(e).lower():
                 logger.error("OpenAI API request timed out.")
-            else:
+            elif "429" not in str(e): # 429s are logged by _post when the shared cooldown starts
                 logger.error(f"Error calling OpenAI API: {e}")
             return None
 
-    def ask_gpt_with_history(self, system_prompt: str, history: list, incorporate_persona: bool = False) -> Optional[str]:
+    def ask_gpt_with_history(self, system_prompt: str, history: list, incorporate_persona: bool = False, priority: Optional[str] = None) -> Optional[str]:
         """Sends a request to OpenAI using a list of messages for context."""
         if not self.api_key: return None
-        
-        # Cooldown check
-        import time
-        if time.time() - self.last_429_time < self.cooldown_seconds:
-            return None
 
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
+        data = {
+            "model": self.model,
+            "messages": self._chat_messages(system_prompt, history, incorporate_persona),
+            "temperature": 0.5 
         }
 
-        messages = [{"role": "system", "content": system_prompt}]
-        
+        try:
+            result = self._post(self.url, data, timeout=(5, 40), tokens=estimate_tokens(data), priority=priority)
+            return result["choices"][0]["message"]["content"].strip()
+        except RateLimitedError as e:
+            logger.warning(f"Smart chat skipped: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error in smart chat: {e}")
+            return None
+
+    def _chat_messages(self, system_prompt: str, history: list, incorporate_persona: bool) -> list:
+        """System prompt (plus persona) followed by the history, each message sent exactly once."""
         if incorporate_persona:
-            persona_text = self._load_persona()
+            last_user = next((m.get("content") or "" for m in reversed(history) if m.get("role") == "user"), "")
+            persona_text = self._load_persona(last_user)
             if persona_text:
-                messages[0]["content"] += f"\n\n[USER PERSONA & KNOWLEDGE]\n{persona_text}"
-
-        # Append history (ensure it's formatted correctly)
-        messages.extend(history)
+                system_prompt += f"\n\n[USER PERSONA & KNOWLEDGE]\n{persona_text}"
+        return [{"role": "system", "content": system_prompt}] + list(history)
 
-        messages.extend(history)
+    def stream_gpt_with_history(self, system_prompt: str, history: list, incorporate_persona: bool = False, priority: Optional[str] = None) -> Iterator[str]:
+        """
+        Streaming variant of ask_gpt_with_history: yields the reply as text deltas while the
+        model generates it. Yields nothing when the call is skipped or fails before the first token.
+        """
+        if not self.api_key:
+            return
 
         data = {
             "model": self.model,
-            "messages": messages,
-            "temperature": 0.5 
+            "messages": self._chat_messages(system_prompt, history, incorporate_persona),
+            "temperature": 0.5
         }
 
         try:
-            req = urllib.request.Request(self.url, data=json.dumps(data).encode("utf-8"), headers=headers)
-            with urllib.request.urlopen(req, timeout=40) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                return result["choices"][0]["message"]["content"].strip()
+            yield from self._stream(data, timeout=(5, 40), tokens=estimate_tokens(data), priority=priority)
+        except RateLimitedError as e:
+            logger.warning(f"Smart chat skipped: {e}")
         except Exception as e:
-            logger.error(f"Error in smart chat: {e}")
-            return None
+            logger.error(f"Error in streamed smart chat: {e}")
     def get_answer_for_question(self, question_text: str, resume_context: str) -> Optional[str]:
         """Generates an answer for a specific form question based on the resume."""
         system_prompt = (
@@ -133,19 +256,16 @@ class AIAssistant:
             "Language must match the question (Portuguese or English)."
         )
         
+        # Only the resume sections relevant to the question, within ai.prompt.resume_tokens
+        resume_context = self.prompts.resume_context(resume_context, question_text)
         user_prompt = f"Resume Context: {resume_context}\n\nQuestion: {question_text}\n\nAnswer:"
         
         logger.info(f"Asking GPT for answer to: {question_text[:50]}...")
-        return self.ask_gpt(system_prompt, user_prompt)
+        return self.ask_gpt(system_prompt, user_prompt, cache_site="form_answer", priority=APPLY)
 
     def ask_gpt_vision(self, prompt: str, base64_image: str) -> Optional[str]:
         """Sends an image to GPT-4o for analysis."""
         if not self.api_key: return None
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
 
         data = {
             "model": "gpt-4o",
@@ -167,10 +287,8 @@ class AIAssistant:
         }
 
         try:
-            req = urllib.request.Request(self.url, data=json.dumps(data).encode("utf-8"), headers=headers)
-            with urllib.request.urlopen(req, timeout=60) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                return result["choices"][0]["message"]["content"].strip()
+            result = self._post(self.url, data, timeout=(5, 60), tokens=estimate_tokens(data))
+            return result["choices"][0]["message"]["content"].strip()
         except Exception as e:
             logger.error(f"Error in Vision API: {e}")
             return f"❌ Vision Error: {e}"
@@ -185,15 +303,13 @@ class AIAssistant:
             # Content-Type is multipart/form-data, requests lib handles this better than urllib
         }
         
-        # Using requests here because multipart upload with urllib is painful
         try:
-            import requests
             with open(audio_path, "rb") as f:
                 files = {
                     "file": (os.path.basename(audio_path), f, "audio/mpeg"),
                     "model": (None, "whisper-1")
                 }
-                response = requests.post(url, headers=headers, files=files)
+                response = get_session().post(url, headers=headers, files=files, timeout=(5, 120))
                 result = response.json()
                 return result.get("text", f"❌ Error: {result}")
         except Exception as e:
@@ -207,25 +323,82 @@ class AIAssistant:
             "Return ONLY a whole number from 0 to 100 representing the compatibility score."
         )
         
+        job_description = truncate_tokens(job_description, self.config.ai.prompt.job_description_tokens)
+        resume_context = self.prompts.resume_context(resume_context, job_description)
         user_prompt = f"Resume: {resume_context}\n\nJob Description: {job_description}\n\nScore:"
         
-        result = self.ask_gpt(system_prompt, user_prompt)
+        result = self.ask_gpt(system_prompt, user_prompt, cache_site="compatibility", priority=SCORING)
         try:
             return int(result) if result and result.isdigit() else 50
         except Exception as e:
             logger.warning(f"Failed to parse compatibility score: {e}")
             return 50
 
+    def evaluate_compatibility_batch(self, job_descriptions: List[str], resume_context: str) -> List[int]:
+        """
+        Scores many job descriptions against one resume (0-100 each).
+        The resume is sent once per chunk instead of once per job; chunks are sized by
+        ai.batch_token_budget. Jobs the model doesn't score come back as 50.
+        """
+        if not job_descriptions:
+            return []
+
+        budget = self.config.ai.batch_token_budget
+        max_chars = self.config.ai.batch_description_chars
+        descriptions = [" ".join((jd or "").split())[:max_chars] for jd in job_descriptions]
+
+        # One compacted resume for the whole batch, weighted towards what these jobs ask for
+        resume_context = self.prompts.resume_context(resume_context, " ".join(descriptions))
+        base_tokens = count_tokens(resume_context) + 150
+        chunks, current, current_tokens = [], [], base_tokens
+        for index, jd in enumerate(descriptions):
+            jd_tokens = count_tokens(jd) + 10
+            if current and current_tokens + jd_tokens > budget:
+                chunks.append(current)
+                current, current_tokens = [], base_tokens
+            current.append(index)
+            current_tokens += jd_tokens
+        if current:
+            chunks.append(current)
+
+        scores = [50] * len(descriptions)
+        for chunk in chunks:
+            for index, score in self._score_chunk([descriptions[i] for i in chunk], resume_context).items():
+                scores[chunk[index]] = score
+        return scores
+
+    def _score_chunk(self, descriptions: List[str], resume_context: str) -> Dict[int, int]:
+        system_prompt = (
+            "You are an expert HR recruiter. Compare each numbered Job Description with the Resume. "
+            "Respond with a JSON object of the form {\"scores\": [{\"id\": <job id>, \"score\": <0-100>}]} "
+            "containing one whole-number compatibility score for every job."
+        )
+        jobs_text = "\n\n".join(f"[Job {i}]\n{jd}" for i, jd in enumerate(descriptions))
+        user_prompt = f"Resume: {resume_context}\n\nJob Descriptions:\n{jobs_text}"
+
+        result = self.ask_gpt(system_prompt, user_prompt, cache_site="compatibility", json_mode=True, priority=SCORING,
+                              max_prompt_tokens=self.config.ai.batch_token_budget)
+        if not result:
+            return {}
+        try:
+            payload = json.loads(re.sub(r"^```(?:json)?|```$", "", result.strip()).strip())
+            entries = payload.get("scores", []) if isinstance(payload, dict) else payload
+            scores = {}
+            for entry in entries:
+                index, score = int(entry["id"]), int(float(entry["score"]))
+                if 0 <= index < len(descriptions):
+                    scores[index] = max(0, min(score, 100))
+            return scores
+        except Exception as e:
+            logger.warning(f"Failed to parse batch compatibility scores: {e}")
+            return {}
+
     def generate_image(self, prompt: str) -> Optional[str]:
         """Generates an image using OpenAI's DALL-E 3 and returns the URL."""
         if not self.api_key:
             return None
 
         url = "https://api.openai.com/v1/images/generations"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
 
         data = {
             "model": "dall-e-3",
@@ -236,10 +409,7 @@ class AIAssistant:
 
         try:
             logger.info(f"Generating image with DALL-E 3... Prompt: {prompt[:50]}...")
-            req = urllib.request.Request(url, data=json.dumps(data).encode("utf-8"), headers=headers)
-            with urllib.request.urlopen(req, timeout=60) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                return result["data"][0]["url"]
+            return self._post(url, data, timeout=(5, 60))["data"][0]["url"]
         except Exception as e:
             logger.error(f"Error generating image with DALL-E: {e}")
             return None
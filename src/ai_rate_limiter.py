@@ -0,0 +1,161 @@
+import re
+import time
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+_limiter: Optional["RateLimiter"] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(config) -> "RateLimiter":
+    """Returns the process-wide OpenAI rate limiter."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(config.ai.rate_limit)
+        return _limiter
+
+
+class RateLimitedError(Exception):
+    """Raised instead of sending a request while the API is cooling down or the budget is exhausted."""
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parses OpenAI reset durations ("20ms", "1s", "6m0s", "1h2m3.5s") or plain seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    seconds = parse_duration(value)
+    if seconds is not None:
+        return max(seconds, 0.0)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter shared by every AIAssistant call in the process.
+
+    Two buckets refill continuously: requests/min and tokens/min (ai.rate_limit).
+    acquire() reserves one request plus the estimated tokens, waiting up to
+    max_wait_seconds for capacity; reconcile() corrects the token bucket with the
+    usage the API reported. x-ratelimit-* response headers clamp the buckets to what
+    the server says is left, and a 429 puts every caller on the same cooldown
+    (Retry-After when given, cooldown_seconds otherwise).
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._lock = threading.Condition()
+        self._requests = float(settings.requests_per_minute)
+        self._tokens = float(settings.tokens_per_minute)
+        self._updated = time.monotonic()
+        self.cooldown_until = 0.0 # monotonic
+
+    # ---- buckets -------------------------------------------------------
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        rpm, tpm = self.settings.requests_per_minute, self.settings.tokens_per_minute
+        self._requests = min(float(rpm), self._requests + elapsed * rpm / 60)
+        self._tokens = min(float(tpm), self._tokens + elapsed * tpm / 60)
+
+    def _wait_needed(self, tokens: int, now: float) -> float:
+        """Seconds until one request with this many tokens fits (0 when it fits now)."""
+        rpm, tpm = self.settings.requests_per_minute, self.settings.tokens_per_minute
+        # A single call larger than the whole bucket only has to wait for a full bucket
+        tokens = min(tokens, tpm)
+        waits = [self.cooldown_until - now]
+        if self._requests < 1:
+            waits.append((1 - self._requests) * 60 / rpm)
+        if self._tokens < tokens:
+            waits.append((tokens - self._tokens) * 60 / tpm)
+        return max(max(waits), 0.0)
+
+    def cooling_down(self) -> float:
+        """Seconds left on the shared 429 cooldown (0 when none)."""
+        with self._lock:
+            return max(self.cooldown_until - time.monotonic(), 0.0)
+
+    def acquire(self, tokens: int, max_wait: Optional[float] = None) -> bool:
+        """Reserves one request and the estimated tokens; False when that would take longer than max_wait."""
+        max_wait = self.settings.max_wait_seconds if max_wait is None else max_wait
+        deadline = time.monotonic() + max_wait
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_needed(tokens, now)
+                if wait <= 0:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return True
+                if now + wait > deadline:
+                    return False
+                self._lock.wait(wait)
+
+    def reconcile(self, estimated: int, actual: Optional[int]):
+        """Adjusts the token bucket once the real usage of a request is known."""
+        if actual is None:
+            return
+        with self._lock:
+            self._tokens -= actual - estimated
+            self._lock.notify_all()
+
+    # ---- server feedback -----------------------------------------------
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """Clamps the buckets to the x-ratelimit-remaining-* values the API reported."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            for kind in ("requests", "tokens"):
+                remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+                if remaining is None:
+                    continue
+                try:
+                    remaining = float(remaining)
+                except ValueError:
+                    continue
+                if kind == "requests":
+                    self._requests = min(self._requests, remaining)
+                else:
+                    self._tokens = min(self._tokens, remaining)
+                if remaining <= 0:
+                    reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+                    if reset:
+                        self.cooldown_until = max(self.cooldown_until, now + reset)
+
+    def on_rate_limited(self, headers: Mapping[str, str], quota_exhausted: bool = False) -> float:
+        """Starts the shared cooldown after a 429 and returns its length in seconds."""
+        # An exhausted billing quota won't clear at the next window reset
+        delay = float(self.settings.cooldown_seconds) if quota_exhausted else parse_retry_after(headers.get("retry-after"))
+        if delay is None:
+            resets = [parse_duration(headers.get(f"x-ratelimit-reset-{kind}")) for kind in ("requests", "tokens")]
+            resets = [r for r in resets if r]
+            delay = max(resets) if resets else float(self.settings.cooldown_seconds)
+        with self._lock:
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + delay)
+        return delay
@@ -0,0 +1,125 @@
+import os
+import re
+import difflib
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from src.keyword_matcher import normalize_text
+
+logger = logging.getLogger(__name__)
+
+_indexes: Dict[str, "AnswerIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_answer_index(path: str = "config/answers.yaml") -> "AnswerIndex":
+    """Returns the process-wide index for an answers file."""
+    with _indexes_lock:
+        if path not in _indexes:
+            _indexes[path] = AnswerIndex(path)
+        return _indexes[path]
+
+
+def _tokens(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", normalize_text(text))
+
+
+class AnswerIndex:
+    """
+    Inverted index over the knowledge base in config/answers.yaml.
+
+    Every keyword is stored under its first (accent-folded) token, so a lookup walks
+    the question's tokens once instead of scanning every question x keyword. Tokens
+    with no exact entry fall back to a fuzzy match against the indexed vocabulary:
+    difflib for plurals and small typos ("experiencias" -> "experiencia"), and a
+    shared 6+ letter stem with short endings for inflections ("salario" ->
+    "salarial"). Related words with other meanings ("motivo"/"motivado",
+    "state"/"start") are not matched. As before, when
+    several entries match, the one listed first in the file wins.
+    The file is parsed once and re-read only when its mtime changes.
+    """
+
+    def __init__(self, path: str, fuzzy_cutoff: float = 0.85):
+        self.path = path
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self._mtime: Optional[float] = None
+        self._answers: List[str] = []
+        self._index: Dict[str, List[Tuple[int, Tuple[str, ...]]]] = {}
+        self._fuzzy_memo: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def _reload_if_changed(self):
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            mtime = None
+        if mtime == self._mtime:
+            return
+
+        answers, index = [], {}
+        if mtime is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    knowledge_base = yaml.safe_load(f) or {}
+                for item in knowledge_base.get("questions", []) or []:
+                    if item.get("answer") is None:
+                        continue
+                    position = len(answers)
+                    answers.append(str(item["answer"]))
+                    for kw in item.get("keywords", []) or []:
+                        kw_tokens = tuple(_tokens(str(kw)))
+                        if kw_tokens:
+                            index.setdefault(kw_tokens[0], []).append((position, kw_tokens))
+            except Exception as e:
+                logger.error(f"Error loading {self.path}: {e}")
+                return
+
+        self._answers, self._index, self._mtime = answers, index, mtime
+        self._fuzzy_memo.clear()
+        logger.info(f"Answer index loaded: {len(answers)} answers, {len(index)} keyword heads.")
+
+    def _resolve(self, token: str) -> Optional[str]:
+        """Maps a question token to an indexed keyword head (exact, then fuzzy)."""
+        if token in self._index:
+            return token
+        if len(token) < 4:
+            return None
+        if token not in self._fuzzy_memo:
+            self._fuzzy_memo[token] = self._fuzzy(token)
+        return self._fuzzy_memo[token]
+
+    def _fuzzy(self, token: str) -> Optional[str]:
+        # Typos and plurals: close spelling and at most one letter longer or shorter
+        close = difflib.get_close_matches(token, self._index.keys(), n=3, cutoff=self.fuzzy_cutoff)
+        for head in close:
+            if abs(len(head) - len(token)) <= 1:
+                return head
+        # Inflections: the same stem of 6+ letters, differing only in an ending of up to 2
+        for head in self._index:
+            stem = os.path.commonprefix([token, head])
+            if len(stem) >= 6 and len(token) - len(stem) <= 2 and len(head) - len(stem) <= 2:
+                return head
+        return None
+
+    def lookup(self, text: str) -> Optional[str]:
+        """Returns the configured answer for a form question, or None."""
+        with self._lock:
+            self._reload_if_changed()
+            if not self._index:
+                return None
+
+            tokens = _tokens(text)
+            best = None
+            for i, token in enumerate(tokens):
+                head = self._resolve(token)
+                if head is None:
+                    continue
+                for position, kw_tokens in self._index[head]:
+                    if best is not None and position >= best:
+                        continue
+                    if tuple(tokens[i + 1:i + len(kw_tokens)]) == kw_tokens[1:]:
+                        best = position
+            return self._answers[best] if best is not None else None
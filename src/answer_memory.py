@@ -0,0 +1,166 @@
+import os
+import re
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import yaml
+
+from src.keyword_matcher import normalize_text
+from src.answer_index import get_answer_index
+
+logger = logging.getLogger(__name__)
+
+_memory: Optional["AnswerMemory"] = None
+_memory_lock = threading.Lock()
+
+
+def get_answer_memory(config) -> Optional["AnswerMemory"]:
+    """Returns the process-wide learned answer store, or None when disabled in settings."""
+    global _memory
+    settings = config.learned_answers
+    if not settings.enabled:
+        return None
+    with _memory_lock:
+        if _memory is None:
+            _memory = AnswerMemory(settings.path, settings.promote_after)
+        return _memory
+
+
+def _normalize(text: str) -> str:
+    return " ".join(re.findall(r"[a-z0-9]+", normalize_text(text)))
+
+
+class AnswerMemory:
+    """
+    JSON store of form answers the AI produced, keyed by normalized question text
+    (plus the option set for selects), so each unique question costs one AI call.
+
+    Every entry counts the applications it was used in that were submitted vs. that
+    ended in a partial/errored flow. Free-text answers that reach promote_after
+    submissions without a failure are written to the top of config/answers.yaml,
+    keyed on the normalized question, so the answer index serves them ahead of the
+    broad hand-written keywords.
+    """
+
+    def __init__(self, path: str = "data/learned_answers.json", promote_after: int = 3):
+        self.path = path
+        self.promote_after = promote_after
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+                logger.info(f"Loaded {len(self.entries)} learned answers from {path}")
+            except Exception as e:
+                logger.error(f"Error loading learned answers: {e}")
+
+    @staticmethod
+    def make_key(question: str, options: Optional[Iterable[str]] = None) -> str:
+        key = _normalize(question)
+        if options:
+            key += " | " + " ; ".join(sorted({_normalize(o) for o in options if _normalize(o)}))
+        return key
+
+    def get(self, question: str, options: Optional[Iterable[str]] = None) -> Optional[str]:
+        """The learned answer, or None when there is none or it has led to failed applications."""
+        key = self.make_key(question, options)
+        with self._lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return None
+            # Unproven answers are dropped after one failure, promoted ones once failures dominate;
+            # the caller asks the AI again and record() resets the counters if the answer changes
+            if entry["failed"] > entry["submitted"] or (entry["failed"] and not entry["promoted"]):
+                return None
+            entry["uses"] += 1
+            entry["last_used"] = datetime.now().isoformat(timespec="seconds")
+            return entry["answer"]
+
+    def record(self, question: str, answer: str, options: Optional[List[str]] = None, source: str = "ai") -> str:
+        """Stores an answer (keeping the counters of an existing entry) and returns its key."""
+        key = self.make_key(question, options)
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            entry = self.entries.setdefault(key, {
+                "question": " ".join(question.split()),
+                "options": list(options) if options else None,
+                "source": source,
+                "uses": 0,
+                "submitted": 0,
+                "failed": 0,
+                "promoted": False,
+                "created": now,
+            })
+            if entry.get("answer") != answer:
+                entry.update(answer=answer, submitted=0, failed=0)
+            entry["uses"] += 1
+            entry["last_used"] = now
+            self._save()
+        return key
+
+    def record_outcome(self, keys: Iterable[str], status: str, answers_path: str = "config/answers.yaml"):
+        """Credits (or blames) the answers used in one application and promotes proven ones."""
+        submitted = status == "APPLIED_AUTO"
+        with self._lock:
+            for key in set(keys):
+                entry = self.entries.get(key)
+                if not entry:
+                    continue
+                entry["submitted" if submitted else "failed"] += 1
+            promoted = self._promote(answers_path) if submitted else 0
+            self._save()
+        if promoted:
+            logger.info(f"Promoted {promoted} learned answers into {answers_path}")
+
+    def _promote(self, answers_path: str) -> int:
+        if self.promote_after <= 0:
+            return 0
+        ready = [
+            e for e in self.entries.values()
+            if not e["promoted"] and not e["options"] and e["failed"] == 0 and e["submitted"] >= self.promote_after
+        ]
+        # Entries go above the generic keywords, so they also win where one of those
+        # hijacks the question; only an identical hit makes promotion redundant
+        index = get_answer_index(answers_path)
+        for entry in [e for e in ready if index.lookup(e["question"]) == e["answer"]]:
+            entry["promoted"] = True
+            ready.remove(entry)
+        if not ready:
+            return 0
+        block = yaml.safe_dump(
+            [{"keywords": [_normalize(e["question"])], "answer": e["answer"]} for e in ready],
+            allow_unicode=True, sort_keys=False, width=1000, default_flow_style=None
+        )
+        try:
+            with open(answers_path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines(keepends=True)
+            # Inserted as text right under "questions:" so the hand-written comments survive
+            # and these exact questions win over the generic keywords listed below them
+            at = next(i for i, line in enumerate(lines) if re.match(r"questions:\s*$", line)) + 1
+            lines[at:at] = ["  # Learned from AI answers used in submitted applications\n"] + [
+                f"  {line}\n" for line in block.splitlines()
+            ] + ["\n"]
+            tmp_path = answers_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            os.replace(tmp_path, answers_path)
+        except Exception as e:
+            logger.error(f"Could not promote learned answers: {e}")
+            return 0
+        for entry in ready:
+            entry["promoted"] = True
+        return len(ready)
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving learned answers: {e}")
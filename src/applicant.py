@@ -1,24 +1,100 @@
+import asyncio
 import logging
 import time
 import random
-import unicodedata
-from pathlib import Path
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, List, Optional
 from playwright.sync_api import Page
 from src.config import Settings
 from src.storage import Storage
 from src.behavior import HumanBehavior
-from src.ai_assistant import AIAssistant
-from src.resume_parser import ResumeParser
+from src.ai_assistant import get_ai_assistant
+from src.resume_parser import load_resume
+from src.local_scorer import LocalScorer, BORDERLINE
+from src.answer_index import get_answer_index
+from src.answer_memory import get_answer_memory
+from src.network_filter import get_network_filter
+from src.pacing import get_pacer
+from src.browser_engine import get_engine, unwrap
+from src.keyword_matcher import get_matcher, normalize_text  # noqa: F401 (normalize_text kept importable from here)
 
 logger = logging.getLogger(__name__)
 
-def normalize_text(text: str) -> str:
-    """Removes accents and converts to lowercase."""
-    if not text:
-        return ""
-    # Normalize to NFD (decomposed) and filter out non-spacing marks (accents)
-    nfkd_form = unicodedata.normalize('NFKD', str(text))
-    return "".join([c for c in nfkd_form if not unicodedata.combining(c)]).lower()
+MIN_COMPATIBILITY_SCORE = 20
+# Common job description containers (LinkedIn, Indeed)
+JOB_DESCRIPTION_SELECTOR = ".jobs-description__content, #jobDescriptionText, .jobsearch-JobComponent-description"
+
+# Snapshot of every visible field in the Easy Apply dialog in one round-trip. Each field
+# (or radio option) is tagged with data-nx-field so answers can be applied by selector.
+_FORM_SNAPSHOT_JS = """
+() => {
+    const root = document.querySelector("div[role='dialog']") || document.body;
+    root.querySelectorAll('[data-nx-field]').forEach(el => el.removeAttribute('data-nx-field'));
+    const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+        && getComputedStyle(el).visibility !== 'hidden';
+    const labelOf = el => el.id ? root.querySelector(`label[for="${CSS.escape(el.id)}"]`) : null;
+    const required = el => el.required || el.getAttribute('aria-required') === 'true';
+    let next = 0;
+    const tag = el => { const id = String(next++); el.setAttribute('data-nx-field', id); return id; };
+
+    const fields = [];
+    for (const el of root.querySelectorAll("input[type='text'], input:not([type]), textarea, select")) {
+        if (el.disabled || !visible(el)) continue;
+        const label = labelOf(el);
+        const kind = el.tagName === 'SELECT' ? 'select' : 'text';
+        let text = label && visible(label) ? label.innerText : '';
+        if (!text && kind === 'select' && el.parentElement) text = el.parentElement.innerText;
+        fields.push({
+            field: tag(el),
+            kind,
+            label: (text || el.name || '').trim(),
+            value: el.value || '',
+            required: required(el),
+            options: kind === 'select' ? Array.from(el.options).map(o => ({value: o.value, text: o.text.trim()})) : [],
+        });
+    }
+
+    const groups = {};
+    for (const el of root.querySelectorAll("input[type='radio']")) {
+        const label = labelOf(el) || el.closest('label');
+        if (el.disabled || !(visible(el) || (label && visible(label)))) continue;
+        const key = el.name || el.id;
+        if (!groups[key]) {
+            const fieldset = el.closest('fieldset');
+            const legend = fieldset && fieldset.querySelector('legend');
+            const container = fieldset || (el.parentElement && el.parentElement.parentElement) || el;
+            groups[key] = {field: null, kind: 'radio', label: ((legend || container).innerText || '').trim(),
+                           value: '', required: required(el), options: []};
+            fields.push(groups[key]);
+        }
+        const text = label ? label.innerText.trim() : el.value;
+        groups[key].options.push({value: tag(el), text});
+        if (el.checked) groups[key].value = text;
+    }
+    return fields;
+}
+"""
+
+# Applies select/radio choices from a snapshot in one round-trip ([{field, value}]).
+_APPLY_CHOICES_JS = """
+(choices) => {
+    let applied = 0;
+    for (const choice of choices) {
+        const el = document.querySelector(`[data-nx-field="${choice.field}"]`);
+        if (!el) continue;
+        if (el.tagName === 'SELECT') {
+            el.value = choice.value;
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        } else {
+            el.click();
+        }
+        applied++;
+    }
+    return applied;
+}
+"""
 
 class Applicant:
     def __init__(self, page: Page, config: Settings, storage: Storage):
@@ -26,6 +102,144 @@ class Applicant:
         self.config = config
         self.storage = storage
         self.behavior = HumanBehavior(page, config)
+        self.worker_pages: List[Page] = [page]
+        self._prepared: Dict[str, Page] = {} # link -> worker page already showing that job
+        self._answer_keys: List[str] = [] # learned answers used in the current application
+
+    def open_worker_pages(self, count: int) -> List[Page]:
+        """Opens extra tabs in the same browser context for parallel job evaluation."""
+        network = get_network_filter(self.config)
+        while len(self.worker_pages) < max(count, 1):
+            page = self.page.context.new_page()
+            network.add_page(page)
+            self.worker_pages.append(page)
+        return self.worker_pages[:max(count, 1)]
+
+    def prescore_jobs(self, jobs: List[dict]) -> List[Future]:
+        """
+        Scores the whole search result list from its card data (title, company, location)
+        before any job page is opened. Jobs below MIN_COMPATIBILITY_SCORE are never navigated to.
+        The first scoring.prescore_chunk jobs are scored now; the other chunks are queued as
+        pacing idle work, so they are scored while the apply loop waits for its next slot.
+        Returns the futures of the queued chunks (cancel them when the cycle stops early).
+        """
+        pending = [job for job in jobs if not self.storage.is_already_applied(job.get("link", ""), job.get("job_id"))]
+        size = self.config.scoring.prescore_chunk
+        chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+        if not chunks:
+            return []
+        started = time.monotonic()
+        self._prescore_chunk(chunks[0])
+        # The first chunk's run time is the estimate for the rest until they have run themselves
+        elapsed = time.monotonic() - started
+        pacer = get_pacer(self.config)
+        return [pacer.submit_idle(self._prescore_chunk, chunk, estimate=elapsed) for chunk in chunks[1:]]
+
+    def _prescore_chunk(self, jobs: List[dict]):
+        # prepare_jobs may have reached a job first and scored its full description
+        jobs = [job for job in jobs if "compatibility_score" not in job]
+        summaries = [f"{job.get('title', '')} - {job.get('company', '')} ({job.get('location', '')})" for job in jobs]
+        for job, score in zip(jobs, self._score_jobs(jobs, summaries)):
+            job["compatibility_score"] = score
+        rejected = sum(1 for job in jobs if job["compatibility_score"] < MIN_COMPATIBILITY_SCORE)
+        logger.info(f"Pre-scored {len(jobs)} jobs from search results; {rejected} below threshold.")
+
+    def prepare_jobs(self, jobs: List[dict], pages: List[Page]) -> List[dict]:
+        """
+        Read-only half of the pipeline, run for up to len(pages) jobs at once:
+        loads each job page in its own tab, extracts the description and scores all
+        of them in one batched call. Scores land in job["compatibility_score"] and apply()
+        later reuses the already-loaded tab for the (serialized) submission.
+        """
+        self._prepared.clear()
+        candidates = []
+        pages = iter(pages)
+        for job in jobs:
+            link = job.get("link")
+            if not link or self.storage.is_already_applied(link, job.get("job_id")):
+                continue
+            if job.get("compatibility_score", 100) < MIN_COMPATIBILITY_SCORE:
+                continue
+            page = next(pages, None)
+            if page is None:
+                break
+            candidates.append((job, page))
+
+        # Only the page loads run under "scrape"; scoring is plain HTTP
+        with get_network_filter(self.config).use("scrape"):
+            engine = get_engine()
+            if engine:
+                # One coroutine per tab on the engine loop instead of a thread hop per facade call
+                texts = engine.submit(self._read_jobs_async(candidates)).result()
+            else:
+                texts = self._read_jobs(candidates)
+        batch = [pair for pair, text in zip(candidates, texts) if text is not None]
+        descriptions = [text for text in texts if text is not None]
+
+        scores = self._score_jobs([job for job, _ in batch], descriptions)
+
+        for (job, page), score in zip(batch, scores):
+            job["compatibility_score"] = score
+            self._prepared[job["link"]] = page
+            logger.info(f"Scored {job.get('title')}: {score}/100")
+
+        return [job for job, _ in batch]
+
+    def _read_jobs(self, candidates: List[tuple]) -> List[Optional[str]]:
+        """Description per (job, tab); None when the tab could not open the job."""
+        opened = []
+        for job, page in candidates:
+            try:
+                # "commit" returns as soon as navigation starts, so the tabs load in parallel
+                page.goto(job["link"], wait_until="commit")
+                opened.append(True)
+            except Exception as e:
+                logger.warning(f"Could not open {job['link']} in worker tab: {e}")
+                opened.append(False)
+
+        texts = []
+        for (job, page), ok in zip(candidates, opened):
+            if not ok:
+                texts.append(None)
+                continue
+            try:
+                page.wait_for_load_state("domcontentloaded", timeout=30000)
+            except Exception as e:
+                logger.debug(f"Worker tab slow to load {job.get('link')}: {e}")
+            texts.append(self._read_job_description(page, job))
+        return texts
+
+    async def _read_jobs_async(self, candidates: List[tuple]) -> List[Optional[str]]:
+        """_read_jobs on the async engine's loop: every tab loads and is read concurrently."""
+        async def read(job: dict, page) -> Optional[str]:
+            page = unwrap(page)
+            try:
+                await page.goto(job["link"], wait_until="commit")
+            except Exception as e:
+                logger.warning(f"Could not open {job['link']} in worker tab: {e}")
+                return None
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=30000)
+            except Exception as e:
+                logger.debug(f"Worker tab slow to load {job.get('link')}: {e}")
+            try:
+                return await page.locator(JOB_DESCRIPTION_SELECTOR).first.inner_text(timeout=10000)
+            except Exception:
+                return job.get("title", "")
+
+        return await asyncio.gather(*(read(job, page) for job, page in candidates))
+
+    @contextmanager
+    def _using_page(self, page: Page):
+        """Temporarily points the applicant (and its behavior helper) at another tab."""
+        original = self.page
+        self.page = page
+        self.behavior.page = page
+        try:
+            yield
+        finally:
+            self.page = original
+            self.behavior.page = original
 
     def apply(self, job: dict) -> str:
         """
@@ -36,26 +250,42 @@ class Applicant:
         if not link:
             return "FAILED"
 
-        if self.storage.is_already_applied(link):
+        prepared_page = self._prepared.pop(link, None)
+
+        if self.storage.is_already_applied(link, job.get("job_id")):
             logger.info(f"Skipping {job['title']} - Already applied.")
             return "SKIPPED_DUPLICATE"
 
+        # Jobs scored by prescore_jobs()/prepare_jobs() are rejected without touching the browser again
+        if job.get("compatibility_score", 100) < MIN_COMPATIBILITY_SCORE:
+            logger.info(f"Skipping {job['title']} - Low compatibility score.")
+            return "SKIPPED_LOW_MATCH"
+
         logger.info(f"Processing: {job['title']} at {job['company']}")
         
+        with self._using_page(prepared_page or self.page), get_network_filter(self.config).use("apply"):
+            return self._apply_on_current_page(job, prepared=prepared_page is not None)
+
+    def _apply_on_current_page(self, job: dict, prepared: bool = False) -> str:
+        link = job.get("link")
         try:
-            self.page.goto(link)
-            self.behavior.random_delay(2, 5) # Initial load wait
+            if not prepared:
+                self.page.goto(link)
+                # Wait for the job details to render instead of a fixed sleep
+                self.behavior.wait_for_selector(".jobs-description__content, .jobs-apply-button, #jobDescriptionText")
             self.behavior.random_mouse_move() # Simulate human checking page
             
             # Scroll to read description
             self.behavior.smooth_scroll()
             
             # 1. Compatibility Check (Basic Keyword Match)
-            score = self.evaluate_compatibility(job)
-            job["compatibility_score"] = score
+            if not prepared:
+                score = self.evaluate_compatibility(job)
+                job["compatibility_score"] = score
+            score = job["compatibility_score"]
             logger.info(f"Compatibility Score: {score}/100")
 
-            if score < 20: # Example threshold
+            if score < MIN_COMPATIBILITY_SCORE:
                 logger.info(f"Skipping {job['title']} - Low compatibility score.")
                 return "SKIPPED_LOW_MATCH"
 
@@ -119,7 +349,11 @@ class Applicant:
                     if not user_decision:
                         return "SKIPPED_USER"
 
+                self._answer_keys = []
                 status = self.process_easy_apply_flow()
+                memory = get_answer_memory(self.config)
+                if memory and self._answer_keys:
+                    memory.record_outcome(self._answer_keys, status)
 
             self.storage.add_application(job, status=status)
             return status
@@ -135,7 +369,7 @@ class Applicant:
         try:
             # Click the main "Apply" button to open modal
             self.page.click("button.jobs-apply-button")
-            self.behavior.random_delay(3, 5)
+            self.behavior.wait_for_modal_change("closed")
 
             # Loop through steps
             max_steps = 15 # Increased to handle complex forms
@@ -150,8 +384,9 @@ class Applicant:
                 submit_btn = self.page.locator("button:has-text('Enviar candidatura'), button:has-text('Submit application'), button:has-text('Finalizar')")
                 if submit_btn.is_visible():
                     logger.info("Found Submit button! Finalizing automatically...")
+                    step = self.behavior.modal_signature()
                     submit_btn.click()
-                    self.behavior.random_delay(5, 8)
+                    self.behavior.wait_for_modal_change(step, timeout_s=30)
                     
                     # Post-submit cleanup (closen success modal)
                     self.finalize_application_post_submit()
@@ -161,8 +396,9 @@ class Applicant:
                 next_btn = self.page.locator("button:has-text('Próximo'), button:has-text('Avançar'), button:has-text('Next'), button:has-text('Review')")
                 if next_btn.is_visible():
                     logger.info(f"Advancing step {i+1}...")
+                    step = self.behavior.modal_signature()
                     next_btn.click()
-                    self.behavior.random_delay(2, 4)
+                    self.behavior.wait_for_modal_change(step)
                 else:
                     # Check if modal is still open but no buttons found
                     if self.page.locator("div[role='dialog']").is_visible():
@@ -197,167 +433,183 @@ class Applicant:
     def finalize_application_post_submit(self):
         """Closes any success or follow-up modals after submission."""
         try:
-            self.behavior.random_delay(2, 4)
-            close_btn = self.page.locator("button[aria-label='Fechar'], button[aria-label='Dismiss'], button:has-text('Done'), button:has-text('Concluído')").first
+            close_sel = "button[aria-label='Fechar'], button[aria-label='Dismiss'], button:has-text('Done'), button:has-text('Concluído')"
+            self.behavior.wait_for_selector(close_sel, timeout_s=5)
+            close_btn = self.page.locator(close_sel).first
             if close_btn.is_visible():
                 logger.info("Closing post-application modal.")
                 close_btn.click()
-                self.behavior.random_delay(2, 3)
+                self.behavior.wait_for_selector("div[role='dialog']", state="hidden", timeout_s=5)
         except: pass
 
     def handle_questions(self):
-
         """
         Attempts to answer form questions automatically using a knowledge base.
+        The dialog is read with a single snapshot; select and radio answers are then
+        applied in one batch, while text answers are still typed like a human.
         """
-        import yaml
-        answers_path = Path("config/answers.yaml")
-        knowledge_base = {"questions": []}
-        
-        if answers_path.exists():
-            try:
-                with open(answers_path, 'r', encoding='utf-8') as f:
-                    knowledge_base = yaml.safe_load(f) or knowledge_base
-            except Exception as e:
-                logger.error(f"Error loading answers.yaml: {e}")
-
-        # Helper to find a smart answer based on text
-        def get_smart_answer(text: str) -> Optional[str]:
-            text_lower = text.lower()
-            for item in knowledge_base.get("questions", []):
-                if any(kw.lower() in text_lower for kw in item.get("keywords", [])):
-                    return item.get("answer")
-            return None
+        # Parsed once per process (re-read when answers.yaml changes on disk)
+        get_smart_answer = get_answer_index("config/answers.yaml").lookup
 
         try:
-            # 1. Handle Text and Textarea Inputs
-            inputs = self.page.locator("input[type='text'], input:not([type]), textarea").all()
-            for inp in inputs:
-                if inp.is_visible() and not inp.input_value():
-                    # Look for a label or name to identify the question
-                    label = self.page.locator(f"label[for='{inp.get_attribute('id')}']").first
-                    question_text = label.inner_text() if label.is_visible() else (inp.get_attribute("name") or "")
-                    
+            fields = self.page.evaluate(_FORM_SNAPSHOT_JS)
+            choices = []
+
+            for field in fields:
+                question_text = field["label"]
+
+                # 1. Text and Textarea Inputs
+                if field["kind"] == "text":
+                    if field["value"]:
+                        continue
                     smart_val = get_smart_answer(question_text)
                     if not smart_val:
-                        # Fallback to AI
-                        ai = AIAssistant(self.config)
-                        # We need raw text of the resume for context
-                        parser = ResumeParser(self.config.resume.file_path)
-                        resume_text = parser.read_file()
-                        smart_val = ai.get_answer_for_question(question_text, resume_text)
+                        # Fallback to learned answers, then AI
+                        smart_val = self._learned_or_ai_answer(question_text)
 
                     if smart_val:
                         logger.info(f"Answer found for '{question_text[:30]}...': {smart_val}")
-                        self.behavior.simulate_human_typing(inp, smart_val)
-                    else:
+                    elif "experience" in question_text.lower() or "anos" in question_text.lower():
                         # Fallback for years of experience
-                        if "experience" in question_text.lower() or "anos" in question_text.lower():
-                            self.behavior.simulate_human_typing(inp, "2")
-                        else:
-                            # Generic fallback for required fields
-                            self.behavior.simulate_human_typing(inp, "1")
-                    self.behavior.random_delay(1, 2)
-
-            # 2. Handle Radio Buttons (Yes/No)
-            radios = self.page.locator("label:has-text('Yes'), label:has-text('Sim')").all()
-            for radio in radios:
-                if radio.is_visible():
-                    # Check if the question text might need a 'No/Não' (rare for eligibility)
-                    parent_text = radio.evaluate("el => el.parentElement.innerText").lower()
-                    if "visa" in parent_text or "patrocínio" in parent_text:
-                        # For visa sponsorship, usually answer No
-                        no_radio = self.page.locator("label:has-text('No'), label:has-text('Não')").first
-                        if no_radio.is_visible():
-                            no_radio.click()
+                        smart_val = "2"
                     else:
-                        radio.click()
+                        # Generic fallback for required fields
+                        smart_val = "1"
+                    self.behavior.simulate_human_typing(self.page.locator(f"[data-nx-field='{field['field']}']"), smart_val)
                     self.behavior.random_delay(1, 2)
 
-            # 3. Handle Select Dropdowns
-            selects = self.page.locator("select").all()
-            for sel in selects:
-                if sel.is_visible():
-                    # Try to find a smart option
-                    options = sel.locator("option").all()
-                    question_text = sel.evaluate("el => el.parentElement.innerText")
-                    smart_val = get_smart_answer(question_text)
-                    
-                    matched = False
-                    if smart_val:
-                        for opt in options:
-                            if smart_val.lower() in opt.inner_text().lower():
-                                sel.select_option(value=opt.get_attribute("value"))
-                                matched = True
-                                break
-                    
-                    if not matched:
-                        # Fallback to AI
-                        from src.ai_assistant import AIAssistant
-                        ai = AIAssistant(self.config)
-                        # We need raw text of the resume for context
-                        from src.resume_parser import ResumeParser
-                        parser = ResumeParser(self.config.resume.file_path)
-                        resume_text = parser.read_file()
-                        
-                        ai_val = ai.get_answer_for_question(question_text, resume_text)
-                        if ai_val:
-                            # Try to match AI answer with options
-                            for opt in options:
-                                if ai_val.lower() in opt.inner_text().lower() or opt.inner_text().lower() in ai_val.lower():
-                                    sel.select_option(value=opt.get_attribute("value"))
-                                    matched = True
-                                    break
-                        
-                        if not matched:
-                            # Default to the second option
-                            if len(options) > 1:
-                                sel.select_option(index=1)
-                    
-                    self.behavior.random_delay(1, 2)
+                # 2. Radio Buttons (Yes/No)
+                elif field["kind"] == "radio":
+                    if field["value"]:
+                        continue
+                    option = self._choose_radio_option(field, get_smart_answer(question_text))
+                    if option:
+                        choices.append({"field": option["value"], "value": option["value"]})
+
+                # 3. Select Dropdowns
+                elif field["kind"] == "select":
+                    options = field["options"]
+                    if not options or (field["value"] and field["value"] != options[0]["value"]):
+                        continue
+                    value = self._choose_select_option(question_text, options, get_smart_answer(question_text))
+                    if value is not None:
+                        choices.append({"field": field["field"], "value": value})
+
+            if choices:
+                applied = self.page.evaluate(_APPLY_CHOICES_JS, choices)
+                logger.info(f"Applied {applied} select/radio answers in one batch.")
+                self.behavior.random_delay(1, 2)
 
         except Exception as e:
             logger.debug(f"Minor issue answering questions: {e}")
 
+    def _choose_radio_option(self, field: dict, smart_val: Optional[str]) -> Optional[dict]:
+        """Picks a radio option: knowledge base answer first, otherwise Yes (No for visa sponsorship)."""
+        options = field["options"]
+        if smart_val:
+            for opt in options:
+                if smart_val.lower() in opt["text"].lower():
+                    return opt
+        question = field["label"].lower()
+        # For visa sponsorship, usually answer No
+        wanted = ("no", "não") if "visa" in question or "patrocínio" in question else ("yes", "sim")
+        for opt in options:
+            if opt["text"].strip().lower() in wanted:
+                return opt
+        return None
+
+    def _choose_select_option(self, question_text: str, options: List[dict], smart_val: Optional[str]) -> Optional[str]:
+        """Returns the option value to select from the snapshot's option list."""
+        if smart_val:
+            for opt in options:
+                if smart_val.lower() in opt["text"].lower():
+                    return opt["value"]
+
+        # Fallback to learned answers, then AI
+        option_texts = [opt["text"] for opt in options]
+        ai_val = self._learned_or_ai_answer(question_text, option_texts)
+        if ai_val:
+            # Try to match AI answer with options
+            for opt in options:
+                text = opt["text"].lower()
+                if text and (ai_val.lower() in text or text in ai_val.lower()):
+                    return opt["value"]
+
+        # Default to the second option
+        return options[1]["value"] if len(options) > 1 else None
+
+    def _learned_or_ai_answer(self, question_text: str, options: Optional[List[str]] = None) -> Optional[str]:
+        """Answers a form question from the learned answer store, asking the AI (and remembering it) on a miss."""
+        memory = get_answer_memory(self.config)
+        if memory:
+            answer = memory.get(question_text, options)
+            if answer:
+                logger.info(f"Learned answer reused for '{question_text[:30]}...'")
+                self._answer_keys.append(memory.make_key(question_text, options))
+                return answer
+
+        ai = get_ai_assistant(self.config)
+        # We need raw text of the resume for context
+        resume_text = load_resume(self.config.resume.file_path)["raw_text"]
+        question = question_text
+        if options:
+            question += "\nOptions: " + " | ".join(o for o in options if o)
+        answer = ai.get_answer_for_question(question, resume_text)
+        if answer and memory:
+            self._answer_keys.append(memory.record(question_text, answer, options))
+        return answer
+
     def evaluate_compatibility(self, job: dict) -> int:
         """
         Calculates a compatibility score based on keywords or AI analysis.
         """
-        # Try AI First if Key exists
-        from src.ai_assistant import AIAssistant
-        ai = AIAssistant(self.config)
-        if ai.api_key:
-            from src.resume_parser import ResumeParser
-            parser = ResumeParser(self.config.resume.file_path)
-            resume_text = parser.read_file()
-            
-            # Fetch full text from page if possible for JD
-            try:
-                # Common JD containers
-                jd_text = self.page.locator(".jobs-description__content, #jobDescriptionText, .jobsearch-JobComponent-description").inner_text()
-            except:
-                jd_text = job.get("title", "")
-            
-            score = ai.evaluate_compatibility(jd_text, resume_text)
-            logger.info(f"AI Compatibility Score: {score}/100")
-            return score
-
-        # Fallback to Keyword Match
-        score = 0
-        raw_title = job.get('title', '')
-        title_norm = normalize_text(raw_title)
-        
-        matches = []
-        for kw in self.config.profile.keywords.include:
-            kw_norm = normalize_text(kw)
-            if kw_norm in title_norm:
-                matches.append(kw)
-                score += 30
-        
+        return self._score_jobs([job], [self._read_job_description(self.page, job)])[0]
+
+    def _read_job_description(self, page: Page, job: dict) -> str:
+        """Returns the job description text shown on the page (falls back to the title)."""
+        try:
+            # Common JD containers
+            return page.locator(JOB_DESCRIPTION_SELECTOR).first.inner_text(timeout=10000)
+        except:
+            return job.get("title", "")
+
+    def _score_jobs(self, jobs: List[dict], descriptions: List[str]) -> List[int]:
+        """
+        Scores several jobs against the resume. Pure HTTP/CPU work, safe to run off the browser thread.
+        The local TF-IDF tier settles clear accepts/rejects; only borderline jobs go to the
+        AI in one batched call (or keep their local score when no key is configured).
+        """
+        if not jobs:
+            return []
+        resume_text = load_resume(self.config.resume.file_path)["raw_text"]
+        scores: List[Optional[int]] = [None] * len(jobs)
+
+        local = None
+        if self.config.scoring.local_enabled:
+            local = LocalScorer(resume_text, get_matcher(self.config), self.config.scoring).score_batch(descriptions)
+            for i, (score, verdict) in enumerate(local):
+                if verdict != BORDERLINE:
+                    scores[i] = score
+            logger.info(f"Local scorer settled {len(jobs) - scores.count(None)}/{len(jobs)} jobs without the AI.")
+
+        pending = [i for i, score in enumerate(scores) if score is None]
+        ai = get_ai_assistant(self.config)
+        if pending and ai.api_key:
+            ai_scores = ai.evaluate_compatibility_batch([descriptions[i] for i in pending], resume_text)
+            for i, score in zip(pending, ai_scores):
+                scores[i] = score
+        else:
+            for i in pending:
+                scores[i] = local[i][0] if local else self._keyword_score(jobs[i])
+        return scores
+
+    def _keyword_score(self, job: dict) -> int:
+        """Title keyword match, used when the local scorer is disabled and no OpenAI key is configured."""
+        matches = get_matcher(self.config).match(job.get('title', '')).include
         if matches:
             logger.info(f"Matches found: {', '.join(matches)}")
         
-        return min(score, 100) if matches else 10
+        return min(30 * len(matches), 100) if matches else 10
 
     def ask_user_confirmation(self, job: dict) -> bool:
         """
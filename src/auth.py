@@ -13,6 +13,23 @@ class Authenticator:
         self.config = config
         self.behavior = HumanBehavior(page, config)
 
+    def _daemon_session_valid(self, platform: str, cookie_name: str) -> bool:
+        """True when attached to the browser daemon and its context still holds a recently verified login."""
+        if not self.config.browser.daemon:
+            return False
+        from src.browser_daemon import recent_login
+        if not recent_login(self.config, platform):
+            return False
+        try:
+            return any(c["name"] == cookie_name for c in self.page.context.cookies())
+        except Exception:
+            return False
+
+    def _mark_daemon_login(self, platform: str):
+        if self.config.browser.daemon:
+            from src.browser_daemon import mark_logged_in
+            mark_logged_in(self.config, platform)
+
     def login_linkedin(self) -> bool:
         """Performs login on LinkedIn."""
         if not self.config.secrets or not self.config.secrets.linkedin:
@@ -27,6 +44,10 @@ class Authenticator:
             logger.warning("LinkedIn credentials are empty or default. Skipping login.")
             return False
 
+        if self._daemon_session_valid("linkedin", "li_at"):
+            logger.info("Browser daemon session verified recently. Skipping login check.")
+            return True
+
         try:
             logger.info("Starting LinkedIn login check...")
             # Use a longer timeout and "load" instead of "networkidle" which can be flaky
@@ -46,6 +67,7 @@ class Authenticator:
             # Check if we are already logged in (Feed visible)
             if self.page.locator(".global-nav").is_visible() or "feed" in self.page.url:
                 logger.info("Already logged in! Skipping login form.")
+                self._mark_daemon_login("linkedin")
                 return True
 
             logger.info("Not logged in. Navigating to login page...")
@@ -82,6 +104,7 @@ class Authenticator:
 
             if is_logged_in:
                 logger.info("Login successful!")
+                self._mark_daemon_login("linkedin")
                 return True
             else:
                 logger.error(f"Login might have failed. Current URL: {self.page.url}")
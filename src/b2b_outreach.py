@@ -2,12 +2,12 @@ import os
 import json
 import logging
 import time
-import random
 from typing import List, Dict
 from playwright.sync_api import Page
 from src.config import load_config
 from src.job_searcher import JobSearcher
 from src.linkedin_manager import LinkedInManager
+from src.pacing import get_pacer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -81,18 +81,21 @@ class B2BOutreachEngine:
                         profiles.append(profile)
                 except: continue
 
-            # 3. Send requests
+            # 3. Send requests (spaced by the linkedin_outreach pacing budget)
+            pacer = get_pacer(self.config)
             for p in profiles:
+                if not pacer.wait_for_slot("linkedin_outreach"):
+                    logger.info("Limite diário de convites atingido.")
+                    break
                 logger.info(f"Enviando convite para: {p['name']}")
                 success = manager.send_connection_request(
                     {"name": p['name'], "link": p['link'], "company": "Syndic/Condo"},
                     self.pitch
                 )
+                pacer.record("linkedin_outreach")
                 if success:
                     self.contacted_leads.append(p['uid'])
                     self._save_history()
-                
-                time.sleep(random.uniform(30, 60)) # Safety delay
 
             logger.info(f"🎯 Ciclo de prospecção concluído. Novos leads: {len(profiles)}")
 
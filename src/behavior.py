@@ -1,27 +1,123 @@
 import time
 import random
 import math
+import logging
+from typing import Optional
 from playwright.sync_api import Page
 from src.config import Settings
+from src.pacing import get_pacer
+
+logger = logging.getLogger(__name__)
+
+# Resolves once the element has gone quiet_ms without DOM mutations (or timeout_ms elapses)
+_DOM_SETTLE_JS = """
+([selector, quietMs, timeoutMs]) => new Promise(resolve => {
+    const root = document.querySelector(selector) || document.body;
+    let quietTimer = null;
+    const done = settled => { observer.disconnect(); clearTimeout(quietTimer); clearTimeout(hardTimer); resolve(settled); };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => done(true), quietMs);
+    });
+    observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+    quietTimer = setTimeout(() => done(true), quietMs);
+    const hardTimer = setTimeout(() => done(false), timeoutMs);
+})
+"""
+
+# Cheap fingerprint of the open modal: heading, progress and text length change on every step
+_MODAL_SIGNATURE_JS = """
+() => {
+    const dialog = document.querySelector("div[role='dialog']");
+    if (!dialog) return 'closed';
+    const heading = dialog.querySelector('h1, h2, h3');
+    const progress = dialog.querySelector("progress, [role='progressbar']");
+    return [heading ? heading.innerText : '', progress ? (progress.value || progress.getAttribute('aria-valuenow')) : '',
+            dialog.innerText.length].join('|');
+}
+"""
 
 class HumanBehavior:
-    def __init__(self, page: Page, config: Settings):
+    def __init__(self, page: Page, config: Settings, platform: str = "linkedin"):
         self.page = page
         self.config = config
+        self.platform = platform # pacing budget key for every pause taken here
+        # Scroll micro-pauses get their own key so they don't use up the platform's action budget
+        self.scroll_key = f"{platform}_scroll"
+        self.pacer = get_pacer(config)
 
     def random_delay(self, min_s: float = None, max_s: float = None):
-        """Sleeps for a random amount of time."""
+        """Waits a random amount of time, paced against the platform's action budget."""
         if not min_s:
             min_s = self.config.behavior.action_delay_seconds.min
         if not max_s:
             max_s = self.config.behavior.action_delay_seconds.max
         
-        delay = random.uniform(min_s, max_s)
-        time.sleep(delay)
+        self.pacer.pause(self.platform, min_s, max_s)
+
+    def jitter(self):
+        """Short humanization pause, applied after an awaited state is reached."""
+        jitter = self.config.behavior.wait_jitter_ms
+        time.sleep(random.uniform(jitter.min, jitter.max) / 1000)
+
+    def _timeout_ms(self, timeout_s: Optional[float]) -> float:
+        return (timeout_s or self.config.behavior.wait_timeout_seconds) * 1000
+
+    def wait_for_selector(self, selector: str, state: str = "visible", timeout_s: float = None) -> bool:
+        """Waits until selector reaches state (visible/hidden/attached/detached), then jitters."""
+        try:
+            self.page.wait_for_selector(selector, state=state, timeout=self._timeout_ms(timeout_s))
+            return True
+        except Exception:
+            logger.debug(f"Timed out waiting for {selector} to be {state}.")
+            return False
+        finally:
+            self.jitter()
+
+    def wait_for_network_idle(self, timeout_s: float = None) -> bool:
+        """Waits until the page has no network activity for 500ms, then jitters."""
+        try:
+            self.page.wait_for_load_state("networkidle", timeout=self._timeout_ms(timeout_s))
+            return True
+        except Exception:
+            logger.debug("Timed out waiting for network idle.")
+            return False
+        finally:
+            self.jitter()
+
+    def wait_for_dom_settle(self, selector: str = "body", quiet_ms: int = 400, timeout_s: float = None) -> bool:
+        """Waits until the element stops mutating (MutationObserver), then jitters."""
+        try:
+            return bool(self.page.evaluate(_DOM_SETTLE_JS, [selector, quiet_ms, self._timeout_ms(timeout_s)]))
+        except Exception as e:
+            logger.debug(f"DOM settle wait failed: {e}")
+            return False
+        finally:
+            self.jitter()
+
+    def modal_signature(self) -> str:
+        """Fingerprint of the open dialog step ('closed' when there is none)."""
+        try:
+            return self.page.evaluate(_MODAL_SIGNATURE_JS)
+        except Exception:
+            return ""
+
+    def wait_for_modal_change(self, previous: str, timeout_s: float = None) -> bool:
+        """Waits until the dialog moves past the step fingerprinted by previous and has rendered."""
+        changed = True
+        try:
+            self.page.wait_for_function(
+                f"(previous) => ({_MODAL_SIGNATURE_JS})() !== previous", arg=previous, timeout=self._timeout_ms(timeout_s)
+            )
+        except Exception:
+            logger.debug("Modal step did not change before timeout.")
+            changed = False
+        self.wait_for_dom_settle("div[role='dialog']", timeout_s=5)
+        return changed
 
-    def simulate_human_typing(self, selector: str, text: str):
-        """Types text with random delays between keystrokes."""
-        element = self.page.locator(selector)
+    def simulate_human_typing(self, selector, text: str):
+        """Types text with random delays between keystrokes (selector string or Locator)."""
+        element = self.page.locator(selector) if isinstance(selector, str) else selector
         element.click()
         
         for char in text:
@@ -45,14 +141,14 @@ class HumanBehavior:
             scroll_step = random.randint(300, 700)
             current_scroll += scroll_step
             self.page.evaluate(f"window.scrollTo(0, {current_scroll})")
-            time.sleep(random.uniform(0.5, 1.5))
+            self.pacer.pause(self.scroll_key, 0.5, 1.5)
             
             # Occasionally scroll back up a bit
             if random.random() < 0.2:
                 back = random.randint(100, 300)
                 current_scroll -= back
                 self.page.evaluate(f"window.scrollTo(0, {current_scroll})")
-                time.sleep(random.uniform(0.5, 1.0))
+                self.pacer.pause(self.scroll_key, 0.5, 1.0)
             
             total_height = self.page.evaluate("document.body.scrollHeight") # Update in case of infinite scroll
             if current_scroll > total_height: # Break if end
@@ -0,0 +1,158 @@
+"""
+Long-lived Chromium holding the bot's persistent profile, shared over CDP.
+
+Run it once (python -m src.browser_daemon, or let JobSearcher.start_browser spawn it
+when browser.daemon is enabled). Every entry point (main, cli_wrapper, the LinkedIn
+scheduler, B2B outreach) then attaches to the already-warm, already-logged-in
+context in well under a second instead of cold-launching Chromium, loading a page,
+applying stealth and logging in again.
+"""
+import os
+import sys
+import json
+import time
+import signal
+import logging
+import subprocess
+from datetime import datetime
+from typing import Optional
+
+import requests
+
+from src.config import Settings, load_config
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+PROFILE_PATH = os.path.abspath("browser_profile")
+
+
+def read_endpoint(config: Settings) -> Optional[dict]:
+    """Returns the running daemon's endpoint record, or None if it is not reachable."""
+    path = config.browser.daemon_endpoint_file
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            endpoint = json.load(f)
+        # Cheap liveness probe; a stale file from a crashed daemon fails here
+        requests.get(f"{endpoint['cdp_url']}/json/version", timeout=(1, 2)).raise_for_status()
+        return endpoint
+    except Exception:
+        return None
+
+
+def _write_endpoint(config: Settings, endpoint: dict):
+    path = config.browser.daemon_endpoint_file
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(endpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def mark_logged_in(config: Settings, platform: str):
+    """Records a verified login in the daemon's endpoint file so later clients can skip the check."""
+    endpoint = read_endpoint(config)
+    if endpoint is None:
+        return
+    endpoint.setdefault("logins", {})[platform] = time.time()
+    _write_endpoint(config, endpoint)
+
+
+def recent_login(config: Settings, platform: str, max_age_seconds: int = 6 * 3600) -> bool:
+    """True if the daemon's context had a verified login for platform within max_age_seconds."""
+    endpoint = read_endpoint(config)
+    verified = (endpoint or {}).get("logins", {}).get(platform)
+    return bool(verified) and time.time() - verified < max_age_seconds
+
+
+def ensure_daemon(config: Settings, wait_seconds: float = 30) -> Optional[dict]:
+    """Returns the daemon endpoint, spawning a detached daemon first if allowed and none is running."""
+    endpoint = read_endpoint(config)
+    if endpoint or not config.browser.daemon_autostart:
+        return endpoint
+
+    logger.info("No browser daemon running. Starting one...")
+    popen_kwargs = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    if os.name == "nt":
+        popen_kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        popen_kwargs["start_new_session"] = True
+    subprocess.Popen([sys.executable, "-m", "src.browser_daemon"], cwd=os.getcwd(), **popen_kwargs)
+
+    deadline = time.time() + wait_seconds
+    while time.time() < deadline:
+        time.sleep(0.5)
+        endpoint = read_endpoint(config)
+        if endpoint:
+            return endpoint
+    logger.warning("Browser daemon did not come up in time.")
+    return None
+
+
+def serve(config: Settings):
+    """Launches the persistent context with remote debugging enabled and keeps it alive until signalled."""
+    from playwright.sync_api import sync_playwright
+
+    port = config.browser.daemon_port
+    stop = {"requested": False}
+
+    def _request_stop(*_):
+        stop["requested"] = True
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+    lock_file = os.path.join(PROFILE_PATH, "SingletonLock")
+    if os.path.exists(lock_file):
+        try:
+            os.remove(lock_file)
+        except Exception as e:
+            logger.warning(f"Could not remove lock file: {e}. Browser might still be running.")
+
+    with sync_playwright() as playwright:
+        context = playwright.chromium.launch_persistent_context(
+            user_data_dir=PROFILE_PATH,
+            headless=config.bot.headless,
+            user_agent=USER_AGENT,
+            viewport={'width': 1280, 'height': 720},
+            args=[f"--remote-debugging-port={port}", "--remote-debugging-address=127.0.0.1"]
+        )
+        page = context.pages[0] if context.pages else context.new_page()
+        try:
+            page.goto("https://www.google.com")
+        except Exception:
+            pass
+
+        _write_endpoint(config, {
+            "cdp_url": f"http://127.0.0.1:{port}",
+            "pid": os.getpid(),
+            "profile": PROFILE_PATH,
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "logins": {},
+        })
+        logger.info(f"Browser daemon ready on port {port} (profile: {PROFILE_PATH}).")
+
+        try:
+            ticks = 0
+            while not stop["requested"]:
+                time.sleep(1)
+                ticks += 1
+                if ticks % 5 == 0:
+                    # Health check (clients may close any tab, so no page is relied on); raises once the browser is gone
+                    context.cookies("https://www.google.com")
+        except Exception as e:
+            logger.warning(f"Browser daemon stopping: {e}")
+        finally:
+            try:
+                os.remove(config.browser.daemon_endpoint_file)
+            except OSError:
+                pass
+            context.close()
+    logger.info("Browser daemon stopped.")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    serve(load_config("config/settings.yaml"))
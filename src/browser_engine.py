@@ -0,0 +1,169 @@
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Optional
+
+from src.config import Settings
+
+logger = logging.getLogger(__name__)
+
+_engine: Optional["AsyncBrowserEngine"] = None
+
+
+def get_engine() -> Optional["AsyncBrowserEngine"]:
+    """Returns the running async engine, if the browser was started with engine: async."""
+    return _engine
+
+
+class AsyncBrowserEngine:
+    """
+    Runs playwright.async_api on a dedicated asyncio event loop thread.
+
+    Existing sync classes (JobSearcher, Applicant, HumanBehavior, LinkedInManager,
+    Authenticator) keep working unchanged through SyncFacade objects. Each facade
+    call is one hop to the loop thread and back, so hot paths should instead submit()
+    one coroutine for the whole task: Applicant.prepare_jobs loads and reads all its
+    worker tabs that way, with their network waits overlapping on the loop.
+    """
+
+    def __init__(self, config: Settings):
+        self.config = config
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, name="AsyncBrowserEngine", daemon=True)
+        self.playwright = None
+        self.context = None
+        self.page = None
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Awaitable) -> Future:
+        """Schedules a coroutine on the engine loop and returns a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Runs a coroutine on the engine loop and blocks the calling thread for the result."""
+        if threading.current_thread() is self.thread:
+            raise RuntimeError("AsyncBrowserEngine.run() called from the engine loop; await the coroutine instead.")
+        return self.submit(coro).result(timeout)
+
+    def start(self, profile_path: str, **launch_options) -> "SyncFacade":
+        """Launches the persistent context and returns a sync facade for its first page."""
+        global _engine
+        self.thread.start()
+        self.run(self._start(profile_path, launch_options))
+        _engine = self
+        logger.info(f"Async browser engine started with persistent profile at: {profile_path}")
+        return SyncFacade(self.page, self)
+
+    async def _start(self, profile_path: str, launch_options: dict):
+        from playwright.async_api import async_playwright
+        from playwright_stealth import Stealth
+
+        self.playwright = await async_playwright().start()
+        self.context = await self.playwright.chromium.launch_persistent_context(
+            user_data_dir=profile_path,
+            headless=self.config.bot.headless,
+            **launch_options
+        )
+        self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
+        try:
+            await self.page.goto("https://www.google.com")
+        except Exception:
+            pass
+        await Stealth().apply_stealth_async(self.page)
+
+    def stop(self):
+        """Closes the context, stops Playwright and shuts the loop down."""
+        global _engine
+        if self.thread.is_alive():
+            try:
+                self.run(self._stop(), timeout=30)
+            except Exception as e:
+                logger.warning(f"Async engine shutdown issue: {e}")
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=5)
+        if _engine is self:
+            _engine = None
+        logger.info("Async browser engine stopped.")
+
+    async def _stop(self):
+        if self.context:
+            await self.context.close()
+        if self.playwright:
+            await self.playwright.stop()
+
+
+class SyncFacade:
+    """
+    Blocking proxy around an async Playwright object (Page, Locator, Mouse, ...).
+
+    Every attribute access and call is executed on the engine loop; awaitables are
+    awaited there and Playwright objects coming back are wrapped again, so callers
+    use it exactly like the playwright.sync_api object it replaces.
+    """
+
+    __slots__ = ("_obj", "_engine")
+
+    def __init__(self, obj: Any, engine: AsyncBrowserEngine):
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_engine", engine)
+
+    def __getattr__(self, name: str):
+        obj, engine = self._obj, self._engine
+
+        async def _get():
+            return getattr(obj, name)
+
+        attr = engine.run(_get())
+        if not callable(attr):
+            return _wrap(attr, engine)
+
+        def _call(*args, **kwargs):
+            args = [unwrap(a) for a in args]
+            kwargs = {k: unwrap(v) for k, v in kwargs.items()}
+
+            async def _invoke():
+                result = attr(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+
+            return _wrap(engine.run(_invoke()), engine)
+
+        return _call
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._obj, name, unwrap(value))
+
+    def __eq__(self, other: Any) -> bool:
+        return self._obj is unwrap(other)
+
+    def __hash__(self) -> int:
+        return id(self._obj)
+
+    def __repr__(self) -> str:
+        return f"SyncFacade({self._obj!r})"
+
+
+def _is_playwright_object(value: Any) -> bool:
+    module = type(value).__module__ or ""
+    return module.startswith("playwright.async_api") or module.startswith("playwright._impl")
+
+
+def _wrap(value: Any, engine: AsyncBrowserEngine) -> Any:
+    if isinstance(value, list):
+        return [_wrap(v, engine) for v in value]
+    if _is_playwright_object(value):
+        return SyncFacade(value, engine)
+    return value
+
+
+def unwrap(value: Any) -> Any:
+    """The async Playwright object behind a facade (anything else is returned as is)."""
+    if isinstance(value, SyncFacade):
+        return object.__getattribute__(value, "_obj")
+    return value
@@ -5,6 +5,8 @@ import json
 from datetime import datetime
 from playwright.sync_api import sync_playwright
 from src.config import load_config
+from src.http_client import get_session
+from src.browser_daemon import read_endpoint
 
 logger = logging.getLogger("ChatGPTObserver")
 
@@ -15,21 +17,33 @@ class ChatGPTObserver:
         self.openai_api_key = self.config.secrets.openai.get("api_key") if self.config.secrets else None
         
     def start_browser(self, playwright):
+        """
+        Returns (page, close). While the browser daemon is running it holds browser_profile,
+        so the page is a new tab in its context (close() only closes that tab); otherwise a
+        local browser is launched on the profile.
+        """
+        endpoint = read_endpoint(self.config)
+        if endpoint:
+            browser = playwright.chromium.connect_over_cdp(endpoint["cdp_url"])
+            page = browser.contexts[0].new_page()
+            logger.info(f"Attached to browser daemon at {endpoint['cdp_url']}.")
+            return page, page.close
+
         profile_path = os.path.abspath("browser_profile")
         context = playwright.chromium.launch_persistent_context(
             user_data_dir=profile_path,
             headless=False, # Must be false to allow user to handle first login if needed
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
         )
-        return context
+        page = context.pages[0] if context.pages else context.new_page()
+        return page, context.close
 
     def scrape_chat_titles(self):
         logger.info("Starting ChatGPT Observation...")
         titles = []
         
         with sync_playwright() as playwright:
-            context = self.start_browser(playwright)
-            page = context.pages[0] if context.pages else context.new_page()
+            page, close_browser = self.start_browser(playwright)
             
             try:
                 page.goto("https://chatgpt.com/?model=gpt-4o", wait_until="domcontentloaded", timeout=60000)
@@ -81,7 +95,7 @@ class ChatGPTObserver:
             except Exception as e:
                 logger.error(f"Failed to scrape ChatGPT: {e}")
             finally:
-                context.close()
+                close_browser()
                 
         return titles
 
@@ -89,7 +103,6 @@ class ChatGPTObserver:
         if not titles or not self.openai_api_key:
             return
             
-        import requests
         url = "https://api.openai.com/v1/chat/completions"
         headers = {"Authorization": f"Bearer {self.openai_api_key}", "Content-Type": "application/json"}
         
@@ -112,7 +125,7 @@ class ChatGPTObserver:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = get_session().post(url, headers=headers, json=data, timeout=(5, 60))
             insights = response.json()["choices"][0]["message"]["content"]
             self._save_knowledge(insights)
             logger.info("User knowledge synthesized and saved.")
@@ -19,6 +19,51 @@ class BotConfig(BaseModel):
     daily_application_limit: int = Field(default=10, ge=1)
     headless: bool = False
 
+class AICacheConfig(BaseModel):
+    enabled: bool = True
+    path: str = "data/cache/llm_cache.sqlite3"
+    max_entries: int = Field(default=5000, ge=1)
+    # Per call-site TTL in seconds; call sites not listed here are never cached
+    ttl_seconds: Dict[str, int] = Field(default_factory=lambda: {
+        "form_answer": 30 * 24 * 3600,
+        "compatibility": 7 * 24 * 3600,
+    })
+
+class AIRateLimitConfig(BaseModel):
+    # Shared by every AI caller in the process; defaults match OpenAI tier 1 for gpt-4o
+    requests_per_minute: int = Field(default=500, ge=1)
+    tokens_per_minute: int = Field(default=30000, ge=1000)
+    # Longest a call waits for budget before giving up (returns None like a cooldown skip)
+    max_wait_seconds: float = Field(default=20, ge=0)
+    # Cooldown after a 429 without Retry-After, and after an exhausted quota
+    cooldown_seconds: int = Field(default=300, ge=1)
+
+class AIDispatchConfig(BaseModel):
+    # Priority classes: chat > apply > scoring > content > background
+    max_concurrency: int = Field(default=4, ge=1)
+    reserved_for_chat: int = Field(default=1, ge=0) # slots only chat calls may use
+    class_concurrency: Dict[str, int] = Field(default_factory=lambda: {"content": 2, "background": 1})
+    # Load shedding: these classes give up after waiting this long, or when this many calls are queued
+    shed_after_seconds: Dict[str, float] = Field(default_factory=lambda: {"content": 120, "background": 15})
+    shed_queue_depth: int = Field(default=8, ge=1)
+
+class AIPromptConfig(BaseModel):
+    # Token budgets for the context pasted into prompts (counted with tiktoken when available)
+    resume_tokens: int = Field(default=700, ge=100)
+    persona_tokens: int = Field(default=300, ge=50)
+    job_description_tokens: int = Field(default=900, ge=100) # per job in single scoring calls
+    max_prompt_tokens: int = Field(default=6000, ge=500) # system + user, per ask_gpt call
+
+class AIConfig(BaseModel):
+    model: str = "gpt-4o"
+    # Estimated prompt tokens per batch compatibility call (resume + job descriptions)
+    batch_token_budget: int = Field(default=12000, ge=1000)
+    batch_description_chars: int = Field(default=3000, ge=200)
+    cache: AICacheConfig = Field(default_factory=AICacheConfig)
+    rate_limit: AIRateLimitConfig = Field(default_factory=AIRateLimitConfig)
+    dispatch: AIDispatchConfig = Field(default_factory=AIDispatchConfig)
+    prompt: AIPromptConfig = Field(default_factory=AIPromptConfig)
+
 class ProfileKeywords(BaseModel):
     include: List[str] = Field(default_factory=list)
     exclude: List[str] = Field(default_factory=list)
@@ -30,6 +75,35 @@ class ProfileConfig(BaseModel):
     locations: List[str]
     keywords: ProfileKeywords
 
+class SearchConfig(BaseModel):
+    mode: Literal["sample", "crawl"] = "sample"
+    max_results_per_run: int = Field(default=100, ge=1)
+    max_pages_per_query: int = Field(default=5, ge=1)
+    scroll_loads_per_page: int = Field(default=3, ge=0)
+
+class ScoringConfig(BaseModel):
+    # Local TF-IDF tier that runs before any LLM call; only borderline jobs reach the model
+    local_enabled: bool = True
+    reject_below: float = Field(default=0.04, ge=0.0, le=1.0)
+    accept_above: float = Field(default=0.22, ge=0.0, le=1.0)
+    # Texts shorter than this (e.g. search-card titles) are never rejected locally
+    min_tokens: int = Field(default=40, ge=0)
+    # Search cards scored per pre-scoring call; chunks after the first run during pacing waits
+    prescore_chunk: int = Field(default=10, ge=1)
+
+class LearnedAnswersConfig(BaseModel):
+    enabled: bool = True
+    path: str = "data/learned_answers.json"
+    # Submitted applications (with no failed ones) before a free-text AI answer is copied
+    # into config/answers.yaml; 0 disables promotion
+    promote_after: int = Field(default=3, ge=0)
+
+class ConversationConfig(BaseModel):
+    path: str = "data/conversations.json"
+    # History tokens sent with each chat request; older turns are folded into the summary
+    window_tokens: int = Field(default=1500, ge=200)
+    summary_tokens: int = Field(default=300, ge=50)
+
 class ResumeConfig(BaseModel):
     file_path: str
     language: str = "pt-BR"
@@ -38,12 +112,53 @@ class ResumeConfig(BaseModel):
 class PlatformSettings(BaseModel):
     enabled: bool = False
     auto_apply: bool = False
+    workers: int = Field(default=1, ge=1) # parallel tabs for loading/scoring job pages
 
 class PlatformsConfig(BaseModel):
     linkedin: PlatformSettings = Field(default_factory=PlatformSettings)
     gupy: PlatformSettings = Field(default_factory=PlatformSettings)
     vagas_com: PlatformSettings = Field(default_factory=PlatformSettings)
 
+_TRACKER_DOMAINS = [
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+    "facebook.net", "hotjar.com", "bat.bing.com", "scorecardresearch.com",
+    "ads.linkedin.com", "snap.licdn.com",
+]
+
+class NetworkProfile(BaseModel):
+    # Playwright resource types: image, media, font, stylesheet, script, xhr, fetch, ...
+    block_resource_types: List[str] = Field(default_factory=list)
+    block_domains: List[str] = Field(default_factory=list) # host or any subdomain of it
+    # When set, sub-resources from hosts outside first_party_domains are blocked too
+    block_third_party: bool = False
+    first_party_domains: List[str] = Field(default_factory=list)
+
+class NetworkFilterConfig(BaseModel):
+    enabled: bool = True
+    # Active outside scoped tasks (login, checkpoints): no third-party blocking, captcha scripts must load
+    default_profile: str = "browse"
+    profiles: Dict[str, NetworkProfile] = Field(default_factory=lambda: {
+        "browse": NetworkProfile(block_resource_types=["media"], block_domains=list(_TRACKER_DOMAINS)),
+        "scrape": NetworkProfile(
+            block_resource_types=["image", "media", "font"],
+            block_domains=list(_TRACKER_DOMAINS),
+            block_third_party=True,
+            first_party_domains=["linkedin.com", "licdn.com"],
+        ),
+        "apply": NetworkProfile(block_resource_types=["image", "media", "font"], block_domains=list(_TRACKER_DOMAINS)),
+        "post": NetworkProfile(block_resource_types=["media"], block_domains=list(_TRACKER_DOMAINS)),
+    })
+
+class BrowserConfig(BaseModel):
+    engine: Literal["sync", "async"] = "sync"
+    # Attach to a long-lived Chromium (src/browser_daemon.py) over CDP instead of launching one
+    daemon: bool = False
+    daemon_autostart: bool = True
+    daemon_port: int = Field(default=9222, ge=1024, le=65535)
+    daemon_endpoint_file: str = "data/browser_daemon.json"
+    # Per-task request blocking (images, fonts, trackers) on the browser context
+    network: NetworkFilterConfig = Field(default_factory=NetworkFilterConfig)
+
 class DelayRange(BaseModel):
     min: int
     max: int
@@ -59,8 +174,37 @@ class BehaviorConfig(BaseModel):
     typing_delay_ms: DelayRange
     action_delay_seconds: DelayRange
     scroll_simulation: bool = True
+    # Event-driven waits: humanization jitter added after the awaited state is reached
+    wait_jitter_ms: DelayRange = Field(default_factory=lambda: DelayRange(min=300, max=1200))
+    wait_timeout_seconds: int = Field(default=15, ge=1)
     evolution: EvolutionSettings = Field(default_factory=EvolutionSettings)
 
+class PacingBudget(BaseModel):
+    # 0 means unlimited
+    per_minute: int = Field(default=0, ge=0)
+    per_hour: int = Field(default=0, ge=0)
+    per_day: int = Field(default=0, ge=0)
+    gap_seconds: Optional[DelayRange] = None # spacing drawn after each recorded action
+
+class PacingConfig(BaseModel):
+    # Queued idle work only starts when at least this much waiting time is left
+    idle_work_min_window_seconds: int = Field(default=5, ge=0)
+    budgets: Dict[str, PacingBudget] = Field(default_factory=lambda: {
+        "linkedin": PacingBudget(per_minute=30, per_hour=900),
+        "linkedin_apply": PacingBudget(per_hour=20, gap_seconds=DelayRange(min=10, max=20)),
+        "linkedin_outreach": PacingBudget(per_minute=2, per_hour=20, per_day=30, gap_seconds=DelayRange(min=30, max=60)),
+    })
+
+class SchedulerConfig(BaseModel):
+    path: str = "data/scheduler.sqlite3"
+    # Schedule of the standalone `python -m src.moltbook_autonomous` process
+    moltbook_path: str = "data/scheduler_moltbook.sqlite3"
+    search_interval_minutes: int = Field(default=30, ge=1)
+    # Next search cycle once the daily application limit is reached
+    limit_reached_interval_minutes: int = Field(default=240, ge=1)
+    monitor_interval_seconds: int = Field(default=60, ge=10)
+    market_scan_interval_hours: int = Field(default=0, ge=0) # 0 disables the market scan job
+
 class SecurityConfig(BaseModel):
     rotate_user_agent: bool = True
     randomize_sessions: bool = True
@@ -74,9 +218,15 @@ class LoggingConfig(BaseModel):
 class NotificationChannel(BaseModel):
     enabled: bool = False
 
+class TelegramChannel(NotificationChannel):
+    # Chat replies are streamed: first message after the first tokens, then edited in place
+    stream_replies: bool = True
+    stream_edit_interval_seconds: float = Field(default=1.2, ge=0.5) # Telegram throttles fast edits
+    stream_first_chars: int = Field(default=20, ge=1) # text buffered before the first message
+
 class NotificationsConfig(BaseModel):
     email: NotificationChannel = Field(default_factory=NotificationChannel)
-    telegram: NotificationChannel = Field(default_factory=NotificationChannel)
+    telegram: TelegramChannel = Field(default_factory=TelegramChannel)
 
 class Secrets(BaseModel):
     linkedin: Dict[str, str] = Field(default_factory=dict)
@@ -122,10 +272,18 @@ class LinkedInAutomationConfig(BaseModel):
 
 class Settings(BaseModel):
     bot: BotConfig
+    ai: AIConfig = Field(default_factory=AIConfig)
     profile: ProfileConfig
+    search: SearchConfig = Field(default_factory=SearchConfig)
+    scoring: ScoringConfig = Field(default_factory=ScoringConfig)
     resume: ResumeConfig
+    learned_answers: LearnedAnswersConfig = Field(default_factory=LearnedAnswersConfig)
+    conversation: ConversationConfig = Field(default_factory=ConversationConfig)
     platforms: PlatformsConfig
+    browser: BrowserConfig = Field(default_factory=BrowserConfig)
     behavior: BehaviorConfig
+    pacing: PacingConfig = Field(default_factory=PacingConfig)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
     security: SecurityConfig
     logging: LoggingConfig
     notifications: NotificationsConfig
@@ -2,8 +2,9 @@ import logging
 import random
 import datetime
 from typing import Optional, List
-from src.ai_assistant import AIAssistant
+from src.ai_assistant import get_ai_assistant
 from src.config import Settings
+from src.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +13,7 @@ class ContentGenerator:
     
     def __init__(self, config: Settings):
         self.config = config
-        self.ai = AIAssistant(config)
+        self.ai = get_ai_assistant(config)
         self.topics = config.linkedin_automation.daily_posts.topics if hasattr(config, 'linkedin_automation') else [
             "Inteligência Artificial",
             "Carreira e Desenvolvimento",
@@ -98,7 +99,6 @@ class ContentGenerator:
                 return None
             
             # Save image locally
-            import urllib.request
             import os
             
             save_dir = os.path.join("data", "generated_images")
@@ -108,7 +108,10 @@ class ContentGenerator:
             file_path = os.path.abspath(os.path.join(save_dir, f"post_image_{timestamp}.png"))
             
             logger.info(f"Downloading image to {file_path}...")
-            urllib.request.urlretrieve(image_url, file_path)
+            response = get_session().get(image_url, timeout=(5, 60))
+            response.raise_for_status()
+            with open(file_path, "wb") as f:
+                f.write(response.content)
             
             return file_path
         except Exception as e:
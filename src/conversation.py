@@ -0,0 +1,158 @@
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.prompt_builder import count_tokens, truncate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Hard cap on stored turns per chat, in case summaries keep failing
+MAX_STORED_MESSAGES = 200
+
+_store: Optional["ConversationStore"] = None
+_store_lock = threading.Lock()
+
+
+def get_conversation_store(config) -> "ConversationStore":
+    """Returns the process-wide chat context store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ConversationStore(config)
+        return _store
+
+
+class ConversationStore:
+    """
+    Per-chat conversation context, persisted in a JSON file across restarts.
+
+    window() is the history sent with a chat request: the rolling summary (as one
+    system message) followed by the newest turns that fit conversation.window_tokens.
+    Once the stored turns exceed that budget, add() folds the oldest ones into the
+    summary with one AI call on a background thread, so older context survives in a
+    few hundred tokens instead of being resent (or dropped) on every message.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.settings = config.conversation
+        self.path = self.settings.path
+        self._lock = threading.RLock()
+        self._folding: set = set()
+        self.chats: Dict[str, Dict] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.chats = json.load(f)
+                logger.info(f"Loaded conversation context for {len(self.chats)} chats from {self.path}")
+            except Exception as e:
+                logger.error(f"Error loading conversation context: {e}")
+
+    def _chat(self, chat_id: str) -> Dict:
+        return self.chats.setdefault(str(chat_id), {"summary": "", "messages": [], "updated": None})
+
+    def add(self, chat_id: str, role: str, content: str):
+        """Appends one turn; folds old turns into the summary when the history outgrows its budget."""
+        with self._lock:
+            chat = self._chat(chat_id)
+            chat["messages"].append({"role": role, "content": content})
+            del chat["messages"][:-MAX_STORED_MESSAGES]
+            chat["updated"] = datetime.now().isoformat(timespec="seconds")
+            self._save()
+            over_budget = self._tokens(chat["messages"]) > self.settings.window_tokens
+        if over_budget and role == "assistant":
+            self._start_fold(str(chat_id))
+
+    def window(self, chat_id: str) -> List[Dict]:
+        """Summary + newest turns within window_tokens, oldest first."""
+        with self._lock:
+            chat = self._chat(chat_id)
+            summary, messages = chat["summary"], list(chat["messages"])
+
+        recent, used = [], 0
+        for message in reversed(messages):
+            cost = count_tokens(message["content"]) + 4
+            if recent and used + cost > self.settings.window_tokens:
+                break
+            recent.append(message)
+            used += cost
+        recent.reverse()
+        if summary:
+            recent.insert(0, {"role": "system", "content": f"[CONVERSATION SUMMARY]\n{summary}"})
+        return recent
+
+    def clear(self, chat_id: str):
+        with self._lock:
+            self.chats.pop(str(chat_id), None)
+            self._save()
+
+    # ---- rolling summary -----------------------------------------------
+
+    @staticmethod
+    def _tokens(messages: List[Dict]) -> int:
+        return sum(count_tokens(m["content"]) + 4 for m in messages)
+
+    def _start_fold(self, chat_id: str):
+        with self._lock:
+            if chat_id in self._folding:
+                return
+            self._folding.add(chat_id)
+        threading.Thread(target=self._fold, args=(chat_id,), name="ConversationFold", daemon=True).start()
+
+    def _fold(self, chat_id: str):
+        # Imported here: ai_assistant pulls in the HTTP stack, not needed to read the store
+        from src.ai_assistant import get_ai_assistant
+        from src.llm_dispatch import CONTENT
+        try:
+            with self._lock:
+                chat = self._chat(chat_id)
+                messages = chat["messages"]
+                # Fold the oldest turns until what stays verbatim is half the window
+                keep_tokens, cut = self.settings.window_tokens // 2, len(messages)
+                while cut > 0 and self._tokens(messages[cut - 1:]) <= keep_tokens:
+                    cut -= 1
+                # Keep user/assistant pairs together
+                if cut < len(messages) and messages[cut]["role"] == "assistant":
+                    cut += 1
+                old, summary = messages[:cut], chat["summary"]
+            if not old:
+                return
+
+            transcript = "\n".join(f"{m['role']}: {m['content']}" for m in old)
+            system_prompt = (
+                "You maintain the running summary of a chat between a user and their assistant. "
+                "Merge the previous summary with the new turns into one concise summary in the conversation's language. "
+                "Keep facts, decisions, preferences and open requests; drop small talk. "
+                f"Stay under {self.settings.summary_tokens} tokens. Return only the summary."
+            )
+            user_prompt = f"Previous summary:\n{summary or '(none)'}\n\nNew turns:\n{transcript}"
+            new_summary = get_ai_assistant(self.config).ask_gpt(system_prompt, user_prompt, priority=CONTENT)
+            if not new_summary:
+                return # the window still bounds what is sent; retry on the next reply
+
+            with self._lock:
+                chat = self._chat(chat_id)
+                # Turns may have been added meanwhile; only drop the ones that were summarized
+                if chat["messages"][:len(old)] == old:
+                    chat["messages"] = chat["messages"][len(old):]
+                    chat["summary"] = truncate_tokens(new_summary.strip(), self.settings.summary_tokens)
+                    self._save()
+                    logger.info(f"Folded {len(old)} chat turns into the summary for chat {chat_id}.")
+        except Exception as e:
+            logger.warning(f"Could not update conversation summary: {e}")
+        finally:
+            with self._lock:
+                self._folding.discard(chat_id)
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.chats, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving conversation context: {e}")
@@ -6,7 +6,7 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from datetime import datetime
-import requests
+from src.http_client import get_session
 import asyncio
 import subprocess
 
@@ -61,7 +61,7 @@ def get_moltbook_activity():
                 # Fetch recent posts from the agent
                 url = f"https://www.moltbook.com/api/v1/agents/me"
                 headers = {"Authorization": f"Bearer {api_key}"}
-                response = requests.get(url, headers=headers)
+                response = get_session().get(url, headers=headers)
                 return response.json()
     except Exception as e:
         return {"error": str(e)}
@@ -4,7 +4,8 @@ import logging
 import pyautogui
 import subprocess
 import psutil
-from src.ai_assistant import AIAssistant
+from src.ai_assistant import get_ai_assistant
+from src.llm_dispatch import llm_priority, BACKGROUND
 from src.config import Settings
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,7 @@ except (ImportError, Exception):
 class DesktopAgent:
     def __init__(self, config, linkedin_manager=None, message_callback=None):
         self.config = config
-        self.ai = AIAssistant(config)
+        self.ai = get_ai_assistant(config)
         self.linkedin = linkedin_manager  # Now optional/None
         self.moltbook = MoltbookBot() # Initialize MoltbookBot
         self.lighting = LightingController()
@@ -301,6 +302,11 @@ class DesktopAgent:
         return "🛑 Autonomous Mode STOPPED."
 
     def _autonomous_cycle(self, message_callback):
+        # Thinking here yields to chat, apply and scoring AI calls and is shed first under load
+        with llm_priority(BACKGROUND):
+            self._run_autonomous_cycle(message_callback)
+
+    def _run_autonomous_cycle(self, message_callback):
         logger.info("Autonomous Loop Started")
         
         # Keep track of last 5 actions to avoid repetition
@@ -1,14 +1,14 @@
 import logging
 import os
 from src.config import Settings
-from src.ai_assistant import AIAssistant
+from src.ai_assistant import get_ai_assistant
 
 logger = logging.getLogger(__name__)
 
 class EntrepreneurAgent:
     def __init__(self, config: Settings):
         self.config = config
-        self.ai = AIAssistant(config)
+        self.ai = get_ai_assistant(config)
         self.ideas_file = "data/ideas.md"
         self._ensure_file_exists()
 
@@ -1,7 +1,7 @@
 import os
 import logging
 import glob
-from src.ai_assistant import AIAssistant
+from src.ai_assistant import get_ai_assistant
 from src.config import Settings
 from src.safety_net import SafetyNet
 
@@ -14,7 +14,7 @@ class GrowthEngine:
     """
     def __init__(self, config: Settings):
         self.config = config
-        self.ai = AIAssistant(config)
+        self.ai = get_ai_assistant(config)
         self.safety = SafetyNet()
         self.src_dir = os.path.join(os.getcwd(), "src")
 
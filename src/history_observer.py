@@ -3,9 +3,9 @@ import sqlite3
 import shutil
 import logging
 import json
-import requests
 from datetime import datetime, timedelta
 from src.config import load_config
+from src.http_client import get_session
 
 logger = logging.getLogger("HistoryObserver")
 
@@ -98,7 +98,7 @@ class HistoryObserver:
         
         try:
             logger.info("Synthesizing user knowledge with OpenAI...")
-            response = requests.post(url, headers=headers, json=data)
+            response = get_session().post(url, headers=headers, json=data, timeout=(5, 60))
             insights = response.json()["choices"][0]["message"]["content"]
             self._save_knowledge(insights)
             logger.info("User knowledge updated successfully.")
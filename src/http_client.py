@@ -0,0 +1,81 @@
+import logging
+import threading
+from typing import Dict, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) seconds applied to every request that doesn't pass its own timeout
+DEFAULT_TIMEOUT: Tuple[float, float] = (5, 30)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Statuses that mean the server did not act on the request, so even a POST can be replayed.
+# A 500/502/504 on a POST may arrive after the post or message was already created.
+POST_RETRY_STATUSES = (429, 503)
+
+_sessions: Dict[bool, requests.Session] = {} # status_retries -> session
+_session_lock = threading.Lock()
+
+
+class _PooledSession(requests.Session):
+    """requests.Session that applies a default timeout to every call."""
+
+    def __init__(self, timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT):
+        super().__init__()
+        self.default_timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+class _Retry(Retry):
+    """Retry that replays non-idempotent methods (POST, PATCH) only on POST_RETRY_STATUSES."""
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        idempotent = getattr(Retry, "DEFAULT_ALLOWED_METHODS", None) or Retry.DEFAULT_METHOD_WHITELIST
+        if method.upper() not in idempotent and status_code not in POST_RETRY_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _build_retry(status_retries: bool = True) -> Retry:
+    options = dict(
+        total=3,
+        connect=3,
+        read=0,  # never replay a request the server may already have processed
+        status=3 if status_retries else 0,
+        status_forcelist=RETRY_STATUSES if status_retries else (),
+        allowed_methods=None,  # narrowed per status by _Retry.is_retry
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # hand the final 429/5xx back so callers can react to it
+    )
+    try:
+        return _Retry(backoff_jitter=0.5, **options)
+    except TypeError:
+        # urllib3 < 2 has no jitter support
+        return _Retry(**options)
+
+
+def get_session(status_retries: bool = True) -> requests.Session:
+    """
+    Returns a process-wide HTTP session.
+    Keep-alive connections are pooled per host, every request gets DEFAULT_TIMEOUT
+    unless it passes its own, and 429/5xx responses are retried with jittered
+    exponential backoff (honouring Retry-After). POSTs are only retried on 429/503,
+    so a post or message the server already created is never sent twice.
+    status_retries=False gives a session that only retries failed connections, for
+    clients with their own 429 handling (the OpenAI rate limiter must see every 429).
+    """
+    with _session_lock:
+        if status_retries not in _sessions:
+            session = _PooledSession()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_build_retry(status_retries))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[status_retries] = session
+            logger.debug(f"Shared HTTP session initialized (status retries: {status_retries}).")
+        return _sessions[status_retries]
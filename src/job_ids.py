@@ -0,0 +1,70 @@
+import re
+from typing import Optional
+from urllib.parse import urlsplit, parse_qs, parse_qsl, urlencode
+
+# /jobs/view/4366473919 or /jobs/view/estagio-administrativo-at-renault-4366473919
+_VIEW_ID_RE = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d{6,})(?:[/?#]|$)")
+_DIGITS_RE = re.compile(r"^\d{6,}$")
+
+# Query parameters that identify a posting on other boards (Indeed: /rc/clk?jk=, /viewjob?jk=)
+_ID_PARAMS = {"jk": "indeed", "vjk": "indeed"}
+# Per-click/session parameters that differ between links to the same posting
+_TRACKING_PARAMS = frozenset({
+    "trk", "trackingid", "refid", "position", "pagenum", "from", "tk", "bb", "xkcb", "sjdu", "advn",
+    "fccid", "vjs", "gclid", "fbclid", "sid", "src", "ref",
+})
+
+
+def extract_job_id(link: Optional[str], data_job_id: Optional[str] = None) -> Optional[str]:
+    """
+    Returns the numeric LinkedIn job ID for a card.
+    Prefers the card's data-job-id attribute, then the /jobs/view/ path, then ?currentJobId=.
+    """
+    if data_job_id and _DIGITS_RE.match(str(data_job_id).strip()):
+        return str(data_job_id).strip()
+    if not link:
+        return None
+    link = str(link).strip()
+    if _DIGITS_RE.match(link):
+        return link
+
+    match = _VIEW_ID_RE.search(link)
+    if match:
+        return match.group(1)
+
+    query = parse_qs(urlsplit(link).query)
+    for param in ("currentJobId", "jobId"):
+        value = (query.get(param) or [""])[0]
+        if _DIGITS_RE.match(value):
+            return value
+    return None
+
+
+def canonical_job_link(job_id: str) -> str:
+    """Tracking-free URL for a LinkedIn job posting."""
+    return f"https://www.linkedin.com/jobs/view/{job_id}/"
+
+
+def job_key(link: Optional[str], data_job_id: Optional[str] = None) -> str:
+    """
+    Dedup key for a job: the LinkedIn job ID when one can be found, then a known
+    ID parameter of another board (Indeed's jk), otherwise the link without its
+    fragment and tracking parameters. The rest of the query string is kept because
+    some boards identify postings only there.
+    """
+    job_id = extract_job_id(link, data_job_id)
+    if job_id:
+        return f"linkedin:{job_id}"
+    if not link:
+        return ""
+    parts = urlsplit(str(link).strip())
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    for name, value in params:
+        if name.lower() in _ID_PARAMS and value:
+            return f"{_ID_PARAMS[name.lower()]}:{value}"
+    query = urlencode(sorted(
+        (name, value) for name, value in params
+        if not name.lower().startswith("utm_") and name.lower() not in _TRACKING_PARAMS
+    ))
+    base = f"{parts.scheme}://{parts.netloc}{parts.path}".rstrip("/")
+    return f"{base}?{query}" if query else base
@@ -0,0 +1,250 @@
+import os
+import time
+import sqlite3
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_scheduler: Optional["JobScheduler"] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler(path: str = "data/scheduler.sqlite3") -> "JobScheduler":
+    """Returns the process-wide scheduler (Telegram commands reach jobs through it)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = JobScheduler(path)
+        return _scheduler
+
+
+class IntervalTrigger:
+    """Runs every `seconds` after the previous run."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def next_after(self, ts: float) -> float:
+        return ts + self.seconds
+
+    def __str__(self) -> str:
+        return f"every {int(self.seconds // 60)} min" if self.seconds >= 60 else f"every {int(self.seconds)} s"
+
+
+class DailyTrigger:
+    """Runs at fixed wall-clock times ("HH:MM") every day, like a cron `M H * * *` line per time."""
+
+    def __init__(self, times: List[str]):
+        self.times = sorted({datetime.strptime(t, "%H:%M").time() for t in times})
+        if not self.times:
+            raise ValueError("DailyTrigger needs at least one HH:MM time")
+
+    def next_after(self, ts: float) -> float:
+        now = datetime.fromtimestamp(ts)
+        for day in (now.date(), now.date() + timedelta(days=1)):
+            for t in self.times:
+                candidate = datetime.combine(day, t)
+                if candidate > now:
+                    return candidate.timestamp()
+        raise AssertionError("unreachable")
+
+    def __str__(self) -> str:
+        return "daily at " + ", ".join(t.strftime("%H:%M") for t in self.times)
+
+
+class AnyTrigger:
+    """Fires at whichever of its triggers comes first (e.g. hourly plus fixed daily slots)."""
+
+    def __init__(self, *triggers):
+        self.triggers = triggers
+
+    def next_after(self, ts: float) -> float:
+        return min(t.next_after(ts) for t in self.triggers)
+
+    def __str__(self) -> str:
+        return " + ".join(str(t) for t in self.triggers)
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    func: Callable
+    trigger: object
+    catch_up: bool = True
+    background: bool = False
+    next_run: float = 0.0
+    running: bool = False
+    thread: Optional[threading.Thread] = field(default=None, repr=False)
+
+
+class JobScheduler:
+    """
+    Single-process scheduler for the bot's recurring work.
+
+    Jobs have interval or daily-time triggers and their next run time is persisted in
+    SQLite, so a restart resumes the schedule instead of starting over. A run that was
+    missed while the process was down is executed once on startup when catch_up is set
+    (several missed runs coalesce into one), otherwise skipped to the next slot.
+    The due-time loop runs on its own thread and never executes a job itself:
+    foreground jobs are queued to the thread calling run_forever() (the one owning
+    the Playwright page), which runs them one at a time, and background jobs get their
+    own thread. So a long search cycle never delays the monitor, the Moltbook slots or
+    a Telegram /run. run_now() makes a job due immediately and wakes the loop.
+    A job returning a number of seconds overrides its trigger for the next run.
+    """
+
+    def __init__(self, path: str = "data/scheduler.sqlite3"):
+        self.path = path
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._foreground: deque = deque() # due foreground jobs waiting for the page-owning thread
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                name TEXT PRIMARY KEY,
+                next_run REAL NOT NULL,
+                last_run REAL,
+                last_status TEXT,
+                last_duration REAL,
+                runs INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self.conn.commit()
+
+    def add_job(self, name: str, func: Callable, trigger, catch_up: bool = True,
+                background: bool = False, run_first: bool = False):
+        """
+        Registers a job, restoring its persisted next run time if there is one.
+        run_first runs a job that has never been scheduled right away instead of after one trigger period.
+        """
+        now = time.time()
+        job = ScheduledJob(name, func, trigger, catch_up=catch_up, background=background)
+        with self._cond:
+            row = self.conn.execute("SELECT next_run FROM jobs WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                job.next_run = now if run_first else trigger.next_after(now)
+            elif row[0] <= now:
+                job.next_run = now if catch_up else trigger.next_after(now)
+                logger.info(f"Scheduler: '{name}' missed its run at {datetime.fromtimestamp(row[0]):%Y-%m-%d %H:%M}"
+                            f" ({'catching up now' if catch_up else 'skipped'}).")
+            else:
+                job.next_run = row[0]
+            self.jobs[name] = job
+            self._persist(job)
+            self._cond.notify_all()
+        logger.info(f"Scheduler: '{name}' registered ({trigger}), next run {datetime.fromtimestamp(job.next_run):%Y-%m-%d %H:%M}.")
+
+    def run_now(self, name: str) -> bool:
+        """Makes a job due immediately. False if no such job is registered."""
+        with self._cond:
+            job = self.jobs.get(name)
+            if not job:
+                return False
+            job.next_run = time.time()
+            self._persist(job)
+            self._cond.notify_all()
+        return True
+
+    def summary(self) -> List[Dict]:
+        with self._cond:
+            rows = {r[0]: r[1:] for r in self.conn.execute("SELECT name, last_run, last_status FROM jobs")}
+            return [
+                {
+                    "name": job.name,
+                    "trigger": str(job.trigger),
+                    "next_run": datetime.fromtimestamp(job.next_run),
+                    "last_run": datetime.fromtimestamp(rows[job.name][0]) if rows.get(job.name, (None,))[0] else None,
+                    "last_status": rows.get(job.name, (None, None))[1],
+                    "running": job.running,
+                }
+                for job in sorted(self.jobs.values(), key=lambda j: j.next_run)
+            ]
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def run_forever(self):
+        """
+        Runs jobs until stop() is called. The calling thread becomes the foreground
+        worker; due times are tracked by a separate loop thread.
+        """
+        threading.Thread(target=self._loop, name="scheduler", daemon=True).start()
+        while True:
+            with self._cond:
+                while not self._foreground and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                job = self._foreground.popleft()
+            self._execute(job)
+
+    def _loop(self):
+        """Hands each job to its runner as it falls due, sleeping until the next one or a run_now()."""
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                due = self._next_due()
+                if due is None or due.next_run > time.time():
+                    timeout = None if due is None else due.next_run - time.time()
+                    self._cond.wait(timeout=timeout)
+                    continue
+                due.running = True
+                if not due.background:
+                    self._foreground.append(due)
+                    self._cond.notify_all()
+                    continue
+
+            due.thread = threading.Thread(target=self._execute, args=(due,), name=f"job-{due.name}", daemon=True)
+            due.thread.start()
+
+    def _next_due(self) -> Optional[ScheduledJob]:
+        idle = [job for job in self.jobs.values() if not job.running]
+        return min(idle, key=lambda j: j.next_run) if idle else None
+
+    def _execute(self, job: ScheduledJob):
+        started = time.time()
+        logger.info(f"Scheduler: running '{job.name}'.")
+        status, override = "ok", None
+        try:
+            result = job.func()
+            if isinstance(result, (int, float)) and not isinstance(result, bool):
+                override = float(result)
+        except Exception as e:
+            status = f"error: {e}"
+            logger.error(f"Scheduler: job '{job.name}' failed: {e}")
+
+        finished = time.time()
+        with self._cond:
+            job.running = False
+            # A run_now() that arrived while the job was running is kept
+            if job.next_run <= started:
+                job.next_run = finished + override if override is not None else job.trigger.next_after(finished)
+            self._persist(job, last_run=started, status=status, duration=finished - started)
+            self._cond.notify_all()
+        logger.info(f"Scheduler: '{job.name}' {status} in {finished - started:.0f}s; next run {datetime.fromtimestamp(job.next_run):%Y-%m-%d %H:%M}.")
+
+    def _persist(self, job: ScheduledJob, last_run: float = None, status: str = None, duration: float = None):
+        if last_run is None:
+            self.conn.execute(
+                "INSERT INTO jobs (name, next_run) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET next_run = excluded.next_run",
+                (job.name, job.next_run)
+            )
+        else:
+            self.conn.execute(
+                "UPDATE jobs SET next_run = ?, last_run = ?, last_status = ?, last_duration = ?, runs = runs + 1 WHERE name = ?",
+                (job.next_run, last_run, status, duration, job.name)
+            )
+        self.conn.commit()
@@ -1,28 +1,95 @@
 import logging
 import time
 import random
-from typing import List, Dict
+from typing import List, Dict, Optional
 from playwright.sync_api import sync_playwright, Page, BrowserContext
 
 from src.config import Settings
+from src.job_ids import extract_job_id, canonical_job_link
+from src.keyword_matcher import get_matcher
+from src.network_filter import get_network_filter
+from src.storage import Storage
 
 logger = logging.getLogger(__name__)
 
+# Scrolls each card into view so LinkedIn renders the occluded ones (single round-trip)
+_RENDER_CARDS_JS = """
+async (cards) => {
+    for (const card of cards) {
+        card.scrollIntoView({block: 'center'});
+        await new Promise(r => setTimeout(r, 40));
+    }
+}
+"""
+
+# Reads every card at once: [{title, company, location, link, jobId}, ...]
+_EXTRACT_CARDS_JS = """
+(cards, sel) => {
+    const text = (root, selector) => {
+        const el = root.querySelector(selector);
+        if (!el) return null;
+        const line = (el.innerText || el.textContent || '').split('\\n').map(t => t.trim()).find(t => t);
+        return line || null;
+    };
+    return cards.map(card => {
+        const linkEl = card.querySelector(sel.link);
+        const idEl = card.matches('[data-job-id], [data-occludable-job-id]')
+            ? card
+            : card.querySelector('[data-job-id], [data-occludable-job-id]');
+        return {
+            title: text(card, sel.title),
+            company: text(card, sel.company),
+            location: text(card, sel.location),
+            link: linkEl ? linkEl.getAttribute('href') : null,
+            jobId: idEl ? (idEl.getAttribute('data-job-id') || idEl.getAttribute('data-occludable-job-id')) : null
+        };
+    });
+}
+"""
+
+# Scrolls both the window and the results pane so infinite-scroll loads fire
+_SCROLL_RESULTS_JS = """
+() => {
+    window.scrollTo(0, document.body.scrollHeight);
+    const pane = document.querySelector('.jobs-search-results-list, .scaffold-layout__list');
+    if (pane) pane.scrollTop = pane.scrollHeight;
+}
+"""
+
 class JobSearcher:
-    def __init__(self, config: Settings):
+    def __init__(self, config: Settings, storage: Optional[Storage] = None):
         self.config = config
+        self.storage = storage
         self.results: List[Dict] = []
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
+        self.engine = None
+        self.attached = False # True when connected to the shared browser daemon
+        self.network = get_network_filter(config)
 
     def start_browser(self):
         """Starts the Playwright browser with a persistent context and stealth measures."""
         from playwright_stealth import Stealth
         import os
         import shutil
-        
+
+        from src.browser_daemon import read_endpoint
+
+        # Must come before the lock cleanup below: the daemon holds the same profile
+        if self.config.browser.daemon and self.config.browser.engine == "sync" and self._attach_to_daemon():
+            return
+
+        # A live daemon owns browser_profile. Removing its SingletonLock and launching a second
+        # Chromium on it risks corrupting the profile, and the taskkill retry would kill the daemon.
+        endpoint = read_endpoint(self.config)
+        if endpoint:
+            raise RuntimeError(
+                f"Browser daemon (pid {endpoint.get('pid')}) is using browser_profile and could not be attached to. "
+                "Stop it or set browser.daemon: true with the sync engine."
+            )
+
         # Use a persistent user data directory to save sessions/cookies
         profile_path = os.path.abspath("browser_profile")
         
@@ -34,6 +101,19 @@ class JobSearcher:
                 os.remove(lock_file)
             except Exception as e:
                 logger.warning(f"Could not remove lock file: {e}. Browser might still be running.")
+
+        if self.config.browser.engine == "async":
+            # Async Playwright on its own event loop; self.page/self.context are blocking facades
+            from src.browser_engine import AsyncBrowserEngine
+            self.engine = AsyncBrowserEngine(self.config)
+            self.page = self.engine.start(
+                profile_path,
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+                viewport={'width': 1280, 'height': 720}
+            )
+            self.context = self.page.context
+            self.network.install(self.context)
+            return
         
         self.playwright = sync_playwright().start()
         
@@ -58,6 +138,9 @@ class JobSearcher:
                 )
             else:
                 raise
+
+        # Route before any page loads so the first navigation is already filtered
+        self.network.install(self.context)
         
         # Open a new page and navigate to Google to avoid blank screen
         self.page = self.context.new_page()
@@ -74,19 +157,78 @@ class JobSearcher:
         logger.info(f"Browser started with persistent profile at: {profile_path}")
 
 
+    def _attach_to_daemon(self) -> bool:
+        """Attaches to the shared browser daemon over CDP, opening this client's own tab in its warm context."""
+        from playwright_stealth import Stealth
+        from src.browser_daemon import ensure_daemon
+
+        endpoint = ensure_daemon(self.config)
+        if not endpoint:
+            logger.info("Browser daemon unavailable. Launching a local browser instead.")
+            return False
+
+        self.playwright = sync_playwright().start()
+        try:
+            self.browser = self.playwright.chromium.connect_over_cdp(endpoint["cdp_url"])
+            self.context = self.browser.contexts[0]
+            self.page = self.context.new_page()
+            Stealth().apply_stealth_sync(self.page)
+            # The daemon's context is shared with other clients, so only our own tabs are routed
+            self.network.install(self.context, page=self.page)
+        except Exception as e:
+            logger.error(f"Could not attach to browser daemon: {e}")
+            self.playwright.stop()
+            self.playwright = self.browser = self.context = self.page = None
+            return False
+
+        self.attached = True
+        logger.info(f"Attached to browser daemon at {endpoint['cdp_url']} (pid {endpoint.get('pid')}).")
+        return True
+
     def stop_browser(self):
-        """Stops the browser."""
+        """Stops the browser (or only detaches when it belongs to the browser daemon)."""
+        if self.network.settings.enabled:
+            logger.info(f"Network filter: {self.network.summary()}")
+        if self.attached:
+            # Close our tab and drop the CDP connection; the daemon keeps the browser warm
+            try:
+                if self.page:
+                    self.page.close()
+            except Exception:
+                pass
+            self.playwright.stop()
+            self.playwright = self.browser = None
+            self.attached = False
+            logger.info("Detached from browser daemon.")
+            return
+        if self.engine:
+            self.engine.stop()
+            self.engine = None
         if self.browser:
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
         logger.info("Browser stopped.")
 
+    def _build_search_url(self, keywords_query: str, location_query: str, start: int = 0) -> str:
+        # LinkedIn Job Search URL 
+        # f_TPR=r604800: Last Week
+        # f_AL=true: Easy Apply Only
+        # f_E=1%2C2: Experience Levels (1: Internship, 2: Entry Level)
+        url = f"https://www.linkedin.com/jobs/search?keywords={keywords_query}&location={location_query}&f_TPR=r604800&f_AL=true&f_E=1%2C2"
+        if start:
+            url += f"&start={start}"
+        return url
+
     def search_linkedin(self, keywords: List[str] = None):
         """
         Searches for jobs on LinkedIn.
         If keywords are provided, uses them. Otherwise, picks 2 random ones from config.
         """
+        with self.network.use("scrape"):
+            return self._search_linkedin(keywords)
+
+    def _search_linkedin(self, keywords: List[str] = None):
         self.results = [] # Clear previous results
         import urllib.parse
         
@@ -102,11 +244,7 @@ class JobSearcher:
             
         location_query = urllib.parse.quote(self.config.profile.locations[0] if self.config.profile.locations else "Brazil")
         
-        # LinkedIn Job Search URL 
-        # f_TPR=r604800: Last Week
-        # f_AL=true: Easy Apply Only
-        # f_E=1%2C2: Experience Levels (1: Internship, 2: Entry Level)
-        url = f"https://www.linkedin.com/jobs/search?keywords={keywords_query}&location={location_query}&f_TPR=r604800&f_AL=true&f_E=1%2C2"
+        url = self._build_search_url(keywords_query, location_query)
         
         logger.info(f"Navigating to LinkedIn Search: {url}")
         self.page.goto(url)
@@ -117,6 +255,86 @@ class JobSearcher:
             self.page.evaluate("window.scrollBy(0, 500)")
             time.sleep(random.uniform(1, 2))
 
+        cards = self._extract_page_cards()
+        self.results = self._filter_cards(cards, set())
+        return self.results
+
+    def crawl_linkedin(self, max_results: Optional[int] = None) -> List[Dict]:
+        """
+        Crawler mode: walks every include keyword x location combination, following
+        infinite-scroll loads and start= pagination until the per-run budget is spent.
+        A query is abandoned as soon as one of its pages only yields already-known job IDs.
+        """
+        with self.network.use("scrape"):
+            return self._crawl_linkedin(max_results)
+
+    def _crawl_linkedin(self, max_results: Optional[int] = None) -> List[Dict]:
+        import urllib.parse
+
+        crawl = self.config.search
+        budget = max_results or crawl.max_results_per_run
+        keywords = self.config.profile.keywords.include or [self.config.profile.role]
+        locations = self.config.profile.locations or ["Brazil"]
+
+        self.results = []
+        seen_ids = set()
+
+        for keyword in keywords:
+            for location in locations:
+                keywords_query = urllib.parse.quote(keyword)
+                location_query = urllib.parse.quote(location)
+                start = 0
+
+                for page_num in range(crawl.max_pages_per_query):
+                    url = self._build_search_url(keywords_query, location_query, start)
+                    logger.info(f"Crawling LinkedIn [{keyword} @ {location}] page {page_num + 1}: {url}")
+                    self.page.goto(url)
+                    time.sleep(random.uniform(2, 4))
+
+                    self._load_more_cards(crawl.scroll_loads_per_page)
+                    cards = self._extract_page_cards()
+                    if not cards:
+                        break
+
+                    unknown = [c for c in cards if not self._is_known_card(c, seen_ids)]
+                    jobs = self._filter_cards(cards, seen_ids)
+                    self.results.extend(jobs[:budget - len(self.results)])
+
+                    if len(self.results) >= budget:
+                        logger.info(f"Crawl budget of {budget} jobs reached.")
+                        return self.results
+                    if not unknown:
+                        logger.info(f"Page {page_num + 1} only had known jobs. Moving to next query.")
+                        break
+
+                    start += len(cards)
+
+        logger.info(f"Crawl finished with {len(self.results)} new jobs.")
+        return self.results
+
+    def _load_more_cards(self, max_loads: int):
+        """Scrolls the result list (and clicks 'See more jobs') until no new cards appear."""
+        container = "ul.jobs-search__results-list li, li[data-occludable-job-id], div.job-card-container"
+        for _ in range(max_loads):
+            previous = self.page.locator(container).count()
+            self.page.evaluate(_SCROLL_RESULTS_JS)
+            try:
+                more_btn = self.page.locator("button.infinite-scroller__show-more-button").first
+                if more_btn.is_visible():
+                    more_btn.click()
+            except Exception:
+                pass
+            try:
+                self.page.wait_for_function(
+                    "([sel, n]) => document.querySelectorAll(sel).length > n",
+                    arg=[container, previous],
+                    timeout=4000
+                )
+            except Exception:
+                break
+
+    def _extract_page_cards(self) -> List[Dict]:
+        """Extracts every job card on the current results page as raw dicts."""
         # Extract Job Cards
         # We try multiple selectors to handle both Guest and Logged-in states
         
@@ -170,57 +388,66 @@ class JobSearcher:
 
         logger.info(f"Found {count} job cards.")
 
-        for i in range(min(count, 15)): 
-            try:
-                card = job_cards.nth(i)
-                card.scroll_into_view_if_needed()
-                
-                title_elem = card.locator(sel["title"]).first
-                company_elem = card.locator(sel["company"]).first
-                location_elem = card.locator(sel["location"]).first
-                
-                title = title_elem.inner_text().strip() if title_elem.is_visible() else "Unknown Title"
-                company = company_elem.inner_text().strip() if company_elem.is_visible() else "Unknown Company"
-                location_text = location_elem.inner_text().strip() if location_elem.is_visible() else "Unknown Location"
-                
-                # Link handles differently for auth vs guest
-                link = None
-                if is_logged_in:
-                    link_elem = card.locator(sel["link"]).first
-                    if link_elem.is_visible():
-                        link = link_elem.get_attribute("href")
-                        if link and link.startswith("/"):
-                            link = "https://www.linkedin.com" + link
-                else:
-                    link_elem = card.locator(sel["link"])
-                    if link_elem.is_visible():
-                        link = link_elem.get_attribute("href")
+        # Render every card (LinkedIn occludes off-screen ones), then read them all in one evaluation
+        try:
+            job_cards.evaluate_all(_RENDER_CARDS_JS)
+            return job_cards.evaluate_all(_EXTRACT_CARDS_JS, sel)
+        except Exception as e:
+            logger.warning(f"Bulk card extraction failed: {e}")
+            return []
 
-                if not link or "Unknown" in title:
-                    logger.debug(f"Card {i} incomplete: Title={title}, Link={link}. Skipping.")
-                    continue
+    def _is_known_card(self, card: Dict, seen_ids: set) -> bool:
+        """True if the card's job was already seen this run or is already in storage."""
+        job_id = extract_job_id(card.get("link"), card.get("jobId"))
+        if not job_id:
+            return False
+        return job_id in seen_ids or bool(self.storage and self.storage.is_already_applied(None, job_id))
 
-                job_data = {
-                    "platform": "LinkedIn",
-                    "title": title,
-                    "company": company,
-                    "location": location_text,
-                    "link": link
-                }
-                
-                # Basic Keyword Filter (Exclude)
-                if any(ex.lower() in title.lower() for ex in self.config.profile.keywords.exclude):
-                    logger.info(f"Skipping {title} (Exclude keyword match)")
+    def _filter_cards(self, cards: List[Dict], seen_ids: set) -> List[Dict]:
+        """Turns raw extracted cards into job records, dropping duplicates, known jobs and excluded titles."""
+        jobs = []
+        for i, card in enumerate(cards):
+            link = card.get("link")
+            if link and link.startswith("/"):
+                link = "https://www.linkedin.com" + link
+
+            # Dedup on the canonical job ID
+            job_id = extract_job_id(link, card.get("jobId"))
+            if job_id:
+                if job_id in seen_ids:
                     continue
+                seen_ids.add(job_id)
+                if self.storage and self.storage.is_already_applied(link, job_id):
+                    logger.debug(f"Card {i} is job {job_id}, already processed. Skipping.")
+                    continue
+                link = canonical_job_link(job_id)
 
-                logger.info(f"Successfully extracted: {title} at {company}")
-                self.results.append(job_data)
-                
-            except Exception as e:
-                logger.debug(f"Error extracting card {i}: {e}")
-                pass
+            title = card.get("title") or "Unknown Title"
+            company = card.get("company") or "Unknown Company"
+            location_text = card.get("location") or "Unknown Location"
 
-        return self.results
+            if not link or "Unknown" in title:
+                logger.debug(f"Card {i} incomplete: Title={title}, Link={link}. Skipping.")
+                continue
+
+            job_data = {
+                "platform": "LinkedIn",
+                "title": title,
+                "company": company,
+                "location": location_text,
+                "link": link,
+                "job_id": job_id
+            }
+
+            # Basic Keyword Filter (Exclude)
+            if get_matcher(self.config).is_excluded(title):
+                logger.info(f"Skipping {title} (Exclude keyword match)")
+                continue
+
+            logger.info(f"Successfully extracted: {title} at {company}")
+            jobs.append(job_data)
+
+        return jobs
 
     def check_for_captcha(self, platform: str):
         """Checks if a CAPTCHA or security challenge is visible and notifies the user."""
@@ -305,7 +532,10 @@ class JobSearcher:
         try:
             self.start_browser()
             if self.config.platforms.linkedin.enabled:
-                all_jobs.extend(self.search_linkedin())
+                if self.config.search.mode == "crawl":
+                    all_jobs.extend(self.crawl_linkedin())
+                else:
+                    all_jobs.extend(self.search_linkedin())
             return all_jobs
         except Exception as e:
             logger.error(f"Job search failed: {e}")
@@ -0,0 +1,77 @@
+import re
+import logging
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Removes accents and converts to lowercase."""
+    if not text:
+        return ""
+    # Normalize to NFD (decomposed) and filter out non-spacing marks (accents)
+    nfkd_form = unicodedata.normalize('NFKD', str(text))
+    return "".join([c for c in nfkd_form if not unicodedata.combining(c)]).lower()
+
+
+class KeywordHits(NamedTuple):
+    include: List[str]
+    exclude: List[str]
+
+
+class KeywordMatcher:
+    """
+    Include/exclude keyword lists compiled into a single regex.
+
+    Keywords and texts are accent-folded and lowercased, so "Estágio" matches "estagio".
+    A keyword must start at a word boundary but may run into a longer word, keeping
+    inflections ("analista" hits "analistas") while "ti" no longer hits "atividades".
+    """
+
+    def __init__(self, include: Tuple[str, ...], exclude: Tuple[str, ...]):
+        self._owners: Dict[str, List[Tuple[str, str]]] = {}
+        for kind, keywords in (("include", include), ("exclude", exclude)):
+            for kw in keywords:
+                folded = " ".join(normalize_text(kw).split())
+                if folded:
+                    self._owners.setdefault(folded, []).append((kind, kw))
+
+        if self._owners:
+            # Longest first so "analista de dados" wins over "analista" at the same position
+            alternation = "|".join(re.escape(kw).replace(r"\ ", r"\s+") for kw in sorted(self._owners, key=len, reverse=True))
+            self._pattern = re.compile(rf"(?<![a-z0-9])(?=({alternation}))")
+        else:
+            self._pattern = None
+
+    def match(self, *texts: str) -> KeywordHits:
+        """Returns the configured keywords (original spelling) found in any of the texts, in one pass."""
+        hits = KeywordHits([], [])
+        if self._pattern is None:
+            return hits
+        haystack = normalize_text("\n".join(t for t in texts if t))
+        seen = set()
+        for m in self._pattern.finditer(haystack):
+            folded = " ".join(m.group(1).split())
+            if folded in seen:
+                continue
+            seen.add(folded)
+            for kind, kw in self._owners.get(folded, []):
+                getattr(hits, kind).append(kw)
+        return hits
+
+    def is_excluded(self, *texts: str) -> bool:
+        return bool(self.match(*texts).exclude)
+
+
+@lru_cache(maxsize=8)
+def _build_matcher(include: Tuple[str, ...], exclude: Tuple[str, ...]) -> KeywordMatcher:
+    logger.debug(f"Compiling keyword matcher ({len(include)} include, {len(exclude)} exclude).")
+    return KeywordMatcher(include, exclude)
+
+
+def get_matcher(config) -> KeywordMatcher:
+    """Returns the matcher for the profile keywords; recompiled only when the lists in settings change."""
+    keywords = config.profile.keywords
+    return _build_matcher(tuple(keywords.include), tuple(keywords.exclude))
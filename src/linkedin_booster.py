@@ -3,6 +3,7 @@ import random
 import time
 from datetime import datetime
 from src.linkedin_manager import LinkedInManager
+from src.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -51,8 +52,7 @@ class LinkedInBooster:
         if image_url:
             # Download the image to a temp file
             try:
-                import requests
-                response = requests.get(image_url)
+                response = get_session().get(image_url, timeout=(5, 60))
                 if response.status_code == 200:
                     image_path = f"data/temp_post_image_{int(time.time())}.png"
                     with open(image_path, "wb") as f:
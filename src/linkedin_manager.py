@@ -5,7 +5,8 @@ from typing import Optional, List, Dict
 from playwright.sync_api import Page
 from src.config import Settings
 from src.behavior import HumanBehavior
-from src.ai_assistant import AIAssistant
+from src.ai_assistant import get_ai_assistant
+from src.network_filter import get_network_filter
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +15,7 @@ class LinkedInManager:
         self.page = page
         self.config = config
         self.behavior = HumanBehavior(page, config)
-        self.ai = AIAssistant(config)
+        self.ai = get_ai_assistant(config)
 
     def check_and_accept_popups(self):
         """Proactively checks for and clicks 'Accept', 'OK', 'Agree' buttons."""
@@ -83,12 +84,16 @@ class LinkedInManager:
 
     def create_post(self, content: str, image_path: Optional[str] = None) -> bool:
         """Navigates to LinkedIn and publishes a post with an optional image."""
+        with get_network_filter(self.config).use("post"):
+            return self._create_post(content, image_path)
 
+    def _create_post(self, content: str, image_path: Optional[str] = None) -> bool:
         try:
             logger.info("Starting post creation on LinkedIn...")
             self.page.goto("https://www.linkedin.com/feed/", wait_until="networkidle", timeout=60000)
             self.page.bring_to_front()
-            self.behavior.random_delay(8, 12) 
+            # Feed is loaded; wait for it to stop re-rendering rather than a fixed 8-12s
+            self.behavior.wait_for_dom_settle("main", quiet_ms=800)
             
             # Autonomy: Clear any initial popups
             self.check_and_accept_popups()
@@ -145,7 +150,8 @@ class LinkedInManager:
             logger.info("Found post trigger. Clicking...")
             post_trigger.hover()
             post_trigger.click(force=True)
-            self.behavior.random_delay(3, 5)
+            if self.behavior.wait_for_selector("div[role='dialog'], .artdeco-modal"):
+                self.behavior.wait_for_dom_settle("div[role='dialog']")
 
 
             # 2. Wait for the modal/dialog
@@ -223,9 +229,10 @@ class LinkedInManager:
                     logger.warning(f"Button '{btn_text}' is disabled. Waiting...")
                     self.behavior.random_delay(2, 4)
 
+                step = self.behavior.modal_signature()
                 action_btn.click()
                 logger.info(f"Clicked '{btn_text}'")
-                self.behavior.random_delay(2, 3)
+                self.behavior.wait_for_modal_change(step)
 
                 # If the button we clicked was 'Post' or 'Publicar', we are done
                 if any(t in btn_text.lower() for t in ["post", "publicar", "enviar"]):
@@ -270,7 +277,7 @@ class LinkedInManager:
             activity_url = f"{current_url.rstrip('/')}/recent-activity/shares/"
             logger.info(f"Checking activity at: {activity_url}")
             self.page.goto(activity_url, wait_until="load")
-            self.behavior.random_delay(8, 12)
+            self.behavior.wait_for_selector(".feed-shared-update-v2, .profile-creator-shared-feed-update__container", timeout_s=20)
 
             
             # Strict check: find the first post in activity and check if snippet matches
@@ -0,0 +1,112 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_cache: Optional["LLMCache"] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache(config) -> Optional["LLMCache"]:
+    """Returns the process-wide response cache, or None when disabled in settings."""
+    global _cache
+    cache_cfg = config.ai.cache
+    if not cache_cfg.enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMCache(cache_cfg.path, cache_cfg.max_entries)
+        return _cache
+
+
+def _normalize(text: str) -> str:
+    # Case and whitespace differences between two forms asking the same thing shouldn't miss
+    return re.sub(r"\s+", " ", text or "").strip().casefold()
+
+
+class LLMCache:
+    """
+    Disk-backed (SQLite) cache of chat completion responses.
+
+    Keys hash model + system prompt + user prompt + temperature. Each entry carries the
+    call site that produced it, so TTLs are chosen per call site; the table is kept under
+    max_entries by evicting the least recently used rows.
+    """
+
+    def __init__(self, path: str = "data/cache/llm_cache.sqlite3", max_entries: int = 5000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                site TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created REAL NOT NULL,
+                expires REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
+        payload = "\x1f".join([model, _normalize(system_prompt), _normalize(user_prompt), f"{temperature:.2f}"])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, site: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute("SELECT response, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row and row[1] > now:
+                self.conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                self.conn.commit()
+                self.hits[site] += 1
+                return row[0]
+            if row:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.conn.commit()
+            self.misses[site] += 1
+            return None
+
+    def put(self, key: str, site: str, response: str, ttl_seconds: int):
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, site, response, created, expires, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, site, response, now, now + ttl_seconds, now)
+            )
+            self._evict(now)
+            self.conn.commit()
+
+    def _evict(self, now: float):
+        """Drops expired rows, then the least recently used ones above max_entries."""
+        self.conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self.conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters per call site since process start."""
+        sites = set(self.hits) | set(self.misses)
+        return {site: {"hits": self.hits[site], "misses": self.misses[site]} for site in sorted(sites)}
@@ -0,0 +1,134 @@
+import time
+import logging
+import itertools
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from src.ai_rate_limiter import RateLimitedError
+
+logger = logging.getLogger(__name__)
+
+# Priority classes, most urgent first
+CHAT = "chat"             # Telegram conversation and commands
+APPLY = "apply"           # Easy Apply form answers (a browser tab is waiting)
+SCORING = "scoring"       # job compatibility scoring
+CONTENT = "content"       # posts, comments, connection notes
+BACKGROUND = "background" # autonomous-loop thinking
+PRIORITIES = (CHAT, APPLY, SCORING, CONTENT, BACKGROUND)
+
+_dispatcher: Optional["LLMDispatcher"] = None
+_dispatcher_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_dispatcher(config) -> "LLMDispatcher":
+    """Returns the process-wide LLM dispatch queue."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = LLMDispatcher(config.ai.dispatch)
+        return _dispatcher
+
+
+@contextmanager
+def llm_priority(priority: str):
+    """Tags every AI call made by this thread inside the block with a priority class."""
+    previous = getattr(_local, "priority", None)
+    _local.priority = priority
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+def current_priority(default: str = CONTENT) -> str:
+    return getattr(_local, "priority", None) or default
+
+
+class RequestShedError(RateLimitedError):
+    """A low-priority AI call dropped because the queue is saturated."""
+
+
+class LLMDispatcher:
+    """
+    Priority admission queue in front of every OpenAI request.
+
+    Callers block in slot() until they may run. A waiting call is admitted only when
+    no more urgent call is waiting, total concurrency is below max_concurrency (the
+    last reserved_for_chat slots are kept for chat) and its own class is below its
+    concurrency cap. Classes listed in shed_after_seconds give up (RequestShedError)
+    when they have waited that long or find shed_queue_depth calls already waiting.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._waiting: List[Tuple[int, int, str]] = [] # (rank, seq, priority)
+        self._active: Counter = Counter()
+        self.shed: Counter = Counter()
+
+    @staticmethod
+    def rank(priority: str) -> int:
+        return PRIORITIES.index(priority) if priority in PRIORITIES else PRIORITIES.index(CONTENT)
+
+    def _limit(self, priority: str) -> int:
+        limit = self.settings.max_concurrency
+        if priority != CHAT:
+            limit = max(limit - self.settings.reserved_for_chat, 1)
+        return limit
+
+    def _runnable(self, ticket: Tuple[int, int, str]) -> bool:
+        priority = ticket[2]
+        if sum(self._active.values()) >= self._limit(priority):
+            return False
+        cap = self.settings.class_concurrency.get(priority, 0)
+        if cap and self._active[priority] >= cap:
+            return False
+        # Anything more urgent (or older in the same class) that could run goes first
+        for other in self._waiting:
+            if other < ticket:
+                other_cap = self.settings.class_concurrency.get(other[2], 0)
+                if not (other_cap and self._active[other[2]] >= other_cap):
+                    return False
+        return True
+
+    @contextmanager
+    def slot(self, priority: str):
+        ticket = (self.rank(priority), next(self._seq), priority)
+        shed_after = self.settings.shed_after_seconds.get(priority)
+        deadline = time.monotonic() + shed_after if shed_after is not None else None
+
+        with self._cond:
+            if shed_after is not None and len(self._waiting) >= self.settings.shed_queue_depth:
+                self._drop(priority, "queue full")
+            self._waiting.append(ticket)
+            try:
+                while not self._runnable(ticket):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._drop(priority, f"waited {shed_after}s")
+                    self._cond.wait(remaining)
+            finally:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+            self._active[priority] += 1
+
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active[priority] -= 1
+                self._cond.notify_all()
+
+    def _drop(self, priority: str, reason: str):
+        self.shed[priority] += 1
+        logger.warning(f"Dropping {priority} AI call ({reason}); higher-priority traffic has the queue.")
+        raise RequestShedError(f"{priority} AI call shed: {reason}")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._cond:
+            waiting = Counter(ticket[2] for ticket in self._waiting)
+            return {p: {"active": self._active[p], "waiting": waiting[p], "shed": self.shed[p]} for p in PRIORITIES}
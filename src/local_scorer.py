@@ -0,0 +1,84 @@
+import re
+import math
+import logging
+from collections import Counter
+from typing import List, Tuple
+
+import numpy as np
+
+from src.keyword_matcher import KeywordMatcher, normalize_text
+
+logger = logging.getLogger(__name__)
+
+ACCEPT, REJECT, BORDERLINE = "accept", "reject", "borderline"
+
+# Function words that dominate both resumes and job posts without saying anything about fit
+_STOPWORDS = frozenset("""
+a o as os um uma uns umas de do da dos das em no na nos nas por para pelo pela com sem sobre entre
+e ou que se ao aos seu sua seus suas voce nos eles elas ser estar ter como mais menos muito ja nao sim
+the an and or of to in on for with by at from as is are be this that will you your our we they it
+""".split())
+
+
+def _tokenize(text: str) -> List[str]:
+    return [t for t in re.findall(r"[a-z0-9+#]{2,}", normalize_text(text)) if t not in _STOPWORDS]
+
+
+class LocalScorer:
+    """
+    TF-IDF cosine similarity between one resume and a batch of job texts.
+
+    IDF is computed over the batch itself, so terms every posting repeats ("vaga",
+    "empresa") weigh little while the specifics shared with the resume dominate.
+    The whole batch is scored with a single matrix product.
+    """
+
+    def __init__(self, resume_text: str, matcher: KeywordMatcher, settings):
+        self.resume_tokens = _tokenize(resume_text)
+        self.matcher = matcher
+        self.settings = settings
+
+    def similarities(self, texts: List[str]) -> Tuple[np.ndarray, List[int]]:
+        """Returns (cosine similarity per text, token count per text)."""
+        docs = [Counter(self.resume_tokens)] + [Counter(_tokenize(t)) for t in texts]
+        vocab = {term: i for i, term in enumerate(set().union(*docs))}
+        if not vocab:
+            return np.zeros(len(texts)), [0] * len(texts)
+
+        tf = np.zeros((len(docs), len(vocab)), dtype=np.float32)
+        for row, counts in enumerate(docs):
+            for term, count in counts.items():
+                tf[row, vocab[term]] = 1.0 + math.log(count)
+
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log((1.0 + len(docs)) / (1.0 + df)) + 1.0
+        weights = tf * idf
+        norms = np.linalg.norm(weights, axis=1, keepdims=True)
+        weights /= np.where(norms == 0, 1.0, norms)
+
+        sims = weights[1:] @ weights[0]
+        return sims, [sum(c.values()) for c in docs[1:]]
+
+    def score_batch(self, texts: List[str]) -> List[Tuple[int, str]]:
+        """Returns (score 0-100, verdict) per text; verdict is accept, reject or borderline."""
+        if not texts:
+            return []
+        sims, lengths = self.similarities(texts)
+        cfg = self.settings
+        results = []
+        for text, sim, length in zip(texts, sims.tolist(), lengths):
+            # Each profile keyword present in the text is strong evidence of fit
+            sim += 0.1 * len(self.matcher.match(text).include)
+
+            if sim >= cfg.accept_above:
+                span = max(1.0 - cfg.accept_above, 1e-6)
+                result = (80 + int(20 * min((sim - cfg.accept_above) / span, 1.0)), ACCEPT)
+            elif sim < cfg.reject_below and length >= cfg.min_tokens:
+                result = (int(19 * sim / max(cfg.reject_below, 1e-6)), REJECT)
+            else:
+                span = max(cfg.accept_above - cfg.reject_below, 1e-6)
+                ratio = min(max((sim - cfg.reject_below) / span, 0.0), 1.0)
+                result = (20 + int(59 * ratio), BORDERLINE)
+            logger.debug(f"Local score {result[0]} ({result[1]}): similarity {sim:.3f} over {length} tokens.")
+            results.append(result)
+        return results
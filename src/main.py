@@ -3,19 +3,21 @@ from datetime import datetime
 import os
 import sys
 import time
-import random
 import threading
 from flask import Flask
 from src.config import load_config
-from src.resume_parser import ResumeParser
+from src.resume_parser import load_resume
 from src.job_searcher import JobSearcher
 from src.storage import Storage
-from src.applicant import Applicant
+from src.applicant import Applicant, MIN_COMPATIBILITY_SCORE
 from src.notifications import TelegramNotifier
 from src.linkedin_manager import LinkedInManager
 from src.auth import Authenticator
 from src.telegram_bot import TelegramBot
 from src.moltbook_autonomous import MoltbookBot
+from src.llm_cache import get_llm_cache
+from src.pacing import get_pacer
+from src.job_scheduler import get_scheduler, IntervalTrigger
 
 # Configure logging to stdout
 logging.basicConfig(
@@ -110,11 +112,10 @@ def main():
         telegram_bot = None
 
     # 4. Parse Resume
-    parser = ResumeParser(config.resume.file_path)
-    resume_data = parser.parse()
+    resume_data = load_resume(config.resume.file_path)
     logger.info(f"Resume loaded for: {resume_data['extracted'].get('email', 'Unknown User')}")
 
-    searcher = JobSearcher(config)
+    searcher = JobSearcher(config, storage)
     
 
     
@@ -175,10 +176,17 @@ def main():
         }
         applications_count = stats["Applied"]
         limit = config.bot.daily_application_limit
+        pacer = get_pacer(config)
         
         logger.info(f"Resuming with {applications_count}/{limit} applications already done today.")
 
-        while True:
+        def run_search_cycle():
+            """One search/apply cycle; returns the delay override when the daily limit is reached."""
+            nonlocal applications_count
+            # Re-read today's count so the limit resets on a new day
+            applications_count = storage.get_today_count()
+            stats["Applied"] = applications_count
+
             # 4.2 LinkedIn Evolution Suite (DISABLED BY USER REQUEST)
             # Completely commented out to prevent execution errors
             """
@@ -231,74 +239,105 @@ def main():
             """
 
 
-            # 4.3 Moltbook Automation
-            if config.moltbook_automation:
-                try:
-                    # Initialize on demand or outside loop (optimization: outside loop is better but this is safe)
-                    if 'moltbook_bot' not in locals():
-                        moltbook_bot = MoltbookBot()
-                    
-                    logger.info("Initializing Moltbook Automation... 🦞")
-                    moltbook_bot.run_cycle()
-                except Exception as mb_e:
-                    logger.error(f"⚠️ Error in Moltbook Automation: {mb_e}")
-
             # 4.4 Job Application Loop
             if applications_count < limit:
                 logger.info(f"--- Starting Search Cycle ({applications_count}/{limit} applied) ---")
                 
                 jobs = []
                 if config.platforms.linkedin.enabled:
-                    jobs.extend(searcher.search_linkedin())
+                    if config.search.mode == "crawl":
+                        jobs.extend(searcher.crawl_linkedin())
+                    else:
+                        jobs.extend(searcher.search_linkedin())
                     
                 logger.info(f"Found {len(jobs)} total potential jobs across platforms.")
 
-                for job in jobs:
-                    if applications_count >= limit:
-                        break
+                # applicant is None when no job platform is enabled; no tabs are opened for an empty list
+                if applicant and jobs:
+                    # Batched scoring over the whole list (later chunks run in pacing waits); clear mismatches are never opened
+                    prescoring = applicant.prescore_jobs(jobs)
+
+                    # Worker tabs load and score jobs in parallel; submissions stay one at a time
+                    worker_pages = applicant.open_worker_pages(config.platforms.linkedin.workers)
+                    for batch_start in range(0, len(jobs), len(worker_pages)):
+                        if applications_count >= limit:
+                            break
+                        batch = jobs[batch_start:batch_start + len(worker_pages)]
+                        applicant.prepare_jobs(batch, worker_pages)
+
+                        for job in batch:
+                            if applications_count >= limit or pacer.errors_exhausted("linkedin"):
+                                break
+
+                            # Jobs that will touch the browser wait for the next slot in the apply budget
+                            interacts = job.get("compatibility_score", 100) >= MIN_COMPATIBILITY_SCORE
+                            if interacts and not pacer.wait_for_slot("linkedin_apply"):
+                                break
+                            
+                            logger.info(f"Analyzing: {job['title']} [{job['platform']}]")
+                            status = applicant.apply(job)
+                            logger.info(f"Result: {status}")
                         
-                    logger.info(f"Analyzing: {job['title']} [{job['platform']}]")
-                    status = applicant.apply(job)
-                    logger.info(f"Result: {status}")
-                    
-                    # Update detailed stats
-                    if "APPLIED" in status and "ALREADY" not in status:
-                        applications_count += 1
-                        stats["Applied"] += 1
-                        stats[job['platform']] += 1
-                        notifier.notify_application(job, status)
-                    elif "EXTERNAL" in status or "READY_TO_SUBMIT" in status:
-                        stats["External (Manual)"] += 1
-                        notifier.notify_manual_review(job)
-                    elif "LOW_MATCH" in status:
-                        stats["Low Match"] += 1
-                    elif "DUPLICATE" in status or "ALREADY" in status:
-                        stats["Already Applied"] += 1
-                    elif "FAILED" in status or "ERROR" in status:
-                        stats["Failed"] += 1
-                    
-                    # Random delay between jobs
-                    time.sleep(random.uniform(10, 20))
+                            # Update detailed stats
+                            if "APPLIED" in status and "ALREADY" not in status:
+                                applications_count += 1
+                                stats["Applied"] += 1
+                                stats[job['platform']] += 1
+                                notifier.notify_application(job, status)
+                            elif "EXTERNAL" in status or "READY_TO_SUBMIT" in status:
+                                stats["External (Manual)"] += 1
+                                notifier.notify_manual_review(job)
+                            elif "LOW_MATCH" in status:
+                                stats["Low Match"] += 1
+                            elif "DUPLICATE" in status or "ALREADY" in status:
+                                stats["Already Applied"] += 1
+                            elif "FAILED" in status or "ERROR" in status:
+                                stats["Failed"] += 1
+                                pacer.record_error("linkedin")
+                                if pacer.errors_exhausted("linkedin"):
+                                    logger.warning("security.max_errors_per_day reached for LinkedIn. Pausing applications until tomorrow.")
+                        
+                            # Start the gap to the next job (only when we actually interacted with the page)
+                            if "LOW_MATCH" not in status and "DUPLICATE" not in status:
+                                pacer.record("linkedin_apply")
+
+                    # Chunks for jobs this cycle never reached are not worth an AI call
+                    for future in prescoring:
+                        future.cancel()
 
             # Daily Report Summary
             print("\n" + "="*45)
             print("📊 RELATÓRIO DE ATIVIDADE")
             print(f"Total Inscritas hoje:  {stats['Applied']}")
+            llm_cache = get_llm_cache(config)
+            if llm_cache:
+                for site, counts in llm_cache.stats().items():
+                    print(f"Cache IA [{site}]: {counts['hits']} hits / {counts['misses']} misses")
+            if searcher.network.settings.enabled:
+                for profile, saved in searcher.network.stats().items():
+                    print(f"Rede [{profile}]: {saved['requests']} bloqueadas (~{saved['bytes'] / 1_000_000:.1f} MB)")
             print("-" * 45)
             print("="*45 + "\n")
 
             if applications_count >= limit:
-                logger.info("Daily application limit reached. Sleeping for 4 hours before next check...")
-                time.sleep(60 * 60 * 4)
-            else:
-                logger.info("Cycle finished. Waiting 30 minutes for new vacancies...")
-                time.sleep(60 * 30)
-            
-            # Reset count if it's a new day (simple check)
-            # This is naive but works for a persistent process
-            # Better way: storage.get_today_count() at start of each cycle
-            applications_count = storage.get_today_count()
-            stats["Applied"] = applications_count
+                logger.info(f"Daily application limit reached. Next check in {config.scheduler.limit_reached_interval_minutes} minutes.")
+                return config.scheduler.limit_reached_interval_minutes * 60
+            logger.info(f"Cycle finished. Next search in {config.scheduler.search_interval_minutes} minutes.")
+            return None
+
+        # 5. Recurring work runs as persisted scheduler jobs (Telegram /run <job> triggers one early)
+        scheduler = get_scheduler(config.scheduler.path)
+        scheduler.add_job("job_search", run_search_cycle, IntervalTrigger(config.scheduler.search_interval_minutes * 60), run_first=True)
+        if config.moltbook_automation:
+            moltbook_bot = MoltbookBot()
+            scheduler.add_job("moltbook", moltbook_bot.run_cycle, moltbook_bot.trigger(), background=True, run_first=True)
+        # Imported here: system_monitor configures logging on import and would pre-empt bot.log
+        from src.system_monitor import SystemMonitor
+        scheduler.add_job("system_monitor", SystemMonitor().run_checks, IntervalTrigger(config.scheduler.monitor_interval_seconds), background=True)
+        if config.scheduler.market_scan_interval_hours:
+            from src.market_analyst import MarketAnalyst
+            scheduler.add_job("market_scan", MarketAnalyst().scan_market, IntervalTrigger(config.scheduler.market_scan_interval_hours * 3600), background=True)
+        scheduler.run_forever()
 
 
     except KeyboardInterrupt:
@@ -1,8 +1,8 @@
 import os
 import json
 import logging
-import requests
 from src.config import load_config
+from src.http_client import get_session
 
 logger = logging.getLogger("MarketAnalyst")
 
@@ -31,7 +31,7 @@ class MarketAnalyst:
             params = {"q": query, "count": 10}
             
             try:
-                response = requests.get(url, headers=headers, params=params)
+                response = get_session().get(url, headers=headers, params=params)
                 results = response.json().get("web", {}).get("results", [])
                 for res in results:
                     all_trends.append({
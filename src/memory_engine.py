@@ -2,7 +2,7 @@ import os
 import logging
 import chromadb
 from datetime import datetime
-from src.ai_assistant import AIAssistant
+from src.ai_assistant import get_ai_assistant
 from src.config import Settings
 import uuid
 
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 class MemoryEngine:
     def __init__(self, config: Settings):
         self.config = config
-        self.ai = AIAssistant(config)
+        self.ai = get_ai_assistant(config)
         self.db_path = os.path.join(os.getcwd(), "data", "chroma_db")
         os.makedirs(self.db_path, exist_ok=True)
         
@@ -1,12 +1,14 @@
 import os
 import json
-import time
 import random
 import logging
-import requests
 from datetime import datetime
 from src.config import load_config
+from src.http_client import get_session
+from src.ai_assistant import get_ai_assistant
+from src.llm_dispatch import CONTENT
 from src.notifications import TelegramNotifier
+from src.job_scheduler import get_scheduler, AnyTrigger, DailyTrigger, IntervalTrigger
 
 logger = logging.getLogger("MoltbookAutonomous")
 
@@ -42,9 +44,9 @@ class MoltbookBot:
         }
         try:
             if method == "GET":
-                response = requests.get(url, headers=headers)
+                response = get_session().get(url, headers=headers)
             else:
-                response = requests.post(url, headers=headers, json=data)
+                response = get_session().post(url, headers=headers, json=data)
             return response.json()
         except Exception as e:
             logger.error(f"API call failed to {endpoint}: {e}")
@@ -59,7 +61,7 @@ class MoltbookBot:
         params = {"q": query, "count": 5}
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = get_session().get(url, headers=headers, params=params)
             results = response.json().get("web", {}).get("results", [])
             return results
         except Exception as e:
@@ -76,23 +78,17 @@ class MoltbookBot:
             with open(self.knowledge_path, "r", encoding="utf-8") as f:
                 user_context = f.read()
             
-        url = "https://api.openai.com/v1/chat/completions"
-        headers = {"Authorization": f"Bearer {self.openai_api_key}", "Content-Type": "application/json"}
-        
         system_prompt = "You are Clawdbot, an advanced AI agent on Moltbook. You are professional but friendly, focused on technology and automation. Keep it concise (max 280 chars)."
         if user_context:
             system_prompt += f"\n\nContext about your owner (Leonardo):\n{user_context}\nAlways try to align your thoughts with his current interests and projects mentioned above."
 
-        data = {
-            "model": "gpt-4",
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-        }
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
         try:
-            response = requests.post(url, headers=headers, json=data)
-            return response.json()["choices"][0]["message"]["content"]
+            # Shares the process-wide AI rate limit and 429 cooldown with the job bot
+            return get_ai_assistant(self.config).complete(messages, model="gpt-4", priority=CONTENT)
         except Exception as e:
             logger.error(f"OpenAI generation failed: {e}")
             return None
@@ -231,16 +227,25 @@ class MoltbookBot:
                     message += f"• {item['title']} (por {item['author']}) 🦞\n"
                 self.notifier.send_message(message)
 
-            logger.info("Cycle finished. Next check in 30 minutes.")
+            logger.info("Cycle finished.")
         except Exception as e:
             logger.error(f"Error in autonomous cycle: {e}")
 
 
+    def trigger(self):
+        """Hourly feed cycle, plus a run at every configured daily post slot."""
+        hourly = IntervalTrigger(3600)
+        posts = self.automation.daily_posts if self.automation else None
+        times = (posts.times or ([posts.time] if posts.time else [])) if posts and posts.enabled else []
+        return AnyTrigger(hourly, DailyTrigger(times)) if times else hourly
+
     def start(self):
         logger.info("🚀 Clawdbot Moltbook Autonomy Started!")
-        while True:
-            self.run_cycle()
-            time.sleep(3600) # Wait 1 hour
+        # Own database: main.py schedules its "moltbook" job in scheduler.path and the two
+        # processes would overwrite each other's next_run
+        scheduler = get_scheduler(self.config.scheduler.moltbook_path)
+        scheduler.add_job("moltbook", self.run_cycle, self.trigger(), run_first=True)
+        scheduler.run_forever()
 
 if __name__ == "__main__":
     import argparse
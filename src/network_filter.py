@@ -0,0 +1,166 @@
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from src.config import NetworkProfile
+
+logger = logging.getLogger(__name__)
+
+# Typical transfer size per blocked resource type (bytes), used for the savings estimate
+_ESTIMATED_BYTES = {
+    "image": 45_000,
+    "media": 400_000,
+    "font": 35_000,
+    "stylesheet": 25_000,
+    "script": 60_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+    "ping": 500,
+    "beacon": 500,
+    "websocket": 0,
+    "eventsource": 0,
+    "manifest": 2_000,
+    "texttrack": 5_000,
+    "other": 5_000,
+}
+
+_filter: Optional["NetworkFilter"] = None
+_filter_lock = threading.Lock()
+
+
+def get_network_filter(config) -> "NetworkFilter":
+    """Returns the process-wide request filter."""
+    global _filter
+    with _filter_lock:
+        if _filter is None:
+            _filter = NetworkFilter(config)
+        return _filter
+
+
+def _host_matches(host: str, domains) -> bool:
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+class NetworkFilter:
+    """
+    Request-routing layer on the Playwright context.
+
+    Every request goes through one route handler that aborts it when the active
+    task profile ("scrape", "apply", "post" from settings.browser.network.profiles)
+    blocks its resource type or host. Top-level documents are never blocked. The
+    profile is switched with use()/set_profile() around each task; between tasks
+    (login, checkpoints) the permissive default_profile is active. The handler
+    counts blocked requests plus an estimate of the bytes they would have cost.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.settings = config.browser.network
+        self.profile_name = self.settings.default_profile
+        self._lock = threading.Lock()
+        self._blocked: Counter = Counter() # (profile, resource type) -> requests
+        self._bytes: Counter = Counter()   # profile -> estimated bytes
+        self._allowed = 0
+        self._page_scoped = False
+        self._pages = [] # routed tabs when installed per page (shared daemon context)
+
+    # ---- profiles ------------------------------------------------------
+
+    def profile(self, name: Optional[str] = None) -> NetworkProfile:
+        return self.settings.profiles.get(name or self.profile_name) or NetworkProfile()
+
+    def set_profile(self, name: str):
+        if name not in self.settings.profiles:
+            logger.warning(f"Unknown network profile '{name}'; nothing will be blocked while it is active.")
+        self.profile_name = name
+
+    @contextmanager
+    def use(self, name: str):
+        """Activates a profile for the duration of a task and restores the previous one."""
+        previous = self.profile_name
+        self.set_profile(name)
+        try:
+            yield self
+        finally:
+            self.profile_name = previous
+
+    # ---- routing -------------------------------------------------------
+
+    def install(self, context, page=None):
+        """
+        Routes every request of context through the filter. With page given (a tab of a
+        context shared with other clients, e.g. the browser daemon) only that page is
+        routed, and later tabs are added with add_page().
+        """
+        if not self.settings.enabled:
+            return
+        if page is not None:
+            self._page_scoped = True
+            self._route_page(page)
+            return
+        self._page_scoped = False
+        context.route("**/*", self._handle)
+        logger.info(f"Network filter installed (profile: {self.profile_name}).")
+
+    def add_page(self, page):
+        """Routes a tab opened later; no-op when the whole context is already routed."""
+        if self.settings.enabled and self._page_scoped:
+            self._route_page(page)
+
+    def _route_page(self, page):
+        with self._lock:
+            self._pages = [p for p in self._pages if not p.is_closed()]
+            if page in self._pages:
+                return
+            self._pages.append(page)
+        page.route("**/*", self._handle)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type == "document":
+            return False
+        profile = self.profile()
+        if resource_type in profile.block_resource_types:
+            return True
+        host = (urlsplit(url).hostname or "").lower()
+        if not host:
+            return False
+        if _host_matches(host, profile.block_domains):
+            return True
+        if profile.block_third_party and profile.first_party_domains:
+            return not _host_matches(host, profile.first_party_domains)
+        return False
+
+    def _handle(self, route):
+        # Returns the abort/continue result so the async engine awaits it on its loop
+        request = route.request
+        resource_type = request.resource_type
+        if self.should_block(resource_type, request.url):
+            with self._lock:
+                self._blocked[(self.profile_name, resource_type)] += 1
+                self._bytes[self.profile_name] += _ESTIMATED_BYTES.get(resource_type, _ESTIMATED_BYTES["other"])
+            return route.abort("blockedbyclient")
+        with self._lock:
+            self._allowed += 1
+        return route.continue_()
+
+    # ---- reporting -----------------------------------------------------
+
+    def stats(self) -> Dict[str, Dict]:
+        """Blocked requests per type and estimated bytes saved, per profile."""
+        with self._lock:
+            report: Dict[str, Dict] = {}
+            for (profile, resource_type), count in self._blocked.items():
+                entry = report.setdefault(profile, {"requests": 0, "bytes": self._bytes[profile], "by_type": {}})
+                entry["requests"] += count
+                entry["by_type"][resource_type] = count
+            return report
+
+    def summary(self) -> str:
+        with self._lock:
+            blocked = sum(self._blocked.values())
+            saved_mb = sum(self._bytes.values()) / 1_000_000
+            allowed = self._allowed
+        return f"{blocked} requests blocked (~{saved_mb:.1f} MB saved), {allowed} allowed"
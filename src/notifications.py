@@ -1,11 +1,8 @@
 import logging
-import urllib.request
-import urllib.parse
-import json
 import os
 import mimetypes
-import uuid
 from src.config import Settings
+from src.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -26,18 +23,16 @@ class TelegramNotifier:
             return
 
         url = f"https://api.telegram.org/bot{self.token}/sendMessage"
-        data = urllib.parse.urlencode({
+        data = {
             "chat_id": self.chat_id,
             "text": text,
             "parse_mode": "Markdown"
-        }).encode("utf-8")
+        }
 
         try:
-            req = urllib.request.Request(url, data=data)
-            with urllib.request.urlopen(req) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                if not result.get("ok"):
-                    logger.error(f"Telegram API error: {result.get('description')}")
+            result = get_session().post(url, data=data).json()
+            if not result.get("ok"):
+                logger.error(f"Telegram API error: {result.get('description')}")
         except Exception as e:
             logger.error(f"Failed to send Telegram notification: {e}")
 
@@ -47,32 +42,18 @@ class TelegramNotifier:
             return
 
         url = f"https://api.telegram.org/bot{self.token}/sendPhoto"
-        boundary = f"----TelegramBotBoundary{uuid.uuid4().hex}"
-        
-        parts = []
-        # Chat ID part
-        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="chat_id"\r\n\r\n{self.chat_id}\r\n'.encode('utf-8'))
-        # Caption part
+        data = {"chat_id": self.chat_id}
         if caption:
-            parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="caption"\r\n\r\n{caption}\r\n'.encode('utf-8'))
-        # Photo part
-        with open(photo_path, 'rb') as f:
-            filename = os.path.basename(photo_path)
-            mime_type = mimetypes.guess_type(photo_path)[0] or 'application/octet-stream'
-            parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="photo"; filename="{filename}"\r\nContent-Type: {mime_type}\r\n\r\n'.encode('utf-8'))
-            parts.append(f.read())
-            parts.append(b'\r\n')
-        
-        parts.append(f'--{boundary}--\r\n'.encode('utf-8'))
-        body = b''.join(parts)
+            data["caption"] = caption
 
         try:
-            req = urllib.request.Request(url, data=body)
-            req.add_header('Content-Type', f'multipart/form-data; boundary={boundary}')
-            with urllib.request.urlopen(req) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                if not result.get("ok"):
-                    logger.error(f"Telegram API error (photo): {result.get('description')}")
+            with open(photo_path, 'rb') as f:
+                filename = os.path.basename(photo_path)
+                mime_type = mimetypes.guess_type(photo_path)[0] or 'application/octet-stream'
+                files = {"photo": (filename, f, mime_type)}
+                result = get_session().post(url, data=data, files=files, timeout=(5, 60)).json()
+            if not result.get("ok"):
+                logger.error(f"Telegram API error (photo): {result.get('description')}")
         except Exception as e:
             logger.error(f"Failed to send Telegram photo: {e}")
 
@@ -0,0 +1,194 @@
+import time
+import random
+import logging
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future
+from datetime import date
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from src.config import PacingBudget
+
+logger = logging.getLogger(__name__)
+
+_pacer: Optional["PacingScheduler"] = None
+_pacer_lock = threading.Lock()
+
+
+def get_pacer(config) -> "PacingScheduler":
+    """Returns the process-wide pacing scheduler."""
+    global _pacer
+    with _pacer_lock:
+        if _pacer is None:
+            _pacer = PacingScheduler(config)
+        return _pacer
+
+
+class PacingScheduler:
+    """
+    Central action-rate budget for browser activity.
+
+    Each budget key ("linkedin", "linkedin_apply", "linkedin_outreach", ...) has a
+    minimum gap between actions plus per-minute/hour/day caps from settings.pacing.
+    Callers ask for the next allowed slot instead of sleeping a fresh uniform draw,
+    so time already spent working counts towards the gap. While a caller waits for
+    its slot, work queued with submit_idle() (job pre-scoring) runs on the waiting
+    thread instead of the thread just blocking. A task only starts when its expected
+    duration (the caller's estimate or its measured average, whichever is longer)
+    fits the time left.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.settings = config.pacing
+        self._lock = threading.Condition()
+        self._history: Dict[str, Deque[float]] = {}
+        self._next_gap: Dict[str, float] = {}
+        self._daily: Counter = Counter()
+        self._errors: Counter = Counter()
+        self._idle: Deque[Tuple[Callable, tuple, dict, Future, Optional[float]]] = deque()
+        self._durations: Dict[str, float] = {} # idle task name -> moving average of its run time
+
+    # ---- budgets -------------------------------------------------------
+
+    def _budget(self, key: str) -> PacingBudget:
+        return self.settings.budgets.get(key) or PacingBudget()
+
+    def _next_slot(self, key: str, now: float, gap: Optional[float] = None) -> float:
+        """Earliest time >= now at which one more action fits every budget of key."""
+        budget = self._budget(key)
+        history = self._history.setdefault(key, deque())
+        while history and history[0] < now - 3600:
+            history.popleft()
+
+        slot = now
+        if history:
+            slot = max(slot, history[-1] + (self._next_gap.get(key, 0.0) if gap is None else gap))
+        if budget.per_minute and len(history) >= budget.per_minute:
+            slot = max(slot, history[-budget.per_minute] + 60)
+        if budget.per_hour and len(history) >= budget.per_hour:
+            slot = max(slot, history[-budget.per_hour] + 3600)
+        return slot
+
+    def _record(self, key: str, at: float):
+        budget = self._budget(key)
+        self._history.setdefault(key, deque()).append(at)
+        self._daily[(key, date.today().isoformat())] += 1
+        gap = budget.gap_seconds
+        self._next_gap[key] = random.uniform(gap.min, gap.max) if gap else 0.0
+
+    def daily_count(self, key: str) -> int:
+        with self._lock:
+            return self._daily[(key, date.today().isoformat())]
+
+    def daily_cap_reached(self, key: str) -> bool:
+        cap = self._budget(key).per_day
+        return bool(cap) and self.daily_count(key) >= cap
+
+    # ---- errors --------------------------------------------------------
+
+    def record_error(self, platform: str):
+        with self._lock:
+            self._errors[(platform, date.today().isoformat())] += 1
+
+    def errors_exhausted(self, platform: str) -> bool:
+        """True once platform hit security.max_errors_per_day today."""
+        with self._lock:
+            return self._errors[(platform, date.today().isoformat())] >= self.config.security.max_errors_per_day
+
+    # ---- slots ---------------------------------------------------------
+
+    def record(self, key: str):
+        """Registers an action that just happened (starts the gap to the next one)."""
+        with self._lock:
+            self._record(key, time.time())
+
+    def wait_for_slot(self, key: str) -> bool:
+        """Blocks (running idle work) until one more action fits key's budget. False if the daily cap is reached."""
+        if self.daily_cap_reached(key):
+            logger.info(f"Pacing: daily cap for '{key}' reached.")
+            return False
+        with self._lock:
+            slot = self._next_slot(key, time.time())
+        self.wait_until(slot)
+        return True
+
+    def pause(self, key: str, min_s: float, max_s: float):
+        """
+        Humanization pause of roughly uniform(min_s, max_s) since the last action on key,
+        stretched if needed to respect its rate budget. Counts as an action itself.
+        """
+        with self._lock:
+            now = time.time()
+            slot = self._next_slot(key, now, gap=random.uniform(min_s, max_s))
+            # The gap is measured from the last action; a pause right after idle time still waits min_s
+            slot = max(slot, now + min_s)
+            self._record(key, slot)
+            self._next_gap[key] = 0.0
+        self.wait_until(slot)
+
+    def wait_until(self, deadline: float):
+        """Waits until deadline, running queued idle work that is expected to finish before it."""
+        min_window = self.settings.idle_work_min_window_seconds
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            if remaining >= min_window and self._run_idle_task(remaining):
+                continue
+            with self._lock:
+                self._lock.wait(timeout=remaining)
+
+    # ---- idle work -----------------------------------------------------
+
+    def submit_idle(self, fn: Callable, *args, estimate: Optional[float] = None, **kwargs) -> Future:
+        """
+        Queues work for a later pacing wait with at least estimate seconds left.
+        Cancel the returned future to drop work that is no longer needed.
+        """
+        future: Future = Future()
+        with self._lock:
+            self._idle.append((fn, args, kwargs, future, estimate))
+            self._lock.notify_all()
+        return future
+
+    @staticmethod
+    def _task_name(fn: Callable) -> str:
+        return getattr(fn, "__qualname__", None) or repr(fn)
+
+    def _run_idle_task(self, budget: float) -> bool:
+        """Runs the oldest queued task expected to finish within budget seconds; False if none fits."""
+        min_window = self.settings.idle_work_min_window_seconds
+        with self._lock:
+            task = None
+            for item in list(self._idle):
+                fn, future, estimate = item[0], item[3], item[4]
+                if future.cancelled():
+                    self._idle.remove(item)
+                    continue
+                learned = self._durations.get(self._task_name(fn))
+                if estimate is None and learned is None:
+                    expected = min_window
+                else:
+                    # The more cautious of the caller's estimate and the measured average
+                    expected = max(estimate or 0.0, learned or 0.0)
+                if expected <= budget:
+                    self._idle.remove(item)
+                    task = item
+                    break
+            if task is None:
+                return False
+        fn, args, kwargs, future, _ = task
+        if future.set_running_or_notify_cancel():
+            started = time.monotonic()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                logger.error(f"Idle task {self._task_name(fn)} failed: {e}")
+                future.set_exception(e)
+            elapsed = time.monotonic() - started
+            with self._lock:
+                name = self._task_name(fn)
+                previous = self._durations.get(name)
+                self._durations[name] = elapsed if previous is None else 0.7 * previous + 0.3 * elapsed
+        return True
@@ -1,11 +1,11 @@
 import sys
 import os
-import requests
 
 # Add project root to sys.path
 sys.path.append(os.getcwd())
 
 from src.moltbook_autonomous import MoltbookBot
+from src.http_client import get_session
 
 def manual_post():
     bot = MoltbookBot()
@@ -18,7 +18,7 @@ def manual_post():
     if content:
         print(f"📝 Conteúdo gerado: {content}")
         # Find submolt ID for 'nexus'
-        submolts_res = requests.get("https://www.moltbook.com/api/v1/submolts").json()
+        submolts_res = get_session().get("https://www.moltbook.com/api/v1/submolts").json()
         submolts = submolts_res.get("submolts", [])
         submolt_id = next((s["id"] for s in submolts if "nexus" in (s.get("name") or "").lower()), None)
         
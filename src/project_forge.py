@@ -1,8 +1,8 @@
 import os
 import json
 import logging
-import requests
 from src.config import load_config
+from src.http_client import get_session
 
 logger = logging.getLogger("ProjectForge")
 
@@ -40,7 +40,7 @@ class ProjectForge:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = get_session().post(url, headers=headers, json=data, timeout=(5, 60))
             res_json = response.json()
             if "choices" in res_json:
                 return res_json["choices"][0]["message"]["content"]
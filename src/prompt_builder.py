@@ -0,0 +1,228 @@
+import os
+import re
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from src.keyword_matcher import normalize_text
+
+logger = logging.getLogger(__name__)
+
+_builder: Optional["PromptBuilder"] = None
+_builder_lock = threading.Lock()
+
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+# Resume headings as pdfminer leaves them (matched on normalized text)
+_RESUME_HEADINGS = (
+    "resumo", "perfil", "objetivo", "sobre", "experiencia", "historico profissional", "formacao",
+    "educacao", "escolaridade", "cursos", "certificac", "habilidades", "competencias", "conhecimentos",
+    "idiomas", "informatica", "atividades", "voluntariado", "projetos", "summary", "profile", "objective",
+    "experience", "education", "skills", "languages", "certifications", "projects",
+)
+
+_STOPWORDS = frozenset("""
+a o as os um uma de do da dos das em no na nos nas por para com que se e ou ao seu sua voce
+the an and or of to in on for with by at is are be you your what how
+""".split())
+
+
+def get_prompt_builder(config) -> "PromptBuilder":
+    """Returns the process-wide prompt builder."""
+    global _builder
+    with _builder_lock:
+        if _builder is None:
+            _builder = PromptBuilder(config.ai.prompt)
+        return _builder
+
+
+def _get_encoding():
+    """tiktoken's o200k_base encoding (gpt-4o) when it is installed and its BPE file is cached locally."""
+    global _encoding, _encoding_loaded
+    with _encoding_lock:
+        if not _encoding_loaded:
+            _encoding_loaded = True
+            try:
+                import tiktoken
+                _encoding = tiktoken.get_encoding("o200k_base")
+            except Exception as e:
+                # Not installed, or no network to fetch the BPE file: use the offline estimate
+                logger.debug(f"tiktoken unavailable ({e}); estimating token counts.")
+        return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """Token count of text: exact with tiktoken, otherwise a word/punctuation estimate close to it."""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding:
+        return len(encoding.encode(text, disallowed_special=()))
+    # BPE splits long words; ~1 token per 4 characters of a word, 1 per punctuation mark
+    return sum(max(1, (len(piece) + 3) // 4) for piece in re.findall(r"\w+|[^\w\s]", text))
+
+
+def truncate_tokens(text: str, budget: int) -> str:
+    """Cuts text to at most budget tokens (at a word boundary when estimating)."""
+    if budget <= 0:
+        return ""
+    if count_tokens(text) <= budget:
+        return text
+    encoding = _get_encoding()
+    if encoding:
+        return encoding.decode(encoding.encode(text, disallowed_special=())[:budget]).rstrip() + " ..."
+    out, used = [], 0
+    for match in re.finditer(r"\S+\s*", text):
+        cost = count_tokens(match.group())
+        if used + cost > budget:
+            break
+        out.append(match.group())
+        used += cost
+    return "".join(out).rstrip() + " ..."
+
+
+def _terms(text: str) -> Set[str]:
+    return {t for t in re.findall(r"[a-z0-9+#]{3,}", normalize_text(text)) if t not in _STOPWORDS}
+
+
+class Section(NamedTuple):
+    title: str
+    text: str     # compacted body (title included)
+    summary: str  # title + first line, used when the full section doesn't fit or isn't relevant
+    tokens: int
+    terms: Set[str]
+
+
+class PromptBuilder:
+    """
+    Token-budgeted context for prompts.
+
+    Resume and persona texts are split into sections once per content hash and
+    compacted (whitespace, duplicate lines and markdown decoration removed); each
+    section keeps a precomputed one-line summary and token count. For a call,
+    compact() keeps the opening section (name, headline), then the sections sharing
+    the most terms with the question in full, then summaries of the rest, until
+    the budget is spent. fit() enforces ai.prompt.max_prompt_tokens per call.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._sections: "OrderedDict[str, List[Section]]" = OrderedDict()
+        self._persona: Dict[str, Tuple[float, str]] = {} # path -> (mtime, text)
+
+    # ---- sections ------------------------------------------------------
+
+    def _split(self, text: str) -> List[Section]:
+        key = hashlib.sha1(text.encode("utf-8", "ignore")).hexdigest()
+        with self._lock:
+            if key in self._sections:
+                self._sections.move_to_end(key)
+                return self._sections[key]
+
+        blocks: List[Tuple[str, List[str]]] = [("", [])]
+        seen = set()
+        for raw in text.splitlines():
+            line = re.sub(r"\s+", " ", raw.replace("**", "").replace("__", "")).strip()
+            if not line or line.lower() in seen:
+                continue
+            seen.add(line.lower())
+            if self._is_heading(line):
+                blocks.append((line.lstrip("# ").strip(), []))
+            else:
+                blocks[-1][1].append(line)
+
+        sections = []
+        for title, lines in blocks:
+            if not title and not lines:
+                continue
+            body = "\n".join(([title] if title else []) + lines)
+            first = lines[0] if lines else ""
+            summary = truncate_tokens(f"{title}: {first}" if title else first, 40)
+            sections.append(Section(title, body, summary, count_tokens(body), _terms(body)))
+
+        with self._lock:
+            self._sections[key] = sections
+            while len(self._sections) > 32:
+                self._sections.popitem(last=False)
+        return sections
+
+    @staticmethod
+    def _is_heading(line: str) -> bool:
+        if line.startswith("#"):
+            return True
+        if len(line) > 40 or line.endswith((".", ",", ";")):
+            return False
+        normalized = normalize_text(line).strip(" :")
+        if normalized.startswith(_RESUME_HEADINGS):
+            return True
+        letters = [c for c in line if c.isalpha()]
+        return len(letters) >= 4 and all(c.isupper() for c in letters)
+
+    # ---- assembly ------------------------------------------------------
+
+    def compact(self, text: str, query: str, budget: int) -> str:
+        """The parts of text most relevant to query, in original order, within budget tokens."""
+        if not text:
+            return ""
+        if count_tokens(text) <= budget:
+            return text
+        sections = self._split(text)
+        if not sections:
+            return truncate_tokens(text, budget)
+
+        chosen: Dict[int, str] = {}
+        remaining = budget
+        # Opening section (name, headline, summary) anchors every prompt
+        head = truncate_tokens(sections[0].text, max(budget // 4, 1))
+        chosen[0] = head
+        remaining -= count_tokens(head)
+
+        query_terms = _terms(query)
+        ranked = sorted(range(1, len(sections)), key=lambda i: -len(sections[i].terms & query_terms))
+        for i in ranked:
+            if remaining <= 0 or not sections[i].terms & query_terms:
+                break
+            part = sections[i].text if sections[i].tokens <= remaining else truncate_tokens(sections[i].text, remaining)
+            chosen[i] = part
+            remaining -= count_tokens(part)
+        for i in range(1, len(sections)):
+            if i in chosen:
+                continue
+            cost = count_tokens(sections[i].summary)
+            if cost <= remaining:
+                chosen[i] = sections[i].summary
+                remaining -= cost
+        return "\n".join(chosen[i] for i in sorted(chosen))
+
+    def resume_context(self, resume_text: str, query: str) -> str:
+        return self.compact(resume_text, query, self.settings.resume_tokens)
+
+    def persona_context(self, path: str, query: str) -> str:
+        """Relevant slice of the persona file; the file is only re-read when its mtime changes."""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return ""
+        cached = self._persona.get(path)
+        if not cached or cached[0] != mtime:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    cached = (mtime, f.read())
+            except Exception:
+                return ""
+            self._persona[path] = cached
+        return self.compact(cached[1], query, self.settings.persona_tokens)
+
+    def fit(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> str:
+        """Trims the user prompt so system + user stay within max_tokens (default ai.prompt.max_prompt_tokens)."""
+        max_tokens = max_tokens or self.settings.max_prompt_tokens
+        budget = max_tokens - count_tokens(system_prompt)
+        if count_tokens(user_prompt) <= budget:
+            return user_prompt
+        logger.warning(f"User prompt trimmed to the {max_tokens}-token per-call budget.")
+        return truncate_tokens(user_prompt, max(budget, 0))
@@ -1,5 +1,8 @@
 import logging
 import re
+import json
+import hashlib
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 from pdfminer.high_level import extract_text as extract_pdf_text
@@ -8,6 +11,17 @@ import docx
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Process-wide parse cache: resolved path -> {mtime, size, sha256, raw_text, parsed_data}
+# Backed by data/cache/resume/<sha256>.json so restarts skip PDF parsing as well.
+CACHE_DIR = Path("data/cache/resume")
+_cache: Dict[str, Dict] = {}
+_cache_lock = threading.Lock()
+
+
+def load_resume(file_path: str) -> Dict:
+    """Returns the parsed resume ({raw_text, extracted}) through the shared cache."""
+    return ResumeParser(file_path).parse()
+
 class ResumeParser:
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
@@ -24,7 +38,38 @@ class ResumeParser:
         }
 
     def read_file(self) -> str:
-        """Reads the file content based on extension."""
+        """Reads the file content based on extension (served from the cache when unchanged)."""
+        with _cache_lock:
+            key = str(self.file_path.resolve())
+            stat = self.file_path.stat()
+            entry = _cache.get(key)
+
+            # Fast path: same file, untouched since we last parsed it
+            if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+                return self._load_entry(entry)
+
+            digest = hashlib.sha256(self.file_path.read_bytes()).hexdigest()
+            if not entry or entry["sha256"] != digest:
+                entry = self._read_disk_cache(digest)
+            if entry:
+                entry.update({"mtime": stat.st_mtime, "size": stat.st_size})
+                _cache[key] = entry
+                return self._load_entry(entry)
+
+            self._extract_text()
+            self.extract_contact_info()
+            entry = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "sha256": digest,
+                "raw_text": self.raw_text,
+                "parsed_data": dict(self.parsed_data)
+            }
+            _cache[key] = entry
+            self._write_disk_cache(entry)
+            return self.raw_text
+
+    def _extract_text(self):
         extension = self.file_path.suffix.lower()
         try:
             if extension == '.pdf':
@@ -36,11 +81,36 @@ class ResumeParser:
                 raise ValueError(f"Unsupported file format: {extension}")
             
             logger.info(f"Successfully read resume: {self.file_path.name}")
-            return self.raw_text
         except Exception as e:
             logger.error(f"Error reading resume file: {e}")
             raise
 
+    def _load_entry(self, entry: Dict) -> str:
+        self.raw_text = entry["raw_text"]
+        self.parsed_data = dict(entry["parsed_data"])
+        return self.raw_text
+
+    def _read_disk_cache(self, digest: str) -> Optional[Dict]:
+        path = CACHE_DIR / f"{digest}.json"
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            logger.info(f"Resume loaded from parse cache: {self.file_path.name}")
+            return entry
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable resume cache {path}: {e}")
+            return None
+
+    def _write_disk_cache(self, entry: Dict):
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(CACHE_DIR / f"{entry['sha256']}.json", "w", encoding="utf-8") as f:
+                json.dump({k: entry[k] for k in ("sha256", "raw_text", "parsed_data")}, f, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f"Could not persist resume cache: {e}")
+
     def extract_contact_info(self):
         """Extracts email and phone number using regex."""
         # Email regex
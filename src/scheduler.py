@@ -12,7 +12,7 @@ import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import load_config
-from src.resume_parser import ResumeParser
+from src.resume_parser import load_resume
 from src.job_searcher import JobSearcher
 from src.linkedin_manager import LinkedInManager
 from src.auth import Authenticator
@@ -42,8 +42,7 @@ def run_daily_automation():
         
         # 1. Daily Post with varied content
         logger.info("📝 Generating daily post...")
-        parser = ResumeParser(config.resume.file_path)
-        resume_data = parser.parse()
+        resume_data = load_resume(config.resume.file_path)
         
         post_content = content_gen.generate_varied_post(resume_data['raw_text'])
         if post_content:
@@ -1,15 +1,33 @@
 import csv
+import os
 import logging
+import threading
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
+from src.job_ids import job_key
 
 logger = logging.getLogger(__name__)
 
 class Storage:
+    """
+    Application log backed by an append-only CSV file.
+
+    The CSV stays the source of truth (the dashboard reads it directly), but lookups
+    are served from an in-memory index built once at startup and updated on every
+    append, so dedup checks and daily counts no longer re-scan the whole file.
+    Jobs are indexed by their canonical key (LinkedIn job ID when available), so the
+    same posting reached through different searches is recognised as one.
+    """
+
     def __init__(self, file_path: str = "data/applied_jobs.csv"):
         self.file_path = Path(file_path)
+        self._lock = threading.Lock()
+        self._keys = set()
+        self._daily_applied = Counter()
         self.ensure_file_exists()
+        self._load_index()
 
     def ensure_file_exists(self):
         """Creates the CSV file with headers if it doesn't exist."""
@@ -20,33 +38,53 @@ class Storage:
                 writer.writerow(["date", "platform", "title", "company", "location", "link", "status"])
             logger.info(f"Created new storage file at {self.file_path}")
 
-    def is_already_applied(self, link: str) -> bool:
-        """Checks if a job link exists in the database."""
+    def _load_index(self):
+        """Imports the existing CSV into the in-memory index (one pass per process)."""
+        rows = 0
         try:
             with open(self.file_path, mode='r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
-                    if row["link"] == link:
-                        return True
-            return False
+                    self._index_row(row.get("date") or "", row.get("link") or "", row.get("status") or "")
+                    rows += 1
+            logger.info(f"Storage index loaded: {rows} records, {len(self._keys)} unique jobs.")
         except Exception as e:
             logger.error(f"Error reading storage: {e}")
-            return False
+
+    def _index_row(self, date: str, link: str, status: str, job_id: Optional[str] = None):
+        key = job_key(link, job_id)
+        if key:
+            self._keys.add(key)
+        if "APPLIED" in status:
+            self._daily_applied[date[:10]] += 1
+
+    def is_already_applied(self, link: str, job_id: Optional[str] = None) -> bool:
+        """Checks if a job (by link or LinkedIn job ID) exists in the database."""
+        key = job_key(link, job_id)
+        with self._lock:
+            return bool(key) and key in self._keys
 
     def add_application(self, job_data: Dict, status: str = "APPLIED"):
         """Adds a new application record."""
+        date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        link = job_data.get("link", "")
         try:
-            with open(self.file_path, mode='a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    job_data.get("platform", "Unknown"),
-                    job_data.get("title", "Unknown"),
-                    job_data.get("company", "Unknown"),
-                    job_data.get("location", "Unknown"),
-                    job_data.get("link", ""),
-                    status
-                ])
+            with self._lock:
+                with open(self.file_path, mode='a', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow([
+                        date,
+                        job_data.get("platform", "Unknown"),
+                        job_data.get("title", "Unknown"),
+                        job_data.get("company", "Unknown"),
+                        job_data.get("location", "Unknown"),
+                        link,
+                        status
+                    ])
+                    # Make the append durable before the index says it happened
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._index_row(date, link, status, job_data.get("job_id"))
             logger.info(f"Recorded application for {job_data.get('title')}")
         except Exception as e:
             logger.error(f"Error writing to storage: {e}")
@@ -54,17 +92,8 @@ class Storage:
     def get_today_count(self) -> int:
         """Returns the number of applications recorded today."""
         today = datetime.now().strftime("%Y-%m-%d")
-        count = 0
-        try:
-            with open(self.file_path, mode='r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row["date"].startswith(today) and "APPLIED" in row["status"]:
-                        count += 1
-            return count
-        except Exception as e:
-            logger.error(f"Error counting today's applications: {e}")
-            return 0
+        with self._lock:
+            return self._daily_applied[today]
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 import os
-import time
 import logging
 import psutil
 from datetime import datetime
 from src.config import load_config
 from src.notifications import TelegramNotifier
+from src.job_scheduler import get_scheduler, IntervalTrigger
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -38,16 +38,15 @@ class SystemMonitor:
         if cpu > 90 or ram > 90:
             self.notifier.send_message(f"⚠️ SYSTEM RESOURCE WARNING:\nCPU: {cpu}%\nRAM: {ram}%")
 
+    def run_checks(self):
+        self.check_logs()
+        self.check_resources()
+
     def run(self):
         logger.info("🛡️ ClawdBot System Monitor Active")
-        while True:
-            try:
-                self.check_logs()
-                self.check_resources()
-                time.sleep(60) # Check every minute
-            except Exception as e:
-                logger.error(f"Monitor error: {e}")
-                time.sleep(300)
+        scheduler = get_scheduler(self.config.scheduler.path)
+        scheduler.add_job("system_monitor", self.run_checks, IntervalTrigger(self.config.scheduler.monitor_interval_seconds), run_first=True)
+        scheduler.run_forever()
 
 if __name__ == "__main__":
     monitor = SystemMonitor()
@@ -1,16 +1,17 @@
 import logging
 import threading
 import time
-import urllib.request
-import urllib.parse
 import json
 from typing import Optional
 from src.config import Settings
-from src.ai_assistant import AIAssistant
+from src.http_client import get_session
+from src.ai_assistant import get_ai_assistant
+from src.llm_dispatch import llm_priority, CHAT
+from src.telegram_stream import StreamingReply
+from src.conversation import get_conversation_store
 from src.desktop_automation import DesktopAgent
 from src.entrepreneur import EntrepreneurAgent
 import os
-import requests
 from src.voice_engine import VoiceEngine
 from src.memory_engine import MemoryEngine
 from src.room_controller import RoomController
@@ -49,13 +50,13 @@ class TelegramBot:
             self.token = config.secrets.telegram.get("bot_token", "")
             self.allowed_chat_id = str(config.secrets.telegram.get("chat_id", ""))
 
-        self.ai = AIAssistant(config)
+        self.ai = get_ai_assistant(config)
         self.desktop_agent = desktop_agent or DesktopAgent(config)
         self.entrepreneur = self._safe_init(lambda: EntrepreneurAgent(config), "EntrepreneurAgent")
         self.running = False
         self.last_update_id = 0
         self.thread = None
-        self.chat_history = [] # Memory buffer
+        self.conversations = get_conversation_store(config) # per-chat window + rolling summary, persisted
 
     def _safe_init(self, factory_func, name):
         try:
@@ -92,7 +93,9 @@ class TelegramBot:
                 
                 for update in updates:
                     self.last_update_id = update.get("update_id", 0)
-                    self._process_update(update)
+                    # Anything the user triggers jumps ahead of scoring/content/background AI calls
+                    with llm_priority(CHAT):
+                        self._process_update(update)
                     
             except Exception as e:
                 logger.error(f"Telegram polling error: {e}")
@@ -104,17 +107,15 @@ class TelegramBot:
             "offset": offset,
             "timeout": timeout
         }
-        encoded_params = urllib.parse.urlencode(params)
-        full_url = f"{url}?{encoded_params}"
-
-        req = urllib.request.Request(full_url)
-        with urllib.request.urlopen(req) as response:
-            result = json.loads(response.read().decode("utf-8"))
-            if result.get("ok"):
-                return result.get("result", [])
-            else:
-                logger.error(f"Telegram API getUpdates failed: {result}")
-                return []
+
+        # Read timeout must outlast the long-poll window
+        response = get_session().get(url, params=params, timeout=(5, timeout + 10))
+        result = response.json()
+        if result.get("ok"):
+            return result.get("result", [])
+        else:
+            logger.error(f"Telegram API getUpdates failed: {result}")
+            return []
 
     def _process_update(self, update: dict):
         message = update.get("message")
@@ -147,7 +148,7 @@ class TelegramBot:
         try:
             # 1. Get File Path
             url = f"https://api.telegram.org/bot{self.token}/getFile?file_id={file_id}"
-            path_res = requests.get(url).json()
+            path_res = get_session().get(url).json()
             if not path_res.get("ok"):
                 self.send_message(chat_id, "❌ Falha ao obter arquivo de áudio.")
                 return
@@ -156,7 +157,7 @@ class TelegramBot:
             download_url = f"https://api.telegram.org/file/bot{self.token}/{file_path}"
             
             # 2. Download
-            audio_data = requests.get(download_url).content
+            audio_data = get_session().get(download_url, timeout=(5, 60)).content
             temp_path = os.path.join(os.getcwd(), "data", "temp_voice.ogg")
             with open(temp_path, "wb") as f:
                 f.write(audio_data)
@@ -187,6 +188,28 @@ class TelegramBot:
         elif command == "/ping":
             response = "Pong! 🏓"
 
+        elif command == "/jobs":
+            from src.job_scheduler import get_scheduler
+            jobs = get_scheduler(self.config.scheduler.path).summary()
+            if not jobs:
+                response = "⏱️ Nenhum job agendado neste processo."
+            else:
+                lines = ["⏱️ **Jobs agendados:**"]
+                for job in jobs:
+                    state = "▶️ rodando" if job["running"] else f"próximo {job['next_run']:%d/%m %H:%M}"
+                    lines.append(f"• `{job['name']}` ({job['trigger']}) - {state} - último: {job['last_status'] or '-'}")
+                response = "\n".join(lines)
+
+        elif command == "/run":
+            from src.job_scheduler import get_scheduler
+            parts = text.split()
+            if len(parts) < 2:
+                response = "⚠️ Uso: `/run <job>` (veja `/jobs`)"
+            elif get_scheduler(self.config.scheduler.path).run_now(parts[1]):
+                response = f"⏩ Job `{parts[1]}` antecipado. Ele roda assim que o agendador estiver livre."
+            else:
+                response = f"⚠️ Job `{parts[1]}` não encontrado. Veja `/jobs`."
+
         elif command == "/speak":
             msg = text.replace("/speak", "", 1).strip()
             if not msg:
@@ -483,12 +506,9 @@ class TelegramBot:
             "Answer with depth and precision. You are not a generic assistant; you are a Partner."
         )
         
-        # Update history with user message
-        self.chat_history.append({"role": "user", "content": text})
-        
-        # Keep buffer small (last 10 interactions = 20 messages)
-        if len(self.chat_history) > 20:
-            self.chat_history = self.chat_history[-20:]
+        # Update history with user message (sent back as a token-bounded window + summary)
+        self.conversations.add(chat_id, "user", text)
+        history = self.conversations.window(chat_id)
 
         # RECALL MEMORY (RAG)
         if self.memory:
@@ -499,9 +519,20 @@ class TelegramBot:
 
         # ENABLE PERSONA
         # ai_response = self.ai.ask_gpt(system_prompt, text, incorporate_persona=True)
-        ai_response = self.ai.ask_gpt_with_history(system_prompt, self.chat_history, incorporate_persona=True)
+        streamed = False
+        if self.config.notifications.telegram.stream_replies:
+            # The reply appears after the first tokens and grows in place instead of after the full completion
+            telegram = self.config.notifications.telegram
+            reply = StreamingReply(self.token, chat_id, telegram.stream_edit_interval_seconds, telegram.stream_first_chars)
+            ai_response = reply.render(self.ai.stream_gpt_with_history(system_prompt, history, incorporate_persona=True, priority=CHAT))
+            streamed = bool(ai_response)
+        else:
+            ai_response = self.ai.ask_gpt_with_history(system_prompt, history, incorporate_persona=True, priority=CHAT)
         
-        if not ai_response:
+        if ai_response:
+            # Update history with assistant response (may fold older turns into the summary)
+            self.conversations.add(chat_id, "assistant", ai_response)
+        else:
             ai_response = "Desculpe, estou reorganizando meus pensamentos. Pode repetir?"
         
         # Store interactions in Eternal Memory
@@ -509,38 +540,33 @@ class TelegramBot:
             self.memory.store_interaction("user", text)
             self.memory.store_interaction("assistant", ai_response)
 
-        # Update history with assistant response
-        self.chat_history.append({"role": "assistant", "content": ai_response})
-        
-        self.send_message(chat_id, ai_response)
+        if not streamed:
+            self.send_message(chat_id, ai_response)
 
     def send_message(self, chat_id: str, text: str):
         url = f"https://api.telegram.org/bot{self.token}/sendMessage"
-        data = urllib.parse.urlencode({
+        data = {
             "chat_id": chat_id,
             "text": text,
             "parse_mode": "Markdown"
-        }).encode("utf-8")
+        }
 
         try:
-            req = urllib.request.Request(url, data=data)
-            with urllib.request.urlopen(req) as response:
-                pass # Fire and forget
+            response = get_session().post(url, data=data)
+            response.raise_for_status()
         except Exception as e:
             logger.error(f"Failed to send Telegram reply: {e}")
 
     def _send_chat_action(self, chat_id: str, action: str):
         """Sends a chat action like 'typing'."""
         url = f"https://api.telegram.org/bot{self.token}/sendChatAction"
-        data = urllib.parse.urlencode({
+        data = {
             "chat_id": chat_id,
             "action": action
-        }).encode("utf-8")
+        }
 
         try:
-            req = urllib.request.Request(url, data=data)
-            with urllib.request.urlopen(req) as response:
-                pass
+            get_session().post(url, data=data, timeout=(5, 10))
         except Exception:
             pass # Ignore errors for chat actions
 
@@ -566,7 +592,7 @@ class TelegramBot:
             files = {"photo": f}
             data = {"chat_id": self.allowed_chat_id, "caption": caption}
             try:
-                requests.post(url, files=files, data=data)
+                get_session().post(url, files=files, data=data, timeout=(5, 60))
             except Exception as e:
                 logger.error(f"Failed to send photo: {e}")
 
@@ -576,6 +602,6 @@ class TelegramBot:
             files = {"voice": f}
             data = {"chat_id": chat_id}
             try:
-                requests.post(url, files=files, data=data)
+                get_session().post(url, files=files, data=data, timeout=(5, 60))
             except Exception as e:
                 logger.error(f"Failed to send voice: {e}")
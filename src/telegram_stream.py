@@ -0,0 +1,99 @@
+import time
+import logging
+from typing import Iterable, Optional
+
+from src.http_client import get_session
+
+logger = logging.getLogger(__name__)
+
+# Telegram rejects messages longer than this
+MAX_MESSAGE_CHARS = 4096
+
+
+class StreamingReply:
+    """
+    Renders a streamed AI reply into a Telegram chat.
+
+    The first message is sent as soon as first_chars characters have arrived; after that
+    the same message is updated with editMessageText at most once per edit_interval
+    seconds. Partial text is sent without parse_mode (half-written Markdown fails to
+    parse); finish() applies Markdown once the reply is complete, falling back to plain
+    text. Replies longer than one message continue in a new message.
+    """
+
+    def __init__(self, token: str, chat_id: str, edit_interval: float = 1.2, first_chars: int = 20):
+        self.api = f"https://api.telegram.org/bot{token}"
+        self.chat_id = chat_id
+        self.edit_interval = edit_interval
+        self.first_chars = first_chars
+        self.text = ""
+        self._offset = 0 # start of the text shown in the current message
+        self._message_id: Optional[int] = None
+        self._shown = ""
+        self._last_edit = 0.0
+
+    def render(self, deltas: Iterable[str]) -> str:
+        """Consumes a delta stream, keeping the chat message current, and returns the full text."""
+        for delta in deltas:
+            self.feed(delta)
+        return self.finish()
+
+    def feed(self, delta: str):
+        self.text += delta
+        self._split_overflow()
+        current = self.text[self._offset:]
+        if self._message_id is None:
+            if len(current.strip()) >= self.first_chars:
+                self._show(current)
+        elif time.monotonic() - self._last_edit >= self.edit_interval:
+            self._show(current)
+
+    def finish(self) -> str:
+        """Final render with Markdown; returns the whole reply (empty when nothing streamed)."""
+        current = self.text[self._offset:]
+        if current.strip():
+            if not self._show(current, markdown=True):
+                self._show(current)
+        return self.text.strip()
+
+    def _split_overflow(self):
+        # Closes the current message at a line/word boundary once it would exceed Telegram's limit
+        while len(self.text) - self._offset > MAX_MESSAGE_CHARS:
+            window = self.text[self._offset:self._offset + MAX_MESSAGE_CHARS]
+            cut = max(window.rfind("\n"), window.rfind(" "))
+            cut = cut if cut > MAX_MESSAGE_CHARS // 2 else MAX_MESSAGE_CHARS
+            part = window[:cut]
+            if not self._show(part, markdown=True):
+                self._show(part)
+            self._offset += cut
+            self._message_id = None
+            self._shown = ""
+
+    def _show(self, text: str, markdown: bool = False) -> bool:
+        if text == self._shown and not markdown:
+            return True
+        data = {"chat_id": self.chat_id, "text": text}
+        if markdown:
+            data["parse_mode"] = "Markdown"
+        if self._message_id is None:
+            method = "sendMessage"
+        else:
+            method = "editMessageText"
+            data["message_id"] = self._message_id
+        try:
+            response = get_session().post(f"{self.api}/{method}", data=data, timeout=(5, 10))
+            result = response.json()
+        except Exception as e:
+            logger.warning(f"Telegram {method} failed while streaming: {e}")
+            return False
+        self._last_edit = time.monotonic()
+        if not result.get("ok"):
+            # "message is not modified" means Telegram already shows exactly this text
+            if "not modified" in str(result.get("description", "")):
+                return True
+            logger.debug(f"Telegram {method} rejected streamed text: {result.get('description')}")
+            return False
+        if self._message_id is None:
+            self._message_id = result["result"]["message_id"]
+        self._shown = text
+        return True
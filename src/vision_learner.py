@@ -5,9 +5,8 @@ import glob
 import json
 import yt_dlp
 import cv2
-import openai
 from src.config import Settings
-from src.ai_assistant import AIAssistant
+from src.ai_assistant import get_ai_assistant
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +17,7 @@ class VisionLearner:
     """
     def __init__(self, config: Settings):
         self.config = config
-        self.ai = AIAssistant(config)
+        self.ai = get_ai_assistant(config)
         self.data_dir = os.path.join(os.getcwd(), "data", "vision_cache")
         os.makedirs(self.data_dir, exist_ok=True)
 
@@ -100,10 +99,6 @@ class VisionLearner:
         if not frame_paths: return "Nenhum frame extraído."
         
         # Prepare inputs (simplified for now, ideally base64 encoded)
-        # Note: AIAssistant needs an update to handle images list
-        # We will do a direct call here or update AIAssistant later.
-        # Direct call for now to keep it self-contained in this module
-        
         import base64
         
         messages = [
@@ -124,13 +119,7 @@ class VisionLearner:
                 })
 
         try:
-             client = openai.OpenAI(api_key=self.config.secrets.openai.get("api_key"))
-             response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=messages,
-                max_tokens=500
-            )
-             return response.choices[0].message.content
+            return self.ai.complete(messages, model="gpt-4o", max_tokens=500)
         except Exception as e:
             return f"Erro na IA Visual: {e}"
 
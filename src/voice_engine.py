@@ -1,7 +1,7 @@
 import os
 import logging
 from gtts import gTTS
-from src.ai_assistant import AIAssistant
+from src.ai_assistant import get_ai_assistant
 from src.config import Settings
 import tempfile
 
@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 class VoiceEngine:
     def __init__(self, config: Settings):
         self.config = config
-        self.ai = AIAssistant(config) # Re-use AI for config access, though Whisper usage is direct via client if using new lib, or API otherwise.
+        self.ai = get_ai_assistant(config) # Re-use AI for config access, though Whisper usage is direct via client if using new lib, or API otherwise.
         # Ideally, we should use the OpenAI client from ai_assistant if it exposes it, 
         # but AIAssistant uses raw requests. We can add a transcribe method there or here.
         self.output_dir = os.path.join(os.getcwd(), "data", "voice_cache")